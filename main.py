@@ -7,11 +7,25 @@ Usage:
     
 Or interactive:
     python main.py
+
+Parallel runs (jobs.jsonl, 실행별 output/runs/<run_id>):
+    python main.py --parallel jobs.jsonl --workers 4
+
+Service mode (UI 백엔드 + 작업 큐):
+    python main.py serve --port 8765
+
+Render mode (저장된 산출물로 리포트 재생성, LLM 없음):
+    python main.py render output/runs --format md,html,json --workers 4
+
+무거운 의존성(rich, requests, yaml)과 Agent 모듈은 해당 명령/스테이지가 실행될 때
+로드한다. --help 나 인자 오류로 끝나는 호출은 argparse 만으로 처리된다
+(기동 시간 예산: python -m src.benchmarks.startup).
 """
 import argparse
 import json
 import sys
 import io
+from contextlib import ExitStack
 from pathlib import Path
 
 # Windows 콘솔 UTF-8 설정
@@ -19,28 +33,21 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
+from src.config import load_config, print_config, apply_preset, Config
+from src.pipeline import build_stages, parse_competitors, StageRunner, MANIFEST_FILE, STAGE_ORDER
+from src.tracing import tracer, profile_run
+from src.workspace import RUNS_DIR, scoped_config
 
-from src.config import load_config, print_config, Config
-from src.agents import ReviewMiner, ReviewTagger, PersonaSynthesizer, ReportEditor
+_console = None
 
-console = Console(force_terminal=True, legacy_windows=False)
 
-
-def parse_competitors(comp_str: str) -> list[dict]:
-    """'Game1:appid1,Game2:appid2' 형식 파싱"""
-    competitors = []
-    for item in comp_str.split(","):
-        item = item.strip()
-        if ":" in item:
-            name, appid = item.rsplit(":", 1)
-            competitors.append({"name": name.strip(), "appid": appid.strip()})
-        else:
-            # appid만 있는 경우
-            competitors.append({"name": item, "appid": item})
-    return competitors
+def get_console():
+    """rich 콘솔 (첫 출력 시 로드)"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console(force_terminal=True, legacy_windows=False)
+    return _console
 
 
 def run_pipeline(
@@ -49,36 +56,28 @@ def run_pipeline(
     genre: str,
     competitors: list[dict],
     llm_client=None,
+    force_stages: list[str] = None,
+    from_stage: str = None,
 ):
-    """전체 파이프라인 실행"""
-    
-    console.print(Panel(f"[bold cyan]🚀 Vibe Validation 시작[/]\n프리셋: {config.preset.upper()}"))
+    """전체 파이프라인 실행 (입력이 바뀌지 않은 스테이지는 건너뜀)"""
+    from rich.panel import Panel
     
-    # Agent A: 리뷰 수집
-    console.print("\n[bold]━━━ Agent A: Review Miner ━━━[/]")
-    miner = ReviewMiner(config)
-    raw_path = miner.collect(competitors)
+    get_console().print(Panel(f"[bold cyan]🚀 Vibe Validation 시작[/]\n프리셋: {config.preset.upper()}"))
     
-    # Agent B: 태깅
-    console.print("\n[bold]━━━ Agent B: Review Tagger ━━━[/]")
-    tagger = ReviewTagger(config, llm_client)
-    tagged_path = tagger.tag_reviews(raw_path)
-    
-    # Agent C+D: 페르소나 합성 + 검증
-    console.print("\n[bold]━━━ Agent C+D: Persona Synthesizer ━━━[/]")
-    synthesizer = PersonaSynthesizer(config, llm_client)
-    result = synthesizer.synthesize(tagged_path, idea, genre)
-    
-    # 통계 로드 (리포트용)
-    stats = synthesizer._compute_stats(tagged_path)
-    
-    # Agent E: 리포트 생성
-    console.print("\n[bold]━━━ Agent E: Report Editor ━━━[/]")
-    editor = ReportEditor(config)
-    report_path = editor.generate(result, idea, genre, competitors, stats)
+    # Miner → Tagger → Synthesizer → Editor
+    refresh_corpus = "mine" in (force_stages or []) or from_stage == "mine"
+    stages = build_stages(config, idea, genre, competitors, llm_client, refresh_corpus=refresh_corpus)
+    runner = StageRunner(
+        config.output_dir / MANIFEST_FILE,
+        force_stages=force_stages,
+        from_stage=from_stage,
+        announce=lambda stage: get_console().print(f"\n[bold]━━━ {stage.title} ━━━[/]"),
+    )
+    results = runner.run(stages)
+    report_path = results["report"]
     
     # 완료
-    console.print(Panel(
+    get_console().print(Panel(
         f"[bold green]✅ 완료![/]\n\n"
         f"📁 출력 파일:\n"
         f"  - {config.output_dir / config.raw_reviews_file}\n"
@@ -91,9 +90,126 @@ def run_pipeline(
     return report_path
 
 
-def interactive_mode(config: Config):
+def print_trace_summary(trace_path: Path) -> None:
+    """스팬 요약 테이블 + 카운터 출력"""
+    from rich.table import Table
+
+    table = Table(title="⏱️ Trace Summary")
+    table.add_column("span")
+    table.add_column("count", justify="right")
+    table.add_column("total ms", justify="right")
+    table.add_column("mean ms", justify="right")
+    table.add_column("max ms", justify="right")
+    for row in tracer.summary():
+        table.add_row(
+            row["name"], str(row["count"]),
+            f"{row['total_ms']:.1f}", f"{row['mean_ms']:.1f}", f"{row['max_ms']:.1f}",
+        )
+    get_console().print(table)
+    
+    counters = ", ".join(f"{k}={v:g}" for k, v in sorted(tracer.counters.items()))
+    get_console().print(f"[dim]counters: {counters or '-'}[/]")
+    get_console().print(f"[dim]trace: {trace_path}[/]")
+
+
+def print_llm_usage(llm_client) -> None:
+    """모델별 LLM 사용량 + 지연 분위 테이블"""
+    from rich.table import Table
+
+    usage = llm_client.usage()
+    if not usage:
+        return
+    table = Table(title=f"🤖 LLM 사용량 ({llm_client.provider})")
+    for col in ("model", "calls", "prompt", "completion", "retries", "errors", "rate wait s", "p50 s", "p95 s", "p99 s"):
+        table.add_column(col, justify="left" if col == "model" else "right")
+    for model, row in sorted(usage.items()):
+        latency = row.get("latency") or {"p50": 0, "p95": 0, "p99": 0}
+        table.add_row(
+            model, str(row["calls"]), str(row["prompt_tokens"]), str(row["completion_tokens"]),
+            str(row["retries"]), str(row["errors"]), f"{row['wait_s']:.1f}",
+            f"{latency['p50']:.2f}", f"{latency['p95']:.2f}", f"{latency['p99']:.2f}",
+        )
+    get_console().print(table)
+    
+    hedge = llm_client.hedge_stats()
+    if hedge["hedges"]:
+        get_console().print(f"[dim]hedge: {hedge['hedges']}/{hedge['calls']} 요청 중복 전송[/]")
+
+
+def run_shard_command(config: Config, args) -> None:
+    """분산 수집 서브커맨드"""
+    from rich.table import Table
+    from src import sharding
+    
+    shard_dir = Path(args.shard_dir)
+    if args.action in ("init", "run"):
+        if not args.shard_competitors:
+            get_console().print("[red]--competitors 가 필요합니다[/]")
+            sys.exit(2)
+        competitors = parse_competitors(args.shard_competitors)
+        if args.action == "init":
+            sharding.init_queue(config, shard_dir, competitors)
+        else:
+            sharding.run_local(config, shard_dir, competitors, workers=args.local_workers)
+    elif args.action == "worker":
+        sharding.run_worker(config, shard_dir, worker_id=args.worker_id, lease_seconds=args.lease)
+    elif args.action == "merge":
+        sharding.merge_shards(config, shard_dir)
+    elif args.action == "retry":
+        get_console().print(f"🔁 재시도 등록: {sharding.WorkQueue(shard_dir).retry_failed()}개")
+    else:
+        queue = sharding.WorkQueue(shard_dir)
+        table = Table(title=f"작업 큐 {queue.status()}")
+        for col in ("appid", "name", "status", "worker", "attempts", "reviews", "error"):
+            table.add_column(col)
+        for item in queue.items():
+            table.add_row(
+                item["appid"], item["name"], item["status"], item["worker"] or "-",
+                str(item["attempts"]), str(item["review_count"] or "-"), item["error"] or "",
+            )
+        get_console().print(table)
+
+
+def run_render_command(config: Config, args) -> None:
+    """리포트 재렌더링 서브커맨드"""
+    from rich.table import Table
+    from src.render import FORMATS, find_runs, render_runs, write_index
+    
+    formats = tuple(f.strip() for f in args.format.split(",") if f.strip())
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown or not formats:
+        get_console().print(f"[red]지원하지 않는 형식: {', '.join(unknown) or '-'} (가능: {', '.join(FORMATS)})[/]")
+        sys.exit(2)
+    
+    run_dirs = find_runs(config, args.paths)
+    if not run_dirs:
+        get_console().print("[yellow]렌더링할 실행이 없습니다 (personas.json 이 있는 디렉터리)[/]")
+        return
+    
+    get_console().print(f"[bold]🖨️ 리포트 렌더링: {len(run_dirs)}개 실행 / {', '.join(formats)}[/]")
+    with tracer.span("render.runs", runs=len(run_dirs), formats=",".join(formats)):
+        results = render_runs(config, run_dirs, formats, workers=args.render_workers)
+    
+    table = Table(title="렌더링 결과")
+    for col in ("run_id", "status", "decision", "idea"):
+        table.add_column(col)
+    for r in results:
+        table.add_row(r["run_id"], r["status"], r.get("decision", "-"), r.get("idea", r.get("error", ""))[:40])
+    get_console().print(table)
+    
+    if not args.no_index:
+        index_dir = Path(args.index_dir) if args.index_dir else config.shared_root() / RUNS_DIR
+        get_console().print(f"📇 인덱스: {write_index(index_dir, results)}")
+    if any(r["status"] != "done" for r in results):
+        sys.exit(1)
+
+
+def interactive_mode(config: Config, llm_client=None):
     """대화형 모드"""
-    console.print(Panel("[bold]🎮 Vibe Ideation Validator[/]\n대화형 모드", style="cyan"))
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    get_console().print(Panel("[bold]🎮 Vibe Ideation Validator[/]\n대화형 모드", style="cyan"))
     
     # 입력 받기
     idea = Prompt.ask("\n[bold]아이디어[/] (여러 줄은 \\n으로)")
@@ -105,46 +221,146 @@ def interactive_mode(config: Config):
     
     competitors = parse_competitors(comp_str)
     
-    console.print(f"\n[dim]경쟁작: {competitors}[/]")
+    get_console().print(f"\n[dim]경쟁작: {competitors}[/]")
     
     if Prompt.ask("\n진행할까요?", choices=["y", "n"], default="y") == "y":
-        run_pipeline(config, idea, genre, competitors)
+        run_pipeline(config, idea, genre, competitors, llm_client)
     else:
-        console.print("[yellow]취소됨[/]")
+        get_console().print("[yellow]취소됨[/]")
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Vibe Ideation Validator")
     parser.add_argument("--config", default="config.yaml", help="설정 파일 경로")
     parser.add_argument("--idea", help="검증할 아이디어")
     parser.add_argument("--genre", help="장르")
     parser.add_argument("--competitors", help="경쟁작 (Game1:appid1,Game2:appid2)")
     parser.add_argument("--preset", choices=["free", "standard", "detailed"], help="프리셋 오버라이드")
+    parser.add_argument("--force-stage", action="append", choices=STAGE_ORDER, default=[],
+                        help="최신 상태여도 다시 실행할 스테이지 (반복 가능)")
+    parser.add_argument("--from-stage", choices=STAGE_ORDER, help="이 스테이지부터 끝까지 다시 실행")
+    parser.add_argument("--trace", action="store_true", help="Chrome trace(trace.json) + 요약 테이블 출력")
+    parser.add_argument("--profile", action="store_true", help="cProfile/tracemalloc 프로파일 저장")
+    parser.add_argument("--run-id", help="실행 전용 디렉터리(output/runs/<id>)에서 실행 (같은 ID 재사용 시 이어서 실행)")
+    parser.add_argument("--parallel", metavar="JOBS_JSONL", help="jobs.jsonl 의 여러 실행을 프로세스 풀로 병렬 실행")
+    parser.add_argument("--workers", dest="parallel_workers", type=int, default=4, help="--parallel 프로세스 수")
+    parser.add_argument("--llm", choices=["auto", "openai", "anthropic", "gemini", "stub", "none"],
+                        help="LLM 프로바이더 오버라이드 (stub = 네트워크 없는 로컬 테스트)")
+    parser.add_argument("--deadline", type=float, metavar="SECONDS",
+                        help="마감 모드: 이 시간 안에 우선순위 높은 리뷰부터 분석해 부분 결과로 리포트 생성")
+    parser.add_argument("--hedge", action="store_true", help="느린 태깅 요청(p95 초과)에 중복 요청 (꼬리 지연 단축)")
+    parser.add_argument("--offline-workers", type=int, help="LLM 없는 태깅/통계 프로세스 수 (대용량 백필)")
+    
+    subparsers = parser.add_subparsers(dest="command")
+    serve_parser = subparsers.add_parser("serve", help="로컬 검증 서비스 실행 (작업 큐 + UI 백엔드)")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    serve_parser.add_argument("--port", type=int, default=8765, help="포트")
+    serve_parser.add_argument("--workers", dest="serve_workers", type=int, default=2, help="동시 실행 작업 수")
+    serve_parser.add_argument("--allow-origin", action="append", default=[], dest="allow_origins",
+                              help="서비스 밖에서 연 UI 의 origin 허용 (반복 가능, file:// 은 null)")
+    
+    shard_parser = subparsers.add_parser("shard", help="분산 수집 (작업 큐 / 워커 / 병합)")
+    shard_parser.add_argument("action", choices=["init", "worker", "merge", "status", "retry", "run"])
+    shard_parser.add_argument("--shard-dir", required=True, help="공유 디렉터리 (큐 + shard)")
+    shard_parser.add_argument("--competitors", dest="shard_competitors", help="init/run: 경쟁작 (Game1:appid1,...)")
+    shard_parser.add_argument("--worker-id", help="worker: 워커 ID (기본: 호스트명-pid)")
+    shard_parser.add_argument("--lease", type=float, default=120, help="worker: lease 시간 (초)")
+    shard_parser.add_argument("--local-workers", type=int, default=4, help="run: 로컬 워커 프로세스 수")
     
-    args = parser.parse_args()
+    render_parser = subparsers.add_parser("render", help="저장된 산출물로 리포트 재생성 (수집/태깅/LLM 없음)")
+    render_parser.add_argument("paths", nargs="*", help="실행 디렉터리 또는 그 상위 디렉터리 (기본: output/runs, output)")
+    render_parser.add_argument("--format", default="md", help="출력 형식 (md,html,json 쉼표 구분)")
+    render_parser.add_argument("--workers", dest="render_workers", type=int, default=4, help="병렬 렌더링 프로세스 수")
+    render_parser.add_argument("--index-dir", help="실행 간 인덱스 저장 위치 (기본: output/runs)")
+    render_parser.add_argument("--no-index", action="store_true", help="인덱스 생성 생략")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
     
     # 설정 로드
     config = load_config(args.config)
     
     # 프리셋 오버라이드
     if args.preset:
-        from src.config import PRESETS
-        preset = PRESETS[args.preset]
-        config.preset = args.preset
-        config.reviews_per_game = preset["reviews_per_game"]
-        config.tagging_model = preset["tagging_model"]
-        config.analysis_model = preset["analysis_model"]
-        config.merge_agents = preset["merge_agents"]
-        config.batch_size = preset["batch_size"]
+        apply_preset(config, args.preset)
+    
+    if args.offline_workers is not None:
+        config.offline_workers = args.offline_workers
+    
+    if args.llm:
+        config.llm_provider = args.llm
+    
+    if args.hedge:
+        config.llm_hedge = {**config.llm_hedge, "enabled": True}
+    
+    if args.deadline:
+        config.deadline_s = args.deadline
+    
+    if args.run_id:
+        config = scoped_config(config, args.run_id)
     
     print_config(config)
     
+    if args.parallel:
+        from rich.table import Table
+        from src.launcher import load_jobs, run_parallel
+
+        jobs = load_jobs(Path(args.parallel))
+        get_console().print(f"[bold]🚀 병렬 실행: {len(jobs)}개 작업 / {args.parallel_workers} 프로세스[/]")
+        results = run_parallel(config, jobs, workers=args.parallel_workers)
+        table = Table(title="병렬 실행 결과")
+        table.add_column("run_id")
+        table.add_column("status")
+        table.add_column("idea")
+        table.add_column("report / error")
+        for r in results:
+            table.add_row(r["run_id"], r["status"], r["idea"][:40], r.get("report") or r.get("error", ""))
+        get_console().print(table)
+        return
+    
+    if args.command == "shard":
+        run_shard_command(config, args)
+        return
+    
+    if args.command == "render":
+        run_render_command(config, args)
+        return
+    
+    from src.llm import build_client
+
+    llm_client = build_client(config)
+    
+    if args.command == "serve":
+        from src.service import serve
+        serve(config, host=args.host, port=args.port, workers=args.serve_workers, llm_client=llm_client,
+              allow_origins=args.allow_origins)
+        return
+    
+    # 트레이싱은 요청한 실행에서만 기록
+    tracer.enabled = args.trace or args.profile
+    
     # 실행 모드 결정
-    if args.idea and args.competitors:
-        competitors = parse_competitors(args.competitors)
-        run_pipeline(config, args.idea, args.genre or "unknown", competitors)
-    else:
-        interactive_mode(config)
+    with ExitStack() as stack:
+        if args.profile:
+            stack.enter_context(profile_run(config.output_dir))
+        
+        if args.idea and args.competitors:
+            competitors = parse_competitors(args.competitors)
+            run_pipeline(
+                config, args.idea, args.genre or "unknown", competitors, llm_client,
+                force_stages=args.force_stage, from_stage=args.from_stage,
+            )
+        else:
+            interactive_mode(config, llm_client)
+    
+    if llm_client:
+        print_llm_usage(llm_client)
+    
+    if args.trace or args.profile:
+        trace_path = tracer.export_chrome(config.output_dir / "trace.json")
+        print_trace_summary(trace_path)
 
 
 if __name__ == "__main__":
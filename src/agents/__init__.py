@@ -1,6 +1,19 @@
-from .miner import ReviewMiner
-from .tagger import ReviewTagger
-from .synthesizer import PersonaSynthesizer
-from .editor import ReportEditor
+"""Agent 패키지 - 각 Agent 모듈은 처음 사용할 때 로드 (CLI 기동 시간 단축)"""
+import importlib
+
+_AGENT_MODULES = {
+    "ReviewMiner": ".miner",
+    "ReviewTagger": ".tagger",
+    "PersonaSynthesizer": ".synthesizer",
+    "ReportEditor": ".editor",
+}
 
 __all__ = ["ReviewMiner", "ReviewTagger", "PersonaSynthesizer", "ReportEditor"]
+
+
+def __getattr__(name: str):
+    if name not in _AGENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_AGENT_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
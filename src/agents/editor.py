@@ -4,6 +4,8 @@ from pathlib import Path
 from datetime import datetime
 
 from ..config import Config
+from ..tracing import traced
+from ..workspace import atomic_write
 from .synthesizer import SynthesisResult
 
 
@@ -71,7 +73,12 @@ REPORT_TEMPLATE = """# Vibe Validation Report
 - 분석 리뷰 수: {total_reviews}개
 - 수집 게임: {games}
 - 긍정/부정 비율: {sentiment_ratio}
-"""
+{budget_section}"""
+
+
+def render_markdown(context: dict) -> str:
+    """build_context 결과 → Markdown 리포트"""
+    return REPORT_TEMPLATE.format_map(context)
 
 
 class ReportEditor:
@@ -80,6 +87,7 @@ class ReportEditor:
     def __init__(self, config: Config):
         self.config = config
     
+    @traced("editor.generate")
     def generate(
         self,
         synthesis_result: SynthesisResult,
@@ -87,12 +95,35 @@ class ReportEditor:
         genre: str,
         competitors: list[dict],
         stats: dict = None,
+        budget: dict = None,
     ) -> Path:
         """
         최종 리포트 생성
+        
+        budget 은 Budget.snapshot() (한도/사용량/품질 하향 결정)
         """
         print("📝 리포트 생성 중...")
+        report = render_markdown(self.build_context(synthesis_result, idea, genre, competitors, stats, budget))
         
+        # 저장
+        output_path = self.config.output_dir / self.config.report_file
+        with atomic_write(output_path) as f:
+            f.write(report)
+        
+        print(f"💾 저장: {output_path}")
+        return output_path
+    
+    def build_context(
+        self,
+        synthesis_result: SynthesisResult,
+        idea: str,
+        genre: str,
+        competitors: list[dict],
+        stats: dict = None,
+        budget: dict = None,
+        date: datetime = None,
+    ) -> dict:
+        """리포트 템플릿 필드 (Markdown/HTML/JSON 렌더링 공통)"""
         # 섹션 생성
         personas_section = self._format_personas(synthesis_result.personas)
         matrix_rows = self._format_matrix(synthesis_result.validations)
@@ -112,9 +143,8 @@ class ReportEditor:
             total_reviews = "N/A"
             sentiment_ratio = "N/A"
         
-        # 템플릿 채우기
-        report = REPORT_TEMPLATE.format(
-            date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        return dict(
+            date=(date or datetime.now()).strftime("%Y-%m-%d %H:%M"),
             preset=self.config.preset.upper(),
             idea_oneline=idea[:100] + ("..." if len(idea) > 100 else ""),
             top_personas=", ".join(synthesis_result.top_personas) or "N/A",
@@ -131,15 +161,42 @@ class ReportEditor:
             total_reviews=total_reviews,
             games=", ".join([c["name"] for c in competitors]),
             sentiment_ratio=sentiment_ratio,
+            budget_section=self._format_budget(budget) if budget else "",
         )
+    
+    def _format_budget(self, budget: dict) -> str:
+        """실행 예산 + 품질 하향 결정"""
+        labels = {"time_s": "시간 (초)", "llm_tokens": "LLM 토큰", "http_requests": "HTTP 요청"}
+        lines = [
+            "",
+            "## Appendix: 실행 예산",
+            "",
+            "| 항목 | 사용 | 한도 |",
+            "|------|------|------|",
+        ]
+        for key, label in labels.items():
+            limit = budget["limits"].get(key) or 0
+            lines.append(f"| {label} | {budget['used'].get(key, 0):,.0f} | {f'{limit:,.0f}' if limit else '무제한'} |")
         
-        # 저장
-        output_path = self.config.output_dir / self.config.report_file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report)
+        coverage = budget.get("coverage")
+        if coverage:
+            pct = coverage["tagged"] / coverage["total"] * 100 if coverage["total"] else 100
+            per_game = ", ".join(f"{game} {done}/{total}" for game, (done, total) in coverage["by_game"].items())
+            lines.append("")
+            lines.append(f"**커버리지**: {coverage['tagged']}/{coverage['total']}개 리뷰 태깅 ({pct:.0f}%) - {per_game}")
+            if coverage["tagged"] < coverage["total"]:
+                lines.append("")
+                lines.append("> 마감 모드 부분 분석: 정보량 높은 리뷰(긴 본문, 중/하드코어, 게임/감성 균형) 순으로 태깅된 결과입니다.")
         
-        print(f"💾 저장: {output_path}")
-        return output_path
+        lines.append("")
+        if budget["decisions"]:
+            lines.append("품질 하향 결정:")
+            for d in budget["decisions"]:
+                when = "이전 실행" if d.get("previous") else f"{d['at_s']}초"
+                lines.append(f"- **[{d['stage']}] {d['action']}** ({when}) - {d['reason']}")
+        else:
+            lines.append("품질 하향 없음 (모든 단계가 예산 내 완료)")
+        return "\n".join(lines) + "\n"
     
     def _format_personas(self, personas) -> str:
         """페르소나 섹션 포맷"""
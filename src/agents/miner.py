@@ -1,17 +1,33 @@
 """Agent A - Steam 리뷰 수집기"""
-import requests
 import json
+import random
+import sys
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Generator
 from dataclasses import dataclass, asdict
 
+from ..budget import current_budget, charge
 from ..config import Config
+from ..http_pool import get_session
+from ..singleflight import get_singleflight
+from ..blockstore import corpus_writer
+from ..workspace import atomic_write
+from ..tracing import tracer, traced
+
+
+TRUNCATED_MARK = "_truncated"  # single-flight 결과 파일의 중단 표시 줄
+
+
+class SteamAPIError(RuntimeError):
+    """Steam API 호출 실패 (재시도 후에도 실패)"""
 
 
 @dataclass
 class Review:
+    __slots__ = ("game", "appid", "review_id", "language", "sentiment", "text", "playtime_hours", "timestamp")
+
     game: str
     appid: str
     review_id: str
@@ -26,12 +42,20 @@ class ReviewMiner:
     """Steam 리뷰 수집 Agent"""
     
     BASE_URL = "https://store.steampowered.com/appreviews/{appid}"
+    MAX_RETRIES = 4  # 429/5xx/네트워크 오류 재시도 횟수
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 30.0
     
     def __init__(self, config: Config):
         self.config = config
         self.output_dir = config.output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.flight = get_singleflight(config.shared_root() / ".singleflight")
+        self.base_url = config.steam_base_url or self.BASE_URL
+        self.errors: list[str] = []  # collect() 중 실패한 게임 (부분 수집)
+        self.truncated = False  # 예산 소진으로 페이징 중단
     
+    @traced("miner.collect")
     def collect(self, competitors: list[dict]) -> Path:
         """
         경쟁작들의 리뷰 수집
@@ -43,27 +67,53 @@ class ReviewMiner:
             저장된 파일 경로
         """
         output_path = self.output_dir / self.config.raw_reviews_file
+        self.errors = []
+        self.truncated = False
         
-        with open(output_path, "w", encoding="utf-8") as f:
+        with corpus_writer(output_path, self.config.storage_codec, self.config.storage_block_records) as f:
             for comp in competitors:
-                print(f"📥 수집 중: {comp['name']} ({comp['appid']})")
-                
-                reviews = self._fetch_reviews(
-                    appid=comp["appid"],
-                    game_name=comp["name"],
-                    limit=self.config.reviews_per_game,
-                )
-                
-                count = 0
-                for review in reviews:
-                    f.write(json.dumps(asdict(review), ensure_ascii=False) + "\n")
-                    count += 1
-                
-                print(f"   ✓ {count}개 수집 완료")
+                try:
+                    self._write_game(f, comp)
+                except SteamAPIError as e:
+                    # 나머지 게임은 계속 수집 (부분 결과는 공유 코퍼스에 게시하지 않음)
+                    self.errors.append(f"{comp['name']} ({comp['appid']}): {e}")
+                    print(f"   ⚠️ 수집 실패: {e}")
         
         print(f"\n💾 저장: {output_path}")
         return output_path
     
+    @property
+    def complete(self) -> bool:
+        """마지막 collect() 가 오류/중단 없이 끝났는지"""
+        return not self.errors and not self.truncated
+    
+    @traced("miner.collect_one")
+    def collect_one(self, comp: dict, output_path: Path) -> int:
+        """게임 1개의 리뷰를 개별 shard 파일로 수집 (분산 수집 워커용)
+
+        Steam 오류는 SteamAPIError 로 전파되어 워커가 작업을 다시 큐에 넣는다.
+        """
+        with atomic_write(output_path) as f:
+            return self._write_game(f, comp)
+    
+    def _write_game(self, f, comp: dict) -> int:
+        """게임 1개 수집 → JSONL 기록"""
+        print(f"📥 수집 중: {comp['name']} ({comp['appid']})")
+        
+        reviews = self._fetch_reviews(
+            appid=comp["appid"],
+            game_name=comp["name"],
+            limit=self.config.reviews_per_game,
+        )
+        
+        count = 0
+        for review in reviews:
+            f.write(json.dumps(asdict(review), ensure_ascii=False) + "\n")
+            count += 1
+        
+        print(f"   ✓ {count}개 수집 완료")
+        return count
+    
     def _fetch_reviews(
         self, 
         appid: str, 
@@ -82,6 +132,7 @@ class ReviewMiner:
         # 부정 리뷰
         yield from self._fetch_by_sentiment(appid, game_name, "negative", neg_limit)
     
+    @traced("miner.fetch_by_sentiment")
     def _fetch_by_sentiment(
         self, 
         appid: str, 
@@ -89,7 +140,43 @@ class ReviewMiner:
         review_type: str,  # positive | negative
         limit: int
     ) -> Generator[Review, None, None]:
-        """특정 sentiment의 리뷰만 가져오기"""
+        """특정 sentiment의 리뷰만 가져오기 (동일 요청이 진행 중이면 결과 공유)
+
+        예산 소진으로 중간에 끊긴 결과는 마지막 줄에 표시를 남겨, 결과를 공유받은
+        실행도 truncated 가 되어 부분 수집을 공유 코퍼스에 게시하지 않는다.
+        """
+        key = (
+            "mine", self.base_url, str(appid), review_type, self.config.language,
+            limit, self.config.recent_months,
+        )
+        path = self.flight.do(key, lambda f: self._write_flight(f, appid, game_name, review_type, limit))
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                row = json.loads(line)
+                if TRUNCATED_MARK in row:
+                    self.truncated = True
+                    continue
+                yield Review(**{**row, "game": game_name})
+    
+    def _write_flight(self, f, appid: str, game_name: str, review_type: str, limit: int) -> None:
+        """single-flight 결과 파일 기록 (중단되었으면 표시 줄 추가)"""
+        truncated, self.truncated = self.truncated, False
+        f.writelines(
+            json.dumps(asdict(r), ensure_ascii=False) + "\n"
+            for r in self._request_by_sentiment(appid, game_name, review_type, limit)
+        )
+        if self.truncated:
+            f.write(json.dumps({TRUNCATED_MARK: True}) + "\n")
+        self.truncated = self.truncated or truncated
+    
+    def _request_by_sentiment(
+        self, 
+        appid: str, 
+        game_name: str, 
+        review_type: str,
+        limit: int
+    ) -> Generator[Review, None, None]:
+        """Steam API 페이징 호출"""
         
         cursor = "*"
         collected = 0
@@ -102,8 +189,13 @@ class ReviewMiner:
             "all": "all"
         }
         language = lang_map.get(self.config.language, "all")
+        budget = current_budget()
         
         while collected < limit:
+            if budget and budget.mining_exhausted():
+                self.truncated = True
+                break
+            
             params = {
                 "json": 1,
                 "num_per_page": min(100, limit - collected),
@@ -116,17 +208,7 @@ class ReviewMiner:
             if language != "all":
                 params["language"] = language
             
-            try:
-                resp = requests.get(
-                    self.BASE_URL.format(appid=appid),
-                    params=params,
-                    timeout=10
-                )
-                resp.raise_for_status()
-                data = resp.json()
-            except Exception as e:
-                print(f"   ⚠️ API 오류: {e}")
-                break
+            data = self._get_page(appid, review_type, params)
             
             reviews = data.get("reviews", [])
             if not reviews:
@@ -146,7 +228,7 @@ class ReviewMiner:
                     game=game_name,
                     appid=appid,
                     review_id=r.get("recommendationid", ""),
-                    language=r.get("language", "unknown"),
+                    language=sys.intern(r.get("language", "unknown")),
                     sentiment="pos" if r.get("voted_up") else "neg",
                     text=r.get("review", "")[:2000],  # 최대 2000자
                     playtime_hours=round(r.get("author", {}).get("playtime_forever", 0) / 60, 1),
@@ -159,6 +241,49 @@ class ReviewMiner:
             if not cursor:
                 break
             
-            time.sleep(1)  # Rate limit 준수
+            if self.config.steam_page_delay:
+                with tracer.span("steam.rate_limit_sleep"):
+                    time.sleep(self.config.steam_page_delay)  # Rate limit 준수
         
         return
+    
+    def _get_page(self, appid: str, review_type: str, params: dict) -> dict:
+        """리뷰 페이지 1개 요청 (429 는 Retry-After, 5xx/네트워크 오류는 지수 백오프로 재시도)"""
+        import requests  # get_session() 이 이미 로드 - 모듈 import 시점에는 불필요
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            retry_after = 0.0
+            try:
+                with tracer.span("steam.request", appid=appid, review_type=review_type, attempt=attempt):
+                    resp = get_session().get(
+                        self.base_url.format(appid=appid),
+                        params=params,
+                        timeout=10
+                    )
+                tracer.count("http.requests")
+                tracer.count("http.bytes", len(resp.content))
+                charge("http_requests")
+                if resp.status_code == 429 or resp.status_code >= 500:
+                    header = resp.headers.get("Retry-After", "")
+                    retry_after = float(header) if header.replace(".", "", 1).isdigit() else 0.0
+                    error = f"HTTP {resp.status_code}"
+                else:
+                    resp.raise_for_status()
+                    with tracer.span("steam.parse_json"):
+                        return resp.json()
+            except requests.HTTPError as e:
+                tracer.count("http.errors")
+                raise SteamAPIError(f"{appid} {review_type}: {e}") from e
+            except (requests.RequestException, ValueError) as e:
+                error = f"{type(e).__name__}: {e}"
+            
+            tracer.count("http.errors")
+            if attempt == self.MAX_RETRIES:
+                break
+            delay = retry_after or min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+            tracer.count("http.retries")
+            print(f"   ⚠️ API 오류: {error} → {delay:.1f}초 후 재시도 ({attempt + 1}/{self.MAX_RETRIES})")
+            with tracer.span("steam.retry_sleep"):
+                time.sleep(delay)
+        
+        raise SteamAPIError(f"{appid} {review_type}: {error} ({self.MAX_RETRIES}회 재시도 후 실패)")
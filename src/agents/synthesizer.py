@@ -2,10 +2,15 @@
 import json
 from pathlib import Path
 from dataclasses import dataclass, asdict, field
-from collections import defaultdict
 from typing import Optional
 
+from ..blockstore import data_size, iter_lines
+from ..budget import REDUCED_QUOTES, current_budget, charge
 from ..config import Config
+from ..frameworks import FrameworkBundle, load_frameworks
+from ..parallel import PARALLEL_MIN_BYTES, compute_stats_parallel
+from ..tracing import tracer, traced, estimate_tokens
+from ..workspace import atomic_write
 
 
 @dataclass
@@ -52,6 +57,98 @@ class SynthesisResult:
     top_risk: str
 
 
+QUOTE_LIMIT = 20
+SYNTHESIS_RESPONSE_TOKENS = 3000  # 예산 추정용 응답 크기
+
+# (경로, mtime_ns, size) → 통계
+_stats_cache: dict[tuple, dict] = {}
+
+
+def new_stats() -> dict:
+    """부분 집계 상태 (dict 삽입 순서 = 파일 내 첫 등장 순서)"""
+    return {
+        "total": 0,
+        "high_quality": 0,
+        "by_game": {},
+        "by_sentiment": {},
+        "by_player_type": {},
+        "pain_counts": {},
+        "delight_counts": {},
+        "quotes": [],
+    }
+
+
+def accumulate_stats(partial: dict, r: dict) -> None:
+    """태깅 리뷰 1개 집계 (빠진 필드는 "unknown" - 직렬/병렬 집계 공통)"""
+    partial["total"] += 1
+    for key, value in (
+        ("by_game", r.get("game", "unknown")),
+        ("by_sentiment", r.get("sentiment", "unknown")),
+        ("by_player_type", r.get("player_type_guess", "unknown")),
+    ):
+        partial[key][value] = partial[key].get(value, 0) + 1
+    
+    for p in r.get("pain_points", []):
+        partial["pain_counts"][p] = partial["pain_counts"].get(p, 0) + 1
+    for d in r.get("delights", []):
+        partial["delight_counts"][d] = partial["delight_counts"].get(d, 0) + 1
+    
+    # 고품질 리뷰만 인용 수집
+    if r.get("quotes") and r.get("player_type_guess") in ["mid", "hardcore"]:
+        if len(partial["quotes"]) < QUOTE_LIMIT:
+            partial["quotes"].extend(r["quotes"])
+        partial["high_quality"] += 1
+
+
+def merge_stats(partials: list[dict]) -> dict:
+    """파일 순서대로 나뉜 부분 집계 병합 (직렬 집계와 동일한 결과)"""
+    merged = new_stats()
+    for partial in partials:
+        merged["total"] += partial["total"]
+        merged["high_quality"] += partial["high_quality"]
+        for key in ("by_game", "by_sentiment", "by_player_type", "pain_counts", "delight_counts"):
+            target = merged[key]
+            for k, v in partial[key].items():
+                target[k] = target.get(k, 0) + v
+        if len(merged["quotes"]) < QUOTE_LIMIT:
+            merged["quotes"].extend(partial["quotes"])
+    return merged
+
+
+def finalize_stats(partial: dict) -> dict:
+    """부분 집계 → 통계 dict"""
+    return {
+        "summary": {
+            "total_reviews": partial["total"],
+            "high_quality_reviews": partial["high_quality"],
+            "by_game": partial["by_game"],
+            "sentiment": partial["by_sentiment"],
+            "player_types": partial["by_player_type"],
+        },
+        "pain_dist": dict(sorted(partial["pain_counts"].items(), key=lambda x: -x[1])[:10]),
+        "delight_dist": dict(sorted(partial["delight_counts"].items(), key=lambda x: -x[1])[:10]),
+        "quotes": partial["quotes"][:QUOTE_LIMIT],
+    }
+
+
+def remember_stats(path: Path, stats: dict) -> None:
+    """통계 캐시 등록 (태깅과 동시에 집계한 경우 재계산 방지)"""
+    stat = Path(path).stat()
+    _stats_cache[(str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)] = stats
+
+
+def save_stats(path: Path, stats: dict) -> None:
+    """통계 저장 (리포트 재렌더링용)"""
+    with atomic_write(path) as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
+
+
+def load_stats(path: Path) -> dict:
+    """저장된 stats.json 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 # 리서치 기반 페르소나 합성 프롬프트
 SYNTHESIS_SYSTEM_PROMPT = """당신은 게임 유저 리서치 전문가입니다.
 Steam 리뷰 데이터와 검증된 페르소나 프레임워크를 기반으로 정교한 페르소나를 도출합니다.
@@ -182,14 +279,11 @@ class PersonaSynthesizer:
         self.llm_client = llm_client
         self.frameworks = self._load_frameworks()
     
-    def _load_frameworks(self) -> dict:
-        """페르소나 프레임워크 로드"""
-        framework_path = Path(__file__).parent.parent / "data" / "persona_frameworks.json"
-        if framework_path.exists():
-            with open(framework_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+    def _load_frameworks(self) -> FrameworkBundle:
+        """페르소나 프레임워크 로드 (프로세스 캐시 번들)"""
+        return load_frameworks()
     
+    @traced("synthesizer.synthesize")
     def synthesize(
         self,
         tagged_reviews_path: Path,
@@ -206,23 +300,19 @@ class PersonaSynthesizer:
         genre_weights = self._get_genre_weights(genre)
         
         # 프롬프트 생성
-        user_prompt = SYNTHESIS_USER_TEMPLATE.format(
-            idea=idea,
-            genre=genre,
-            stats=json.dumps(stats["summary"], ensure_ascii=False, indent=2),
-            pain_distribution=json.dumps(stats["pain_dist"], ensure_ascii=False, indent=2),
-            delight_distribution=json.dumps(stats["delight_dist"], ensure_ascii=False, indent=2),
-            player_type_distribution=json.dumps(
-                stats["summary"].get("player_types", {}), 
-                ensure_ascii=False, 
-                indent=2
-            ),
-            sample_quotes="\n".join([f'- "{q}"' for q in stats["quotes"][:8]]),
-            genre_weights=json.dumps(genre_weights, ensure_ascii=False, indent=2),
-        )
+        user_prompt = self._build_prompt(stats, idea, genre, genre_weights, quote_limit=8)
+        
+        # 예산이 빠듯하면 인용 축소, 부족하면 프레임워크 기반으로
+        budget = current_budget() if self.llm_client else None
+        mode = "full"
+        if budget:
+            est_tokens = estimate_tokens(SYNTHESIS_SYSTEM_PROMPT + user_prompt) + SYNTHESIS_RESPONSE_TOKENS
+            mode = budget.synthesis_mode(est_tokens)
+            if mode == "fewer_quotes":
+                user_prompt = self._build_prompt(stats, idea, genre, genre_weights, quote_limit=REDUCED_QUOTES)
         
         # LLM 호출
-        if self.llm_client:
+        if self.llm_client and mode != "framework":
             response = self._call_llm(user_prompt)
             result = self._parse_response(response, stats)
         else:
@@ -236,76 +326,52 @@ class PersonaSynthesizer:
         print(f"💾 저장: {output_path}")
         return result
     
+    def _build_prompt(self, stats: dict, idea: str, genre: str, genre_weights: dict, quote_limit: int) -> str:
+        """합성 프롬프트 (인용 수 조절 가능)"""
+        return SYNTHESIS_USER_TEMPLATE.format(
+            idea=idea,
+            genre=genre,
+            stats=json.dumps(stats["summary"], ensure_ascii=False, indent=2),
+            pain_distribution=json.dumps(stats["pain_dist"], ensure_ascii=False, indent=2),
+            delight_distribution=json.dumps(stats["delight_dist"], ensure_ascii=False, indent=2),
+            player_type_distribution=json.dumps(
+                stats["summary"].get("player_types", {}), 
+                ensure_ascii=False, 
+                indent=2
+            ),
+            sample_quotes="\n".join([f'- "{q}"' for q in stats["quotes"][:quote_limit]]),
+            genre_weights=json.dumps(genre_weights, ensure_ascii=False, indent=2),
+        )
+    
     def _get_genre_weights(self, genre: str) -> dict:
-        """장르별 페르소나 가중치 반환"""
-        mappings = self.frameworks.get("genre_persona_mapping", {}).get("mappings", {})
-        
-        # 장르 매칭
-        genre_lower = genre.lower()
-        for key in mappings:
-            if key in genre_lower or genre_lower in key:
-                return mappings[key]
-        
-        # 기본값
-        return {
-            "constructive_critic": 0.25,
-            "bandwagon_casual": 0.25,
-            "vibe_seeker": 0.20,
-            "tech_troubleshooter": 0.15,
-            "competitive_hardcore": 0.15
-        }
+        """장르별 페르소나 가중치 반환 (정확 일치 → 별칭/토큰 → 부분 일치)"""
+        return dict(self.frameworks.genre_weights(genre))
     
+    @traced("synthesizer.compute_stats")
     def _compute_stats(self, path: Path) -> dict:
-        """태깅 데이터 통계 계산 (품질 필터링 포함)"""
-        reviews = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                reviews.append(json.loads(line))
+        """태깅 데이터 통계 계산 (품질 필터링 포함)
         
-        # 기본 통계
-        total = len(reviews)
-        by_game = defaultdict(int)
-        by_sentiment = defaultdict(int)
-        by_player_type = defaultdict(int)
-        pain_counts = defaultdict(int)
-        delight_counts = defaultdict(int)
-        quotes = []
+        같은 파일(경로, mtime, 크기)은 프로세스 내에서 한 번만 계산하며,
+        offline_workers > 1 이고 파일이 크면 프로세스 풀로 청크 단위 집계한다.
+        """
+        path = Path(path)
+        stat = path.stat()
+        cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if cache_key in _stats_cache:
+            return _stats_cache[cache_key]
         
-        # 품질 필터 적용
-        filters = self.frameworks.get("data_quality_filters", {}).get("rules", {})
-        quality_thresholds = filters.get("quality_thresholds", {})
-        min_length = quality_thresholds.get("min_review_length", 50)
-        
-        high_quality_count = 0
-        
-        for r in reviews:
-            by_game[r["game"]] += 1
-            by_sentiment[r["sentiment"]] += 1
-            by_player_type[r["player_type_guess"]] += 1
-            
-            for p in r.get("pain_points", []):
-                pain_counts[p] += 1
-            for d in r.get("delights", []):
-                delight_counts[d] += 1
-            
-            # 고품질 리뷰만 인용 수집
-            if r.get("quotes") and r.get("player_type_guess") in ["mid", "hardcore"]:
-                quotes.extend(r["quotes"])
-                high_quality_count += 1
+        if self.config.offline_workers > 1 and data_size(path) >= PARALLEL_MIN_BYTES:
+            stats = compute_stats_parallel(path, self.config.offline_workers)
+        else:
+            partial = new_stats()
+            for line in iter_lines(path):
+                accumulate_stats(partial, json.loads(line))
+            stats = finalize_stats(partial)
         
-        return {
-            "summary": {
-                "total_reviews": total,
-                "high_quality_reviews": high_quality_count,
-                "by_game": dict(by_game),
-                "sentiment": dict(by_sentiment),
-                "player_types": dict(by_player_type),
-            },
-            "pain_dist": dict(sorted(pain_counts.items(), key=lambda x: -x[1])[:10]),
-            "delight_dist": dict(sorted(delight_counts.items(), key=lambda x: -x[1])[:10]),
-            "quotes": quotes[:20],
-        }
+        remember_stats(path, stats)
+        return stats
     
+    @traced("synthesizer.call_llm")
     def _call_llm(self, user_prompt: str) -> str:
         """LLM 호출"""
         if hasattr(self.llm_client, "chat"):
@@ -314,11 +380,19 @@ class PersonaSynthesizer:
                 messages=[
                     {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
-                ]
+                ],
+                lane="interactive",
             )
-            return resp.get("content", "{}")
+            content = resp.get("content", "{}")
+            usage = resp.get("usage") or {}
+            tokens = usage.get("total_tokens") or estimate_tokens(SYNTHESIS_SYSTEM_PROMPT + user_prompt + content)
+            tracer.count("llm.calls")
+            tracer.count("llm.tokens", tokens)
+            charge("llm_tokens", tokens)
+            return content
         return "{}"
     
+    @traced("synthesizer.parse_response")
     def _parse_response(self, response: str, stats: dict) -> SynthesisResult:
         """LLM 응답 파싱"""
         try:
@@ -407,8 +481,8 @@ class PersonaSynthesizer:
             arch = archetypes[archetype_key]
             
             # 데이터 기반 커스터마이징
-            custom_pains = arch.get("pains", [])[:2] + top_pains[:1]
-            custom_goals = arch.get("goals", [])[:2]
+            custom_pains = list(arch.get("pains", ()))[:2] + top_pains[:1]
+            custom_goals = list(arch.get("goals", ()))[:2]
             
             persona = Persona(
                 name=arch.get("name_ko", archetype_key),
@@ -418,7 +492,7 @@ class PersonaSynthesizer:
                 motivations=["mastery", "action"] if "competitive" in archetype_key else ["immersion", "creativity"],
                 goals=custom_goals,
                 pains=custom_pains,
-                triggers=arch.get("triggers", [])[:2],
+                triggers=list(arch.get("triggers", ()))[:2],
                 win_conditions=["아이디어가 고통점 해결", "기대 충족"],
                 mobile_considerations=[
                     "터치 조작 최적화 필요" if arch.get("player_type") == "hardcore" else "캐주얼 접근성 유지"
@@ -459,9 +533,7 @@ class PersonaSynthesizer:
     
     def _save_result(self, result: SynthesisResult, output_path: Path) -> None:
         """결과 저장"""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "w", encoding="utf-8") as f:
+        with atomic_write(output_path) as f:
             json.dump({
                 "personas": [asdict(p) for p in result.personas],
                 "validations": [asdict(v) for v in result.validations],
@@ -471,6 +543,20 @@ class PersonaSynthesizer:
             }, f, ensure_ascii=False, indent=2)
 
 
+def load_synthesis_result(path: Path) -> SynthesisResult:
+    """저장된 personas.json → SynthesisResult"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    
+    return SynthesisResult(
+        personas=[Persona(**p) for p in data.get("personas", [])],
+        validations=[Validation(**v) for v in data.get("validations", [])],
+        risks=[Risk(**r) for r in data.get("risks", [])],
+        top_personas=data.get("top_personas", []),
+        top_risk=data.get("top_risk", ""),
+    )
+
+
 def get_synthesis_prompts() -> tuple[str, str]:
     """프롬프트 반환 (Cursor에서 직접 사용 시)"""
     return SYNTHESIS_SYSTEM_PROMPT, SYNTHESIS_USER_TEMPLATE
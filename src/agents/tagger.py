@@ -1,14 +1,28 @@
 """Agent B - 리뷰 태깅 (배치 처리)"""
 import json
+import math
+import time
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
+from ..blockstore import corpus_writer, data_size
+from ..budget import current_budget, charge
 from ..config import Config
+from ..parallel import PARALLEL_MIN_BYTES, tag_offline_parallel
+from ..records import Codebooks, CompactTagged, as_list, count_records, iter_reviews
+from ..singleflight import get_singleflight, work_key
+from ..tracing import tracer, traced, estimate_tokens
 
 
 @dataclass
 class TaggedReview:
+    # 3.9 호환을 위해 dataclass(slots=True) 대신 직접 선언 (그래서 기본값 필드 없음)
+    __slots__ = (
+        "game", "appid", "review_id", "language", "sentiment", "player_type_guess",
+        "session_style", "pain_points", "delights", "quotes", "notes", "raw_index",
+    )
+
     game: str
     appid: str
     review_id: str
@@ -20,6 +34,14 @@ class TaggedReview:
     delights: list[str]
     quotes: list[str]
     notes: str
+    raw_index: int  # raw_reviews.jsonl 줄 번호 = 리뷰 저장소 레코드 번호 (원문 조인용, 모르면 -1)
+    
+    def to_row(self) -> dict:
+        """JSONL 한 줄용 dict (asdict 와 같은 결과, 깊은 복사 없음)"""
+        return {name: getattr(self, name) for name in _TAGGED_FIELDS}
+
+
+_TAGGED_FIELDS = tuple(f.name for f in fields(TaggedReview))
 
 
 # 태깅용 프롬프트
@@ -43,6 +65,51 @@ TAGGING_USER_TEMPLATE = """아래 {count}개 리뷰를 태깅해주세요:
 JSON 배열로 반환 (review_id, player_type_guess, session_style, pain_points, delights, quotes, notes 포함):"""
 
 
+def review_priority(review: dict) -> float:
+    """리뷰 정보량 점수 (긴 본문, 중/하드코어 플레이타임 우대)"""
+    score = math.log1p(min(len(review.get("text", "")), 2000))
+    playtime = review.get("playtime_hours", 0)
+    if playtime >= 10:
+        score += 2.0
+    elif playtime < 1:
+        score -= 1.0
+    return score
+
+
+def prioritize_reviews(reviews: list[dict]) -> list[int]:
+    """태깅 우선순위 순 인덱스
+
+    (게임, 긍부정) 버킷마다 점수순으로 정렬한 뒤 버킷을 번갈아 뽑아
+    어느 시점에 멈춰도 게임/감성 분포가 고르게 유지되도록 한다.
+    """
+    buckets: dict[tuple, list[int]] = {}
+    for i, r in enumerate(reviews):
+        buckets.setdefault((r.get("game"), r.get("sentiment")), []).append(i)
+    queues = [
+        sorted(indices, key=lambda i: -review_priority(reviews[i]))
+        for indices in buckets.values()
+    ]
+    
+    order = []
+    for rank in range(max((len(q) for q in queues), default=0)):
+        for q in queues:
+            if rank < len(q):
+                order.append(q[rank])
+    return order
+
+
+def _batched(items, size: int):
+    """이터러블 → size 개씩 리스트"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class ReviewTagger:
     """리뷰 태깅 Agent (배치 처리)"""
     
@@ -61,7 +128,16 @@ class ReviewTagger:
         self.config = config
         self.llm_client = llm_client  # 외부에서 주입
         self.batch_size = config.batch_size
+        self.flight = get_singleflight(config.shared_root() / ".singleflight")
+        self.truncated = False  # 마감 임박으로 일부 리뷰만 태깅
+        self.degraded = False  # 예산 부족으로 LLM 대신 규칙 기반 태깅
+    
+    @property
+    def complete(self) -> bool:
+        """모든 리뷰를 설정된 방식(LLM/규칙)대로 태깅했는지"""
+        return not self.truncated and not self.degraded
     
+    @traced("tagger.tag_reviews")
     def tag_reviews(self, raw_reviews_path: Path) -> Path:
         """
         리뷰 파일을 읽어 태깅 후 저장
@@ -71,32 +147,126 @@ class ReviewTagger:
         """
         output_path = self.config.output_dir / self.config.tagged_reviews_file
         
-        # 원본 리뷰 로드
-        reviews = []
-        with open(raw_reviews_path, "r", encoding="utf-8") as f:
-            for line in f:
-                reviews.append(json.loads(line))
+        # LLM 없는 대용량 태깅은 프로세스 풀로 분할 (출력은 직렬과 동일)
+        workers = self.config.offline_workers
+        if not self.llm_client and workers > 1 and data_size(raw_reviews_path) >= PARALLEL_MIN_BYTES:
+            from .synthesizer import remember_stats
+            print(f"🏷️ 병렬 태깅 시작: {workers}개 프로세스")
+            stats = tag_offline_parallel(self.config, raw_reviews_path, output_path, workers)
+            remember_stats(output_path, stats)
+            print(f"   {stats['summary']['total_reviews']}개 리뷰 태깅")
+            print(f"💾 저장: {output_path}")
+            return output_path
         
-        print(f"🏷️ 태깅 시작: {len(reviews)}개 리뷰")
+        # 배치 처리 (예산이 부족해지면 나머지 배치는 규칙 기반으로 전환)
+        budget = current_budget()
+        local = False
+        llm_batches, llm_tokens, llm_seconds = 0, 0.0, 0.0
+        batch_seconds = []
         
-        # 배치 처리
-        tagged = []
-        for i in range(0, len(reviews), self.batch_size):
-            batch = reviews[i:i + self.batch_size]
-            print(f"   배치 {i // self.batch_size + 1}: {len(batch)}개 처리 중...")
-            
-            batch_tagged = self._tag_batch(batch)
-            tagged.extend(batch_tagged)
+        # 마감 모드: 정보량 높은 리뷰부터 태깅해야 하므로 전체를 압축 레코드로 적재,
+        # 그 외에는 원본/결과 모두 배치 단위로 스트리밍 (메모리 = 배치 1개)
+        deadline = budget is not None and budget.deadline
+        books = Codebooks()
+        if deadline:
+            with tracer.span("io.read_raw_reviews"):
+                reviews = list(iter_reviews(raw_reviews_path, books))
+            total = len(reviews)
+            order = prioritize_reviews(reviews)
+            batches = ([reviews[j] for j in order[i:i + self.batch_size]] for i in range(0, total, self.batch_size))
+        else:
+            total = count_records(raw_reviews_path)
+            batches = _batched(iter_reviews(raw_reviews_path, books), self.batch_size)
         
-        # 저장
-        with open(output_path, "w", encoding="utf-8") as f:
-            for t in tagged:
-                f.write(json.dumps(asdict(t), ensure_ascii=False) + "\n")
+        print(f"🏷️ 태깅 시작: {total}개 리뷰")
+        if deadline:
+            print(f"   ⏱️ 마감 모드: 우선순위 순 태깅 (남은 시간 {budget.remaining('time_s'):.0f}초)")
+        
+        kept: list[CompactTagged] = []  # 마감 모드에서만 (원본 순서로 다시 정렬)
+        done = 0
+        with corpus_writer(output_path, self.config.storage_codec, self.config.storage_block_records) as out:
+            for n, batch in enumerate(batches, 1):
+                if deadline:
+                    est_seconds = max(batch_seconds[-3:]) if batch_seconds else 0.0
+                    if budget.deadline_reached(est_seconds):
+                        budget.degrade("tag", "마감 임박 - 태깅 중단", f"{done}/{total}개 리뷰 태깅 후 중단")
+                        self.truncated = True
+                        break
+                
+                print(f"   배치 {n}: {len(batch)}개 처리 중...")
+                
+                if self.llm_client and budget and not local:
+                    # 관측 평균이 있으면 그 값, 없으면 프롬프트 크기로 추정 (응답 포함 2배)
+                    est_tokens = llm_tokens / llm_batches if llm_batches else 2 * estimate_tokens(
+                        TAGGING_SYSTEM_PROMPT + "".join(r["text"][:500] for r in batch)
+                    )
+                    est_seconds = llm_seconds / llm_batches if llm_batches else 0.0
+                    local = not budget.allow_llm_batch(est_tokens, est_seconds)
+                    self.degraded = local
+                
+                started = time.perf_counter()
+                if local:
+                    batch_tagged = self._fallback_tagging(batch)
+                else:
+                    tokens_before = budget.used["llm_tokens"] if budget else 0
+                    batch_tagged = self._tag_batch(batch)
+                    if self.llm_client and budget:
+                        llm_batches += 1
+                        llm_tokens += budget.used["llm_tokens"] - tokens_before
+                        llm_seconds += time.perf_counter() - started
+                batch_seconds.append(time.perf_counter() - started)
+                done += len(batch)
+                
+                by_id = {r["review_id"]: r for r in batch}
+                if deadline:
+                    kept.extend(CompactTagged(by_id[t.review_id], t) for t in batch_tagged if t.review_id in by_id)
+                    continue
+                with tracer.span("io.write_tagged_reviews"):
+                    for t in batch_tagged:
+                        t.raw_index = by_id[t.review_id].raw_index if t.review_id in by_id else -1
+                        out.write(json.dumps(t.to_row(), ensure_ascii=False) + "\n")
+            
+            if deadline:
+                # 출력은 원본 순서로 (하위 단계/통계 결과가 태깅 순서에 좌우되지 않도록)
+                kept.sort(key=lambda t: t.raw_index)
+                with tracer.span("io.write_tagged_reviews"):
+                    for t in kept:
+                        out.write(json.dumps(t.to_dict(), ensure_ascii=False) + "\n")
+                totals: dict[str, int] = {}
+                for r in reviews:
+                    totals[r["game"]] = totals.get(r["game"], 0) + 1
+                tagged_by_game: dict[str, int] = {}
+                for t in kept:
+                    tagged_by_game[t.game] = tagged_by_game.get(t.game, 0) + 1
+                budget.set_coverage(done, totals, tagged_by_game)
         
         print(f"💾 저장: {output_path}")
         return output_path
     
+    @traced("tagger.tag_batch")
     def _tag_batch(self, batch: list[dict]) -> list[TaggedReview]:
+        """배치 태깅 (동일 리뷰 배치를 다른 실행이 태깅 중이면 결과 공유)"""
+        if not self.llm_client:
+            # 규칙 기반 태깅은 로컬 연산이라 공유 비용이 더 큼
+            return self._tag_batch_uncached(batch)
+        
+        key = work_key(
+            "tag", self.config.tagging_model, TAGGING_SYSTEM_PROMPT, TAGGING_USER_TEMPLATE,
+            [[r["review_id"], r["text"], r.get("playtime_hours", 0), r["sentiment"]] for r in batch],
+        )
+        path = self.flight.do(key, lambda f: f.writelines(
+            json.dumps(asdict(t), ensure_ascii=False) + "\n" for t in self._tag_batch_uncached(batch)
+        ))
+        
+        # 게임명 등 메타데이터는 현재 배치 기준으로 채움
+        review_map = {r["review_id"]: r for r in batch}
+        with open(path, "r", encoding="utf-8") as f:
+            return [
+                TaggedReview(**{**row, "game": review_map[row["review_id"]]["game"]})
+                for row in map(json.loads, f)
+            ]
+    
+    def _tag_batch_uncached(self, batch: list[dict]) -> list[TaggedReview]:
         """배치 태깅 (LLM 호출)"""
         
         # 프롬프트 생성
@@ -120,21 +290,32 @@ class ReviewTagger:
         
         return parsed
     
+    @traced("tagger.call_llm")
     def _call_llm(self, user_prompt: str) -> str:
         """LLM API 호출 (추상화)"""
         # Cursor 내에서 실행 시 이 부분은 직접 호출됨
         # 외부 실행 시 llm_client 사용
         if hasattr(self.llm_client, "chat"):
-            resp = self.llm_client.chat(
+            # 공용 클라이언트면 꼬리 지연 헤지 경로 사용 (설정에서 꺼져 있으면 chat 과 동일)
+            chat = getattr(self.llm_client, "hedged_chat", self.llm_client.chat)
+            resp = chat(
                 model=self.config.tagging_model,
                 messages=[
                     {"role": "system", "content": TAGGING_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
-                ]
+                ],
+                lane="bulk",
             )
-            return resp.get("content", "[]")
+            content = resp.get("content", "[]")
+            usage = resp.get("usage") or {}
+            tokens = usage.get("total_tokens") or estimate_tokens(TAGGING_SYSTEM_PROMPT + user_prompt + content)
+            tracer.count("llm.calls")
+            tracer.count("llm.tokens", tokens)
+            charge("llm_tokens", tokens)
+            return content
         return "[]"
     
+    @traced("tagger.parse_response")
     def _parse_response(self, response: str, batch: list[dict]) -> list[TaggedReview]:
         """LLM 응답 파싱"""
         try:
@@ -162,12 +343,13 @@ class ReviewTagger:
                     review_id=rid,
                     language=orig["language"],
                     sentiment=orig["sentiment"],
-                    player_type_guess=item.get("player_type_guess", "unknown"),
-                    session_style=item.get("session_style", ["unknown"]),
-                    pain_points=item.get("pain_points", []),
-                    delights=item.get("delights", []),
-                    quotes=item.get("quotes", []),
-                    notes=item.get("notes", ""),
+                    player_type_guess=item.get("player_type_guess") or "unknown",
+                    session_style=as_list(item.get("session_style", ["unknown"])),
+                    pain_points=as_list(item.get("pain_points")),
+                    delights=as_list(item.get("delights")),
+                    quotes=as_list(item.get("quotes")),
+                    notes=item.get("notes") or "",
+                    raw_index=-1,
                 ))
             
             return result
@@ -232,6 +414,7 @@ class ReviewTagger:
                 delights=delights or ["other"],
                 quotes=[],
                 notes="(auto-tagged)",
+                raw_index=-1,
             ))
         
         return result
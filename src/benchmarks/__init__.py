@@ -0,0 +1 @@
+# 성능 회귀 측정 스크립트 (python -m src.benchmarks.<name>)
@@ -0,0 +1,75 @@
+"""합성 리뷰 코퍼스 - raw_reviews.jsonl 형식 (한국어/영어, 수백만 건까지 스트리밍 생성)
+
+    python -m src.benchmarks.corpus --reviews 1000000 --out /tmp/raw_reviews.jsonl --korean-share 0.6
+
+리뷰 본문 길이와 플레이타임은 Steam 스텁(synth_review)과 같은 로그정규 분포를 따르고,
+같은 (seed, 인덱스) 는 항상 같은 리뷰를 만든다. 타임스탬프도 고정 기준 시각에서
+거슬러 올라가므로 같은 인자로 만든 코퍼스는 바이트 단위로 같다.
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from ..stubs.steam_server import synth_review
+
+GAMES = [("Counter-Strike 2", "730"), ("PUBG: BATTLEGROUNDS", "578080"), ("Apex Legends", "1172470"),
+         ("Naraka: Bladepoint", "1203220"), ("THE FINALS", "2073850")]
+EPOCH = datetime(2025, 1, 1)
+WINDOW_DAYS = 60  # 최근 N일 안에 고르게 분포 (miner 의 recent_months 필터 통과)
+
+
+def corpus_games(count: int = len(GAMES)) -> list[dict]:
+    """경쟁작 목록 ([{name, appid}], 실제 게임 다음은 합성 게임)"""
+    games = GAMES[:count] + [(f"Synthetic Game {i}", str(900000 + i)) for i in range(len(GAMES), count)]
+    return [{"name": name, "appid": appid} for name, appid in games]
+
+
+def iter_corpus(reviews: int, games: int = len(GAMES), korean_share: float = 0.5, seed: int = 0) -> Iterator[dict]:
+    """합성 리뷰 레코드 순회 (긍정:부정 = 2:1)"""
+    competitors = corpus_games(games)
+    for i in range(reviews):
+        game = competitors[i % len(competitors)]
+        rnd = random.Random(f"{seed}:{i}")
+        language = "korean" if rnd.random() < korean_share else "english"
+        review_type = "positive" if i % 3 else "negative"
+        r = synth_review(game["appid"], review_type, seed * reviews + i, language)
+        yield {
+            "game": game["name"],
+            "appid": game["appid"],
+            "review_id": r["recommendationid"],
+            "language": r["language"],
+            "sentiment": "pos" if r["voted_up"] else "neg",
+            "text": r["review"],
+            "playtime_hours": round(r["author"]["playtime_forever"] / 60, 1),
+            "timestamp": (EPOCH - timedelta(seconds=rnd.randint(0, WINDOW_DAYS * 86400))).isoformat(),
+        }
+
+
+def make_corpus(path: Path, reviews: int, games: int = len(GAMES), korean_share: float = 0.5, seed: int = 0) -> Path:
+    """합성 코퍼스 파일 생성"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for record in iter_corpus(reviews, games, korean_share, seed):
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return path
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="합성 리뷰 코퍼스 생성")
+    parser.add_argument("--reviews", type=int, default=100_000)
+    parser.add_argument("--games", type=int, default=len(GAMES))
+    parser.add_argument("--korean-share", type=float, default=0.5, help="한국어 리뷰 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="raw_reviews.jsonl")
+    args = parser.parse_args(argv)
+
+    path = make_corpus(Path(args.out), args.reviews, args.games, args.korean_share, args.seed)
+    print(f"💾 {path} ({args.reviews:,}개 리뷰, {path.stat().st_size / 1024 / 1024:,.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
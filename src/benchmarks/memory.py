@@ -0,0 +1,176 @@
+"""태깅 단계 메모리 벤치마크 - 대용량 코퍼스의 최대 RSS 비교
+
+    python -m src.benchmarks.memory --reviews 1000000
+
+합성 코퍼스를 만든 뒤 방식별로 별도 프로세스에서 규칙 기반 태깅을 실행하고
+최대 RSS(ru_maxrss, Windows 는 최대 working set)와 소요 시간을 비교한다.
+
+    legacy    이전 방식 재현 - 원본 dict 전체 + 일반 dataclass 결과 리스트를 들고 있다가 저장
+    stream    현재 기본 경로 - 배치 단위 읽기/쓰기
+    deadline  마감 모드 - 전체를 압축 레코드로 적재 후 우선순위 순 태깅
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from dataclasses import dataclass, asdict, replace
+
+from .corpus import make_corpus
+
+try:
+    import resource  # Unix 전용
+except ImportError:
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[2]
+MODES = ("legacy", "stream", "deadline")
+
+
+@dataclass
+class _LegacyTaggedReview:
+    """변경 전 TaggedReview (slots 없음)"""
+    game: str
+    appid: str
+    review_id: str
+    language: str
+    sentiment: str
+    player_type_guess: str
+    session_style: list[str]
+    pain_points: list[str]
+    delights: list[str]
+    quotes: list[str]
+    notes: str
+    raw_index: int = -1
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 는 KB / macOS 는 byte 단위, 측정 불가면 0)"""
+    if resource is not None:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+    if sys.platform == "win32":
+        return _windows_peak_working_set() / (1024 * 1024)
+    return 0.0
+
+
+def _windows_peak_working_set() -> int:
+    """GetProcessMemoryInfo 의 PeakWorkingSetSize (byte)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return 0
+    return counters.PeakWorkingSetSize
+
+
+def _run_legacy(config, raw_path: Path) -> Path:
+    from ..agents.tagger import ReviewTagger
+
+    tagger = ReviewTagger(config)
+    reviews = []
+    with open(raw_path, "r", encoding="utf-8") as f:
+        for line in f:
+            reviews.append(json.loads(line))
+    tagged = []
+    for i in range(0, len(reviews), tagger.batch_size):
+        for j, t in enumerate(tagger._fallback_tagging(reviews[i:i + tagger.batch_size])):
+            tagged.append(_LegacyTaggedReview(**{**asdict(t), "raw_index": i + j}))
+    output_path = config.output_dir / config.tagged_reviews_file
+    with open(output_path, "w", encoding="utf-8") as f:
+        for t in tagged:
+            f.write(json.dumps(asdict(t), ensure_ascii=False) + "\n")
+    return output_path
+
+
+def run_mode(mode: str, raw_path: Path, output_dir: Path) -> dict:
+    """한 방식 실행 (벤치마크 자식 프로세스에서 호출)"""
+    from ..agents.tagger import ReviewTagger
+    from ..budget import Budget
+    from ..config import load_config
+
+    config = replace(load_config(str(ROOT / "config.yaml")), output_dir=output_dir, offline_workers=0)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    baseline = peak_rss_mb()
+
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if mode == "legacy":
+            output_path = _run_legacy(config, raw_path)
+        elif mode == "deadline":
+            with Budget({"time_s": 10 ** 6}, deadline=True).activate():
+                output_path = ReviewTagger(config).tag_reviews(raw_path)
+        else:
+            output_path = ReviewTagger(config).tag_reviews(raw_path)
+
+    return {
+        "mode": mode,
+        "seconds": round(time.perf_counter() - started, 2),
+        "baseline_mb": round(baseline, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "output_bytes": output_path.stat().st_size,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="태깅 메모리 벤치마크 (최대 RSS)")
+    parser.add_argument("--reviews", type=int, default=1_000_000, help="합성 코퍼스 리뷰 수")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"비교할 방식 ({','.join(MODES)})")
+    parser.add_argument("--raw", help="기존 raw_reviews.jsonl 사용 (지정 시 합성 생략)")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    parser.add_argument("--run", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run:
+        print(json.dumps(run_mode(args.run, Path(args.raw), Path(args.output_dir))))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="vv-membench-") as tmp:
+        raw_path = Path(args.raw) if args.raw else Path(tmp) / "raw_reviews.jsonl"
+        if not args.raw:
+            print(f"🧪 합성 코퍼스 생성: {args.reviews:,}개 리뷰")
+            make_corpus(raw_path, args.reviews)
+        print(f"   {raw_path} ({raw_path.stat().st_size / 1024 / 1024:,.0f}MB)\n")
+
+        results = []
+        for mode in args.modes.split(","):
+            # 방식마다 새 프로세스 (ru_maxrss 는 프로세스 수명 동안의 최댓값)
+            proc = subprocess.run(
+                [sys.executable, "-m", "src.benchmarks.memory", "--run", mode,
+                 "--raw", str(raw_path), "--output-dir", str(Path(tmp) / mode)],
+                cwd=ROOT, capture_output=True, text=True, check=True,
+            )
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            results.append(result)
+            print(f"   {mode:<9} 최대 RSS {result['peak_rss_mb']:>8,.1f}MB "
+                  f"(기동 {result['baseline_mb']:,.1f}MB)  {result['seconds']:>7.2f}초")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"reviews": args.reviews, "results": results}, indent=2), encoding="utf-8")
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""CLI 기동 시간 벤치마크 - 짧게 끝나는 명령의 지연 예산 + 금지 모듈 검사
+
+    python -m src.benchmarks.startup              # 예산 검사 (위반 시 종료 코드 1)
+    python -m src.benchmarks.startup --repeat 20 --top 15
+
+명령마다 새 인터프리터로 main.py 를 여러 번 실행해 벽시계 시간 중앙값을 재고,
+빈 인터프리터(python -c pass) 중앙값을 뺀 값을 예산과 비교한다. 인터프리터 기동
+자체는 기계마다 크게 달라 예산에서 제외한다. 한 번은 -X importtime 으로 실행해
+누적 임포트 시간 상위 모듈과 금지 모듈(도움말/인자 오류 경로에서 로드되면 안 되는
+rich, requests, yaml, Agent 등) 로드 여부를 함께 보고한다.
+
+render_dispatch 는 설정 로드 → 서브커맨드 분기까지 실제로 거치는 경로(렌더링할 실행이
+없는 render)로, 설정/출력에 필요한 yaml, rich 만 허용한다. 위반이 있으면 종료 코드 1 이라
+CI(.github/workflows/startup.yml)에서 그대로 검사로 쓴다.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .memory import ROOT
+
+# 예산 (ms, 빈 인터프리터 대비 추가 시간)
+STARTUP_BUDGETS = {
+    "help": 80,
+    "serve_help": 80,
+    "shard_help": 80,
+    "render_help": 80,
+    "bad_args": 80,
+    "render_dispatch": 200,
+}
+COMMANDS = {
+    "help": ["--help"],
+    "serve_help": ["serve", "--help"],
+    "shard_help": ["shard", "--help"],
+    "render_help": ["render", "--help"],
+    "bad_args": ["--preset", "bogus"],
+    "render_dispatch": ["render", "--no-index", ".startup-bench-no-runs"],  # 없는 경로 → 실행 0개
+}
+# 명령별로 로드가 허용되는 금지 모듈 (실제 분기 경로는 설정/출력을 위해 필요)
+ALLOWED_MODULES = {
+    "render_dispatch": ("rich", "yaml"),
+}
+# 짧은 명령에서 로드되면 안 되는 모듈 (접두어)
+FORBIDDEN_MODULES = ("rich", "requests", "urllib3", "yaml", "src.agents.", "src.llm", "src.launcher", "src.service")
+DEFAULT_REPEAT = 10
+
+
+def _wall_ms(argv: list[str]) -> float:
+    """명령 1회 실행 시간 (ms, 종료 코드 무시)"""
+    started = time.perf_counter()
+    subprocess.run(argv, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1000
+
+
+def median_ms(argv: list[str], repeat: int) -> float:
+    return statistics.median(_wall_ms(argv) for _ in range(repeat))
+
+
+def import_times(args: list[str]) -> dict[str, int]:
+    """-X importtime 결과 {모듈: 누적 μs}"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def forbidden_loaded(modules, allowed: tuple[str, ...] = ()) -> list[str]:
+    """로드된 금지 모듈 (패키지 단위, allowed 접두어 제외)"""
+    forbidden = [p for p in FORBIDDEN_MODULES if p not in allowed]
+    loaded = {m for m in modules if any(m == p.rstrip(".") or m.startswith(p) for p in forbidden)}
+    return sorted(m for m in loaded if m.rpartition(".")[0] not in loaded)
+
+
+def measure(repeat: int) -> dict:
+    """명령별 기동 시간 + 임포트 분석"""
+    interpreter = median_ms([sys.executable, "-c", "pass"], repeat)
+    preloaded = import_times(["-c", "pass"])  # site 등 인터프리터 기동 시 로드분
+    results = {}
+    for name, args in COMMANDS.items():
+        wall = median_ms([sys.executable, "main.py", *args], repeat)
+        imports = {m: us for m, us in import_times(["main.py", *args]).items() if m not in preloaded}
+        results[name] = {
+            "args": args,
+            "wall_ms": round(wall, 1),
+            "overhead_ms": round(wall - interpreter, 1),
+            "budget_ms": STARTUP_BUDGETS[name],
+            "forbidden": forbidden_loaded(imports, ALLOWED_MODULES.get(name, ())),
+            "imports": imports,
+        }
+    return {"interpreter_ms": round(interpreter, 1), "commands": results}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="CLI 기동 시간 예산 검사")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="명령별 반복 횟수 (중앙값)")
+    parser.add_argument("--top", type=int, default=8, help="출력할 누적 임포트 상위 모듈 수")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = measure(args.repeat)
+    print(f"🐍 빈 인터프리터 {report['interpreter_ms']:.1f}ms (예산에서 제외)\n")
+
+    violations = []
+    for name, r in report["commands"].items():
+        over = r["overhead_ms"] > r["budget_ms"]
+        mark = "❌" if over or r["forbidden"] else "✅"
+        print(f"{mark} {name:<15} {' '.join(r['args']):<45} {r['wall_ms']:>7.1f}ms "
+              f"(+{r['overhead_ms']:.1f}ms / 예산 {r['budget_ms']}ms)")
+        for module, us in sorted(r["imports"].items(), key=lambda kv: -kv[1])[:args.top]:
+            print(f"      {us / 1000:>7.1f}ms  {module}")
+        if over:
+            violations.append(f"{name}: +{r['overhead_ms']:.1f}ms > {r['budget_ms']}ms")
+        if r["forbidden"]:
+            violations.append(f"{name}: 금지 모듈 로드 {', '.join(r['forbidden'])}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n💾 저장: {args.json}")
+
+    if violations:
+        print("\n⚠️ 기동 예산 위반")
+        for v in violations:
+            print(f"   - {v}")
+        sys.exit(1)
+    print("\n✅ 기동 예산 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""코퍼스 저장 형식 벤치마크 - JSONL vs 블록 압축(.vvb) 크기/쓰기/읽기 비교
+
+    python -m src.benchmarks.storage --reviews 1000000
+    python -m src.benchmarks.storage --raw output/raw_reviews.jsonl --codecs gzip,bz2
+
+형식마다 디스크 크기, 쓰기 시간, 순차 읽기(콜드/웜), 레코드 1건 임의 조회 시간을 잰다.
+콜드 읽기는 읽기 직전에 posix_fadvise(DONTNEED) 로 파일의 페이지 캐시를 비운 뒤
+측정한다 (지원하지 않는 플랫폼에서는 웜 읽기와 같다).
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from .corpus import make_corpus
+from ..blockstore import CODECS, BlockFile, block_name, convert, iter_lines
+
+RANDOM_READS = 200
+
+
+def drop_cache(path: Path) -> bool:
+    """파일의 페이지 캐시 비우기 (Linux 등 posix_fadvise 지원 시)"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def _read_all(path: Path) -> tuple[float, int]:
+    started = time.perf_counter()
+    count = sum(1 for line in iter_lines(path) if json.loads(line))
+    return time.perf_counter() - started, count
+
+
+def measure(raw_path: Path, workdir: Path, codecs: list[str], block_records: int) -> list[dict]:
+    results = []
+    for codec in ["none", *codecs]:
+        if codec == "none":
+            path, write_s = raw_path, 0.0
+        else:
+            path = workdir / block_name(f"{raw_path.stem}.{codec}.jsonl")
+            started = time.perf_counter()
+            convert(raw_path, path, codec, block_records)
+            write_s = time.perf_counter() - started
+
+        drop_cache(path)
+        cold_s, count = _read_all(path)
+        warm_s, _ = _read_all(path)
+
+        lookup_ms = None
+        if codec != "none":
+            with BlockFile(path) as bf:
+                picks = random.Random(0).sample(range(len(bf)), min(RANDOM_READS, len(bf)))
+                started = time.perf_counter()
+                for index in picks:
+                    bf.record(index)
+                lookup_ms = (time.perf_counter() - started) / len(picks) * 1000
+
+        results.append({
+            "codec": codec,
+            "records": count,
+            "bytes": path.stat().st_size,
+            "write_s": round(write_s, 2),
+            "cold_read_s": round(cold_s, 2),
+            "warm_read_s": round(warm_s, 2),
+            "lookup_ms": round(lookup_ms, 2) if lookup_ms is not None else None,
+        })
+    return results
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="코퍼스 저장 형식 벤치마크 (JSONL vs .vvb)")
+    parser.add_argument("--reviews", type=int, default=200_000, help="합성 코퍼스 리뷰 수")
+    parser.add_argument("--raw", help="기존 raw_reviews.jsonl 사용 (지정 시 합성 생략)")
+    parser.add_argument("--codecs", default=",".join(CODECS), help=f"비교할 codec ({','.join(CODECS)})")
+    parser.add_argument("--block-records", type=int, default=4096)
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="vv-storagebench-") as tmp:
+        raw_path = Path(args.raw) if args.raw else Path(tmp) / "raw_reviews.jsonl"
+        if not args.raw:
+            print(f"🧪 합성 코퍼스 생성: {args.reviews:,}개 리뷰")
+            make_corpus(raw_path, args.reviews)
+        results = measure(raw_path, Path(tmp), args.codecs.split(","), args.block_records)
+
+    base = results[0]
+    print(f"\n   {'형식':<6} {'크기':>12} {'비율':>6} {'쓰기':>8} {'콜드 읽기':>10} {'웜 읽기':>8} {'1건 조회':>9}")
+    for r in results:
+        lookup = f"{r['lookup_ms']:.2f}ms" if r["lookup_ms"] is not None else "-"
+        print(f"   {r['codec']:<6} {r['bytes'] / 1024 / 1024:>10,.1f}MB {base['bytes'] / r['bytes']:>5.1f}x "
+              f"{r['write_s']:>7.2f}s {r['cold_read_s']:>9.2f}s {r['warm_read_s']:>7.2f}s {lookup:>9}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"reviews": base["records"], "results": results}, indent=2), encoding="utf-8")
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
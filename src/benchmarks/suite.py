@@ -0,0 +1,371 @@
+"""엔드투엔드 벤치마크 - Agent 별/전체 파이프라인 시나리오 + 기준선 회귀 검사
+
+    python -m src.benchmarks.suite                       # quick 프로필 실행 + 저장소 기준선과 비교
+    python -m src.benchmarks.suite --profile full --scenarios tag_rules,pipeline --repeat 5
+    python -m src.benchmarks.suite --save-baseline bench.json   # 이 기계의 기준선 저장
+    python -m src.benchmarks.suite --baseline bench.json        # 같은 기계에서 회귀 검사
+
+실제 Steam/LLM 없이 로컬 스텁만 사용한다. 수집은 src.stubs.steam_server (커서 페이징,
+지연 분산, 429 주입), LLM 은 provider=stub (지연 분포, 429 주입), 입력 코퍼스는
+src.benchmarks.corpus 로 만든다. 시나리오마다 별도 프로세스에서 --repeat 회 실행해
+소요 시간 중앙값 실행의 처리량(items/s), 요청 지연 분위(p50/p95), 최대 RSS 와
+반복 간 편차(spread = (최대-최소)/중앙값)를 보고한다.
+
+    mine        ReviewMiner.collect - 스텁 appreviews 페이징 수집
+    mine_429    ReviewMiner.collect - 429 (Retry-After) 섞인 수집, 재시도 후 누락 없이 모으는지 확인
+    tag_rules   ReviewTagger - 규칙 기반 태깅 (LLM 없음)
+    tag_llm     ReviewTagger - 스텁 LLM 배치 태깅
+    synthesize  PersonaSynthesizer - 스텁 LLM 합성
+    pipeline    mine → tag → synthesize → report (run_pipeline 과 같은 스테이지)
+
+기본 기준선은 저장소의 baseline.json (quick 프로필 중앙값, 측정 기계 정보 포함)이며
+--baseline 을 주지 않아도 해당 프로필이 있으면 비교한다 (--no-baseline 으로 생략).
+처리량이 tolerance 보다 크게 떨어지거나 최대 RSS 가 그만큼 늘면 회귀로 보고 종료 코드 1 을
+돌려준다. 편차가 tolerance 보다 큰 시나리오는 측정이 불안정하므로 회귀 판정에서 경고만 한다.
+기준선은 기계에 종속되므로 측정 기계가 다르면 경고를 함께 출력하며, 성능을 의도적으로
+바꾼 변경은 --save-baseline src/benchmarks/baseline.json 으로 기준선을 갱신해 함께 커밋한다.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from dataclasses import replace
+
+from .corpus import corpus_games, make_corpus
+from .memory import ROOT, peak_rss_mb
+
+SCENARIOS = ("mine", "mine_429", "tag_rules", "tag_llm", "synthesize", "pipeline")
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_REPEAT = 3
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+MACHINE_KEY = "_machine"  # 기준선 파일의 측정 기계 정보 (프로필 이름과 겹치지 않게)
+
+# 프로필별 규모 (quick 도 시나리오당 1초 이상 - 짧은 측정은 기계 잡음에 묻힘, full 은 수백만 건 백필 규모)
+PROFILES = {
+    "quick": {
+        "mine": {"games": 5, "reviews_per_game": 1_000, "latency": 0.01, "jitter": 0.3, "fail_rate": 0.0},
+        "mine_429": {"games": 5, "reviews_per_game": 1_000, "latency": 0.01, "jitter": 0.3,
+                     "fail_rate": 0.2, "retry_after": 0.05},
+        "tag_rules": {"reviews": 100_000},
+        "tag_llm": {"reviews": 4_000, "latency": 0.02, "jitter": 0.3, "fail_rate": 0.0},
+        "synthesize": {"reviews": 150_000, "latency": 0.05, "jitter": 0.0},
+        "pipeline": {"games": 5, "reviews_per_game": 400, "latency": 0.01, "llm_latency": 0.02},
+    },
+    "full": {
+        "mine": {"games": 5, "reviews_per_game": 2_000, "latency": 0.02, "jitter": 0.8, "fail_rate": 0.0},
+        "mine_429": {"games": 5, "reviews_per_game": 2_000, "latency": 0.02, "jitter": 0.8,
+                     "fail_rate": 0.1, "retry_after": 0.2},
+        "tag_rules": {"reviews": 1_000_000},
+        "tag_llm": {"reviews": 20_000, "latency": 0.2, "jitter": 0.8, "fail_rate": 0.02},
+        "synthesize": {"reviews": 300_000, "latency": 0.5, "jitter": 0.0},
+        "pipeline": {"games": 5, "reviews_per_game": 300, "latency": 0.02, "llm_latency": 0.2},
+    },
+}
+
+IDEA = "3분 안에 끝나는 소규모 라운드 기반 슈터"
+GENRE = "shooter"
+
+
+def _quantiles(values: list[float]) -> dict:
+    """지연 분위 (ms)"""
+    if not values:
+        return {}
+    values = sorted(values)
+    pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+    return {"p50_ms": round(pick(0.5) * 1000, 2), "p95_ms": round(pick(0.95) * 1000, 2)}
+
+
+def _span_latency(name: str) -> dict:
+    from ..tracing import tracer
+    return _quantiles([s.duration_us / 1e6 for s in tracer.spans if s.name == name])
+
+
+def _count_lines(path: Path) -> int:
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def _stub_client(latency: float, jitter: float = 0.0, fail_rate: float = 0.0):
+    """스텁 LLM 클라이언트 (한도는 측정에 끼어들지 않도록 넉넉하게)"""
+    from ..llm import LLMClient
+    return LLMClient(
+        provider="stub",
+        limits={"default": {"rpm": 10 ** 6, "tpm": 10 ** 9}},
+        stub_options={"latency": latency, "jitter": jitter, "fail_rate": fail_rate, "seed": 0},
+    )
+
+
+def _base_config(workdir: Path):
+    from ..config import load_config
+    config = load_config(str(ROOT / "config.yaml"))
+    return replace(
+        config, output_dir=workdir, budget={}, deadline_s=0, offline_workers=0,
+        steam_page_delay=0, llm_provider="stub",
+    )
+
+
+def _scenario_mine(workdir: Path, scale: dict) -> dict:
+    from ..agents import ReviewMiner
+    from ..stubs.steam_server import start_server, base_url
+    from ..tracing import tracer
+
+    server = start_server(
+        latency=scale["latency"], jitter=scale["jitter"], fail_rate=scale["fail_rate"],
+        retry_after=scale.get("retry_after", 1), seed=0,
+    )
+    config = replace(
+        _base_config(workdir), steam_base_url=base_url(server),
+        reviews_per_game=scale["reviews_per_game"], language="all",
+    )
+    try:
+        started = time.perf_counter()
+        miner = ReviewMiner(config)
+        path = miner.collect(corpus_games(scale["games"]))
+        seconds = time.perf_counter() - started
+    finally:
+        server.shutdown()
+    counters = server.RequestHandlerClass.counters
+    items = _count_lines(path)
+    if not miner.complete or items != scale["games"] * scale["reviews_per_game"]:
+        raise RuntimeError(f"수집 누락: {items}개, 오류 {miner.errors}")
+    return {
+        "seconds": seconds, "items": items, **_span_latency("steam.request"),
+        "requests": counters["requests"], "throttled": counters["throttled"],
+        "retries": int(tracer.counters.get("http.retries", 0)),
+    }
+
+
+def _scenario_tag_rules(workdir: Path, scale: dict) -> dict:
+    from ..agents import ReviewTagger
+
+    raw_path = make_corpus(workdir / "raw_reviews.jsonl", scale["reviews"])
+    config = _base_config(workdir)
+    started = time.perf_counter()
+    ReviewTagger(config).tag_reviews(raw_path)
+    return {"seconds": time.perf_counter() - started, "items": scale["reviews"]}
+
+
+def _scenario_tag_llm(workdir: Path, scale: dict) -> dict:
+    from ..agents import ReviewTagger
+
+    raw_path = make_corpus(workdir / "raw_reviews.jsonl", scale["reviews"])
+    client = _stub_client(scale["latency"], scale["jitter"], scale["fail_rate"])
+    started = time.perf_counter()
+    ReviewTagger(_base_config(workdir), client).tag_reviews(raw_path)
+    seconds = time.perf_counter() - started
+    usage = next(iter(client.usage().values()), {})
+    return {
+        "seconds": seconds, "items": scale["reviews"], **_span_latency("llm.request"),
+        "llm_calls": usage.get("calls", 0), "llm_retries": usage.get("retries", 0),
+    }
+
+
+def _scenario_synthesize(workdir: Path, scale: dict) -> dict:
+    from ..agents import ReviewTagger, PersonaSynthesizer
+
+    config = _base_config(workdir)
+    raw_path = make_corpus(workdir / "raw_reviews.jsonl", scale["reviews"])
+    tagged_path = ReviewTagger(config).tag_reviews(raw_path)  # 준비 단계 (측정 제외)
+    client = _stub_client(scale["latency"], scale["jitter"])
+    started = time.perf_counter()
+    PersonaSynthesizer(config, client).synthesize(tagged_path, IDEA, GENRE)
+    return {"seconds": time.perf_counter() - started, "items": scale["reviews"], **_span_latency("llm.request")}
+
+
+def _scenario_pipeline(workdir: Path, scale: dict) -> dict:
+    from ..pipeline import build_stages, StageRunner, MANIFEST_FILE
+    from ..stubs.steam_server import start_server, base_url
+
+    server = start_server(latency=scale["latency"])
+    config = replace(
+        _base_config(workdir), steam_base_url=base_url(server),
+        reviews_per_game=scale["reviews_per_game"], language="all",
+    )
+    client = _stub_client(scale["llm_latency"])
+    competitors = corpus_games(scale["games"])
+    try:
+        started = time.perf_counter()
+        stages = build_stages(config, IDEA, GENRE, competitors, client, refresh_corpus=True)
+        results = StageRunner(config.output_dir / MANIFEST_FILE, announce=lambda stage: None).run(stages)
+        seconds = time.perf_counter() - started
+    finally:
+        server.shutdown()
+    return {
+        "seconds": seconds, "items": _count_lines(results["mine"]),
+        **{f"{name}_{k}": v for name in ("steam.request", "llm.request") for k, v in _span_latency(name).items()},
+    }
+
+
+RUNNERS = {
+    "mine": _scenario_mine,
+    "mine_429": _scenario_mine,
+    "tag_rules": _scenario_tag_rules,
+    "tag_llm": _scenario_tag_llm,
+    "synthesize": _scenario_synthesize,
+    "pipeline": _scenario_pipeline,
+}
+
+
+def run_scenario(name: str, profile: str, workdir: Path) -> dict:
+    """시나리오 1개 실행 (벤치마크 자식 프로세스에서 호출)"""
+    from ..tracing import tracer
+
+    tracer.enabled = True  # 요청 지연 분위 (steam.request, llm.request 스팬)
+    workdir.mkdir(parents=True, exist_ok=True)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        result = RUNNERS[name](workdir, PROFILES[profile][name])
+    seconds = result.pop("seconds")
+    return {
+        "scenario": name,
+        "seconds": round(seconds, 3),
+        "items": result.pop("items"),
+        **result,
+    }
+
+
+def _finish(result: dict) -> dict:
+    """처리량 계산 + 최대 RSS 기록"""
+    result["throughput"] = round(result["items"] / result["seconds"], 1) if result["seconds"] else 0.0
+    result["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return result
+
+
+def aggregate(runs: list[dict]) -> dict:
+    """반복 실행 결과 → 소요 시간 중앙값 실행 + 최대 RSS 중앙값 + 편차"""
+    ordered = sorted(runs, key=lambda r: r["seconds"])
+    result = dict(ordered[len(ordered) // 2])
+    result["peak_rss_mb"] = round(statistics.median(r["peak_rss_mb"] for r in runs), 1)
+    result["repeat"] = len(runs)
+    result["spread"] = round((ordered[-1]["seconds"] - ordered[0]["seconds"]) / result["seconds"], 3) if result["seconds"] else 0.0
+    return result
+
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> tuple[list[str], list[str]]:
+    """기준선 대비 (회귀 목록, 불안정 경고 목록) - 처리량 하락 / 최대 RSS 증가"""
+    regressions, unstable = [], []
+    for result in results:
+        base = baseline.get(result["scenario"])
+        if not base:
+            continue
+        if result["throughput"] < base["throughput"] * (1 - tolerance):
+            line = f"{result['scenario']}: 처리량 {result['throughput']:,.1f}/s < 기준 {base['throughput']:,.1f}/s"
+            # 반복 간 편차가 허용 범위보다 크면 측정 잡음일 수 있어 회귀로 판정하지 않음
+            if result.get("spread", 0) > tolerance:
+                unstable.append(f"{line} (편차 {result['spread']:.0%})")
+            else:
+                regressions.append(line)
+        if result["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{result['scenario']}: 최대 RSS {result['peak_rss_mb']:,.1f}MB > 기준 {base['peak_rss_mb']:,.1f}MB"
+            )
+    return regressions, unstable
+
+
+def machine_info() -> dict:
+    """기준선 비교용 기계 정보"""
+    return {
+        "platform": sys.platform,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def _run_child(name: str, profile: str, workdir: Path) -> dict:
+    """시나리오 1회 (새 프로세스 - ru_maxrss 는 프로세스 수명 동안의 최댓값)"""
+    proc = subprocess.run(
+        [sys.executable, "-m", "src.benchmarks.suite", "--run", name,
+         "--profile", profile, "--workdir", str(workdir)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+        sys.exit(f"❌ {name} 실패")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="엔드투엔드 벤치마크 (스텁 Steam/LLM)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"실행할 시나리오 ({','.join(SCENARIOS)})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="시나리오별 반복 횟수 (중앙값)")
+    parser.add_argument("--baseline", help=f"비교할 기준선 JSON (기본: {DEFAULT_BASELINE.relative_to(ROOT)})")
+    parser.add_argument("--no-baseline", action="store_true", help="기준선 비교 생략")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="허용 변화율 (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="결과를 기준선으로 저장")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    parser.add_argument("--run", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run:
+        print(json.dumps(_finish(run_scenario(args.run, args.profile, Path(args.workdir)))))
+        return
+
+    print(f"🧪 벤치마크 ({args.profile}, 시나리오별 {args.repeat}회 중앙값)")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="vv-bench-") as tmp:
+        for name in args.scenarios.split(","):
+            runs = [_run_child(name, args.profile, Path(tmp) / f"{name}-{i}") for i in range(args.repeat)]
+            result = aggregate(runs)
+            results.append(result)
+            latency = f"  p50 {result['p50_ms']:.1f}ms / p95 {result['p95_ms']:.1f}ms" if "p50_ms" in result else ""
+            throttled = f"  429 {result['throttled']}회" if result.get("throttled") else ""
+            print(f"   {name:<10} {result['items']:>9,}개 {result['seconds']:>8.2f}초 "
+                  f"{result['throughput']:>11,.1f}/s (±{result['spread']:.0%})  "
+                  f"최대 RSS {result['peak_rss_mb']:>7,.1f}MB{latency}{throttled}")
+
+    report = {"profile": args.profile, "repeat": args.repeat, "results": results}
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n💾 저장: {args.json}")
+
+    if args.save_baseline:
+        baseline_path = Path(args.save_baseline)
+        stored = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+        stored[MACHINE_KEY] = machine_info()
+        profile = stored.setdefault(args.profile, {})
+        for result in results:
+            profile[result["scenario"]] = {k: result[k] for k in ("throughput", "peak_rss_mb")}
+        baseline_path.write_text(json.dumps(stored, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n💾 기준선 저장: {baseline_path}")
+        return
+
+    if args.no_baseline:
+        return
+    baseline_path = Path(args.baseline) if args.baseline else DEFAULT_BASELINE
+    if not baseline_path.exists():
+        if args.baseline:
+            sys.exit(f"❌ 기준선 파일 없음: {baseline_path}")
+        return
+    stored = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline = stored.get(args.profile)
+    if not baseline:
+        if args.baseline:
+            sys.exit(f"❌ 기준선에 {args.profile} 프로필 없음: {baseline_path}")
+        print(f"\nℹ️ 기준선에 {args.profile} 프로필 없음 - 비교 생략 ({baseline_path})")
+        return
+    print(f"\n📏 기준선: {baseline_path}")
+    measured_on = stored.get(MACHINE_KEY)
+    if measured_on and measured_on != machine_info():
+        print(f"   ⚠️ 다른 기계에서 측정한 기준선 ({measured_on}) - 회귀는 같은 기계 기준선으로 확인")
+    regressions, unstable = compare(results, baseline, args.tolerance)
+    for line in unstable:
+        print(f"   ⚠️ 불안정 측정 - {line}")
+    if regressions:
+        print(f"\n❌ 성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+        for line in regressions:
+            print(f"   - {line}")
+        sys.exit(1)
+    print(f"\n✅ 기준선 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
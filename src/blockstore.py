@@ -0,0 +1,320 @@
+"""블록 압축 코퍼스 - 독립 압축 블록 + 블록 인덱스 (.vvb)
+
+raw/tagged JSONL 을 레코드 N 개 단위 블록으로 나눠 블록마다 따로 압축한다
+(표준 라이브러리 gzip / lzma / bz2). 블록끼리 의존하지 않으므로 처음부터 순서대로
+풀어 읽을 수도, 인덱스로 블록 하나만 바로 찾아 풀 수도 있다. 블록 안의 내용은
+원래 JSONL 줄 그대로이고 레코드 순서도 같다 (raw_index = 레코드 번호).
+
+    storage:
+      codec: gzip            # none | gzip | lzma | bz2
+      block_records: 4096
+
+codec 을 켜면 raw/tagged 파일이 .vvb 로 저장되고, 읽는 쪽은 매직 바이트로 형식을
+판별하므로 JSONL 과 .vvb 를 구분하지 않는다.
+
+    with corpus_writer(path, "gzip") as f:   # atomic_write 와 같은 f.write(line)
+        f.write(json.dumps(review) + "\\n")
+    for line in iter_lines(path): ...        # JSONL / .vvb 모두
+    with BlockFile(path) as bf:
+        bf.record(1234)                      # 블록 1개만 풀어서 조회
+
+파일 구성 (리틀 엔디언):
+    header   MAGIC, codec
+    blocks   압축 블록 (각각 독립적으로 풀 수 있음)
+    index    JSON {codec, records, raw_bytes, blocks: [[offset, length, records, raw_len]]}
+    footer   index 오프셋, index 길이, MAGIC
+"""
+import bisect
+import json
+import os
+import struct
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+from .workspace import atomic_write
+
+BLOCK_SUFFIX = ".vvb"
+MAGIC = b"VVBLOCK1"
+CODECS = ("gzip", "lzma", "bz2")
+DEFAULT_CODEC = "gzip"
+DEFAULT_BLOCK_RECORDS = 4096
+
+HEADER = struct.Struct("<8sB")  # magic, codec 번호 (CODECS 순서 + 1)
+FOOTER = struct.Struct("<QQ8s")  # index 오프셋, index 길이, magic
+
+
+class Block(NamedTuple):
+    offset: int
+    length: int
+    records: int
+    raw_len: int
+
+
+def _codec(name: str):
+    """codec 이름 → (compress, decompress)"""
+    if name == "gzip":
+        import gzip
+        return (lambda data: gzip.compress(data, compresslevel=6, mtime=0)), gzip.decompress
+    if name == "lzma":
+        import lzma
+        return (lambda data: lzma.compress(data, preset=3)), lzma.decompress
+    if name == "bz2":
+        import bz2
+        return (lambda data: bz2.compress(data, 9)), bz2.decompress
+    raise ValueError(f"알 수 없는 codec: {name} (가능: {', '.join(CODECS)})")
+
+
+def block_name(filename: str) -> str:
+    """raw_reviews.jsonl → raw_reviews.vvb"""
+    return str(Path(filename).with_suffix(BLOCK_SUFFIX))
+
+
+def is_block_path(path: Path) -> bool:
+    """쓰기 형식 판별 (확장자)"""
+    return Path(path).suffix == BLOCK_SUFFIX
+
+
+def is_block_file(path: Path) -> bool:
+    """읽기 형식 판별 (매직 바이트)"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class BlockWriter:
+    """텍스트 파일처럼 write(줄) 를 받아 레코드 블록 단위로 압축 기록"""
+
+    def __init__(self, f, codec: str = DEFAULT_CODEC, block_records: int = DEFAULT_BLOCK_RECORDS):
+        self._f = f
+        self.codec = codec
+        self._compress, _ = _codec(codec)
+        self.block_records = max(1, block_records)
+        self.blocks: list[Block] = []
+        self.records = 0
+        self.raw_bytes = 0
+        self._lines: list[bytes] = []
+        self._partial = b""
+        self._offset = HEADER.size
+        f.write(HEADER.pack(MAGIC, CODECS.index(codec) + 1))
+
+    def write(self, data) -> int:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self._lines.append(line)
+                if len(self._lines) >= self.block_records:
+                    self._flush_block()
+        return len(data)
+
+    def _flush_block(self) -> None:
+        if not self._lines:
+            return
+        raw = b"\n".join(self._lines) + b"\n"
+        compressed = self._compress(raw)
+        self._f.write(compressed)
+        self.blocks.append(Block(self._offset, len(compressed), len(self._lines), len(raw)))
+        self._offset += len(compressed)
+        self.records += len(self._lines)
+        self.raw_bytes += len(raw)
+        self._lines = []
+
+    def close(self) -> None:
+        """남은 블록 + 인덱스 + footer 기록"""
+        if self._partial.strip():
+            self._lines.append(self._partial)
+        self._partial = b""
+        self._flush_block()
+        index = json.dumps({
+            "codec": self.codec,
+            "records": self.records,
+            "raw_bytes": self.raw_bytes,
+            "blocks": [list(b) for b in self.blocks],
+        }, ensure_ascii=False).encode("utf-8")
+        self._f.write(index)
+        self._f.write(FOOTER.pack(self._offset, len(index), MAGIC))
+
+
+@contextmanager
+def corpus_writer(path: Path, codec: str = "none", block_records: int = DEFAULT_BLOCK_RECORDS):
+    """코퍼스 쓰기 (.vvb 경로면 블록 압축, 아니면 JSONL) - 원자적, f.write(줄) 인터페이스"""
+    if not is_block_path(path):
+        with atomic_write(path) as f:
+            yield f
+        return
+    with atomic_write(path, "wb") as f:
+        writer = BlockWriter(f, codec if codec in CODECS else DEFAULT_CODEC, block_records)
+        yield writer
+        writer.close()
+
+
+class BlockFile:
+    """읽기 전용 .vvb (순차 스트리밍 / 블록 단위 임의 접근)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            magic, codec_id = HEADER.unpack(self._file.read(HEADER.size))
+            self._file.seek(-FOOTER.size, os.SEEK_END)
+            index_off, index_len, tail = FOOTER.unpack(self._file.read(FOOTER.size))
+            if magic != MAGIC or tail != MAGIC:
+                raise ValueError(f"블록 코퍼스가 아니거나 쓰기가 끝나지 않은 파일: {self.path}")
+            self._file.seek(index_off)
+            index = json.loads(self._file.read(index_len))
+        except Exception:
+            self._file.close()
+            raise
+        self.codec = CODECS[codec_id - 1]
+        _, self._decompress = _codec(self.codec)
+        self.blocks = [Block(*b[:4]) for b in index["blocks"]]  # 이전 인덱스의 추가 필드는 무시
+        self.records = index["records"]
+        self.raw_bytes = index["raw_bytes"]
+        # 블록별 첫 레코드 번호 (record → block 이분 탐색)
+        self._starts = []
+        start = 0
+        for b in self.blocks:
+            self._starts.append(start)
+            start += b.records
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "BlockFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.records
+
+    def read_block(self, i: int) -> bytes:
+        """블록 1개 압축 해제 (JSONL 바이트)"""
+        block = self.blocks[i]
+        self._file.seek(block.offset)
+        return self._decompress(self._file.read(block.length))
+
+    def block_lines(self, i: int) -> list[bytes]:
+        return self.read_block(i).split(b"\n")[:-1]
+
+    def iter_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """블록 [start, end) 의 줄 순회 (메모리 = 블록 1개)"""
+        for i in range(start, len(self.blocks) if end is None else end):
+            yield from self.block_lines(i)
+
+    def block_of(self, record: int) -> int:
+        """레코드 번호 → 블록 번호"""
+        if not 0 <= record < self.records:
+            raise IndexError(record)
+        return bisect.bisect_right(self._starts, record) - 1
+
+    def record(self, index: int) -> dict:
+        """레코드 번호로 1건 조회 (해당 블록만 압축 해제)"""
+        i = self.block_of(index)
+        return json.loads(self.block_lines(i)[index - self._starts[i]])
+
+
+def iter_lines(path: Path) -> Iterator[bytes]:
+    """비어 있지 않은 JSONL 줄 순회 (JSONL / .vvb 자동 판별)"""
+    if is_block_file(path):
+        with BlockFile(path) as bf:
+            yield from bf.iter_lines()
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def count_lines(path: Path) -> int:
+    """레코드 수 (.vvb 는 인덱스에서, 압축 해제 없음)"""
+    if is_block_file(path):
+        with BlockFile(path) as bf:
+            return bf.records
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def data_size(path: Path) -> int:
+    """압축 해제 기준 크기 (병렬 처리 기준용)"""
+    if is_block_file(path):
+        with BlockFile(path) as bf:
+            return bf.raw_bytes
+    return Path(path).stat().st_size
+
+
+def split_blocks(path: Path, n: int) -> list[tuple[int, int]]:
+    """블록을 최대 n 개의 [start, end) 블록 구간으로 분할 (압축 전 크기 기준 균등)"""
+    with BlockFile(path) as bf:
+        sizes = [b.raw_len for b in bf.blocks]
+    if not sizes:
+        return []
+    total = sum(sizes)
+    bounds, acc = [0], 0
+    for i, size in enumerate(sizes[:-1], 1):
+        acc += size
+        if acc * n >= total * len(bounds):
+            bounds.append(i)
+    bounds.append(len(sizes))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def convert(src: Path, dst: Path, codec: str = DEFAULT_CODEC, block_records: int = DEFAULT_BLOCK_RECORDS) -> Path:
+    """JSONL ↔ .vvb 변환 (dst 확장자로 형식 결정)"""
+    with corpus_writer(dst, codec, block_records) as out:
+        for line in iter_lines(src):
+            out.write(line if is_block_path(dst) else line.decode("utf-8").rstrip("\n") + "\n")
+    return Path(dst)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """python -m src.blockstore pack|unpack|info|get ..."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="블록 압축 코퍼스 (.vvb)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_pack = sub.add_parser("pack", help="JSONL → .vvb")
+    p_pack.add_argument("src")
+    p_pack.add_argument("--out")
+    p_pack.add_argument("--codec", choices=CODECS, default=DEFAULT_CODEC)
+    p_pack.add_argument("--block-records", type=int, default=DEFAULT_BLOCK_RECORDS)
+    p_unpack = sub.add_parser("unpack", help=".vvb → JSONL")
+    p_unpack.add_argument("src")
+    p_unpack.add_argument("--out")
+    p_info = sub.add_parser("info", help="블록 인덱스 요약")
+    p_info.add_argument("path")
+    p_get = sub.add_parser("get", help="레코드 번호(raw_index)로 조회")
+    p_get.add_argument("path")
+    p_get.add_argument("index", type=int, nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        out = Path(args.out) if args.out else Path(block_name(args.src))
+        convert(Path(args.src), out, args.codec, args.block_records)
+        src_size, out_size = os.path.getsize(args.src), os.path.getsize(out)
+        print(f"💾 {out} ({src_size:,} → {out_size:,} bytes, {src_size / max(out_size, 1):.1f}배 압축)")
+    elif args.command == "unpack":
+        out = Path(args.out) if args.out else Path(args.src).with_suffix(".jsonl")
+        convert(Path(args.src), out)
+        print(f"💾 {out} ({os.path.getsize(out):,} bytes)")
+    elif args.command == "info":
+        with BlockFile(Path(args.path)) as bf:
+            size = os.path.getsize(args.path)
+            print(f"{bf.path}: {bf.codec}, {bf.records:,}개 레코드 / {len(bf.blocks)}개 블록, "
+                  f"{bf.raw_bytes:,} → {size:,} bytes ({bf.raw_bytes / max(size, 1):.1f}배)")
+            for i, b in enumerate(bf.blocks):
+                print(f"   #{i:<5} @{b.offset:<12,} {b.records:>6}개 {b.length:>10,} bytes")
+    else:
+        with BlockFile(Path(args.path)) as bf:
+            for index in args.index:
+                print(json.dumps(bf.record(index), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""실행 예산 - 프리셋별 시간/LLM 토큰/HTTP 요청 한도 + 자동 품질 하향
+
+파이프라인 실행 중 사용량을 실시간으로 집계하고, 한도를 넘을 것 같으면
+단계별로 품질을 낮춘다. 모든 하향 결정은 budget.json 과 리포트에 남는다.
+
+    mine        예상 페이지/시간이 한도를 넘으면 게임당 리뷰 수 축소, 수집 중 소진 시 페이징 중단
+    tag         남은 토큰/시간이 배치 1개 분량보다 적으면 나머지를 규칙 기반 태깅으로 전환
+    synthesize  토큰이 빠듯하면 인용 수 축소, 부족하면 프레임워크 기반 합성
+
+마감 모드(--deadline)에서는 태깅을 정보량 높은 리뷰부터 진행하고, 합성/리포트 몫의
+시간만 남으면 태깅을 멈춘 뒤 부분 코퍼스로 합성하며 커버리지를 리포트에 남긴다.
+
+Agent 는 current_budget() 으로 현재 실행의 예산을 조회한다 (없으면 None = 무제한).
+"""
+import contextvars
+import json
+import math
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Optional
+
+from .config import Config
+from .workspace import atomic_write
+
+BUDGET_FILE = "budget.json"
+KINDS = ("time_s", "llm_tokens", "http_requests")
+
+# 시간 배분 (전체 한도 대비)
+MINE_TIME_SHARE = 0.4
+FINAL_RESERVE_SHARE = 0.15  # 합성 + 리포트 몫
+
+MINE_SECONDS_PER_PAGE = 1.5  # rate-limit sleep 1초 + 응답
+MIN_REVIEWS_PER_GAME = 10
+SYNTHESIS_TOKEN_RESERVE = 8000
+REDUCED_QUOTES = 3
+
+_current: contextvars.ContextVar[Optional["Budget"]] = contextvars.ContextVar("budget", default=None)
+
+
+def current_budget() -> Optional["Budget"]:
+    """현재 실행의 예산 (없으면 None)"""
+    return _current.get()
+
+
+def charge(kind: str, amount: float = 1) -> None:
+    """현재 예산에 사용량 반영 (예산이 없으면 무시)"""
+    budget = _current.get()
+    if budget is not None:
+        budget.charge(kind, amount)
+
+
+class Budget:
+    """실행 1회의 예산 + 하향 결정 기록"""
+
+    def __init__(self, limits: dict, path: Optional[Path] = None, deadline: bool = False):
+        self.limits = {k: float(limits.get(k) or 0) for k in KINDS}  # 0 = 무제한
+        self.used = {k: 0.0 for k in KINDS}
+        self.path = Path(path) if path else None
+        self.deadline = deadline  # 마감 모드: 시간 소진 시 하향 대신 부분 결과로 마감
+        self.decisions: list[dict] = []
+        self.coverage: Optional[dict] = None
+        self._started = time.monotonic()
+
+        # 건너뛴 스테이지의 산출물은 이전 결정의 결과이므로 기록 유지
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    previous = json.load(f)
+                self.decisions = [{**d, "previous": True} for d in previous.get("decisions", [])]
+                self.coverage = previous.get("coverage")
+            except (json.JSONDecodeError, OSError):
+                pass
+
+    # ── 사용량 ───────────────────────────────────────────────
+
+    def charge(self, kind: str, amount: float = 1) -> None:
+        self.used[kind] += amount
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def remaining(self, kind: str) -> float:
+        """남은 양 (무제한이면 inf)"""
+        if not self.limits[kind]:
+            return math.inf
+        used = self.elapsed() if kind == "time_s" else self.used[kind]
+        return self.limits[kind] - used
+
+    def time_left_for(self, reserve_share: float) -> float:
+        """후속 단계 몫을 남긴 사용 가능 시간"""
+        return self.remaining("time_s") - self.limits["time_s"] * reserve_share
+
+    # ── 결정 기록 ────────────────────────────────────────────
+
+    def begin_stage(self, stage: str) -> None:
+        """스테이지 재실행 시 해당 스테이지의 이전 결정 제거"""
+        self.decisions = [d for d in self.decisions if not (d["stage"] == stage and d.get("previous"))]
+        if stage == "tag":
+            self.coverage = None
+        self.save()
+
+    def degrade(self, stage: str, action: str, reason: str) -> None:
+        """품질 하향 결정 기록 (같은 스테이지/행동은 1회)"""
+        if any(d["stage"] == stage and d["action"] == action and not d.get("previous") for d in self.decisions):
+            return
+        self.decisions = [d for d in self.decisions if not (d["stage"] == stage and d["action"] == action)]
+        self.decisions.append({
+            "stage": stage,
+            "action": action,
+            "reason": reason,
+            "at_s": round(self.elapsed(), 1),
+        })
+        print(f"   ⚠️ 예산 하향 [{stage}] {action} - {reason}")
+        self.save()
+
+    def set_coverage(self, tagged_count: int, totals: dict[str, int], tagged_by_game: dict[str, int]) -> None:
+        """마감 모드 태깅 커버리지 (전체/게임별)"""
+        self.coverage = {
+            "tagged": tagged_count,
+            "total": sum(totals.values()),
+            "by_game": {game: [tagged_by_game.get(game, 0), total] for game, total in totals.items()},
+        }
+        self.save()
+
+    def snapshot(self) -> dict:
+        used = {**self.used, "time_s": round(self.elapsed(), 1)}
+        snapshot = {"limits": self.limits, "used": used, "decisions": self.decisions}
+        if self.coverage is not None:
+            snapshot["coverage"] = self.coverage
+        return snapshot
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with atomic_write(self.path) as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+    @contextmanager
+    def activate(self):
+        """with 블록 안에서 current_budget() 이 이 예산을 반환"""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    # ── 단계별 계획 ──────────────────────────────────────────
+
+    def plan_mining(self, config: Config, competitors: list[dict]) -> Config:
+        """예상 페이지 수/시간이 한도를 넘으면 게임당 리뷰 수 축소"""
+        def pages(per_game: int) -> int:
+            pos = int(per_game * config.sentiment_ratio)
+            return len(competitors) * (math.ceil(pos / 100) + math.ceil((per_game - pos) / 100))
+
+        allowed_pages = min(
+            self.limits["http_requests"] or math.inf,
+            (self.limits["time_s"] * MINE_TIME_SHARE / MINE_SECONDS_PER_PAGE) if self.limits["time_s"] else math.inf,
+        )
+        # 페이지 수가 실제로 줄어드는 동안만 절반씩 축소 (나머지는 수집 중 중단으로 처리)
+        per_game = config.reviews_per_game
+        while pages(per_game) > allowed_pages:
+            smaller = max(MIN_REVIEWS_PER_GAME, per_game // 2)
+            if pages(smaller) >= pages(per_game):
+                break
+            per_game = smaller
+
+        if per_game == config.reviews_per_game:
+            return config
+        self.degrade(
+            "mine", f"리뷰 수 {config.reviews_per_game} → {per_game}/게임",
+            f"예상 {pages(config.reviews_per_game)}페이지 > 허용 {int(allowed_pages)}페이지",
+        )
+        return replace(config, reviews_per_game=per_game)
+
+    def mining_exhausted(self) -> bool:
+        """수집 중단 여부 (HTTP 소진 또는 수집 시간 몫 초과)"""
+        if self.remaining("http_requests") <= 0:
+            self.degrade("mine", "수집 중단", f"HTTP 요청 한도 {int(self.limits['http_requests'])}회 소진")
+            return True
+        if self.limits["time_s"] and self.elapsed() > self.limits["time_s"] * MINE_TIME_SHARE:
+            self.degrade("mine", "수집 중단", f"수집 시간 몫 {self.limits['time_s'] * MINE_TIME_SHARE:.0f}초 초과")
+            return True
+        return False
+
+    def deadline_reached(self, est_seconds: float) -> bool:
+        """다음 작업(est_seconds)을 하면 합성/리포트 몫을 침범하는지"""
+        return self.time_left_for(FINAL_RESERVE_SHARE) < est_seconds
+
+    def allow_llm_batch(self, est_tokens: float, est_seconds: float) -> bool:
+        """다음 태깅 배치를 LLM 으로 처리할 여유가 있는지 (없으면 규칙 기반 전환 기록)"""
+        tokens_left = self.remaining("llm_tokens") - SYNTHESIS_TOKEN_RESERVE
+        if est_tokens > tokens_left:
+            self.degrade("tag", "규칙 기반 태깅 전환", f"남은 토큰 {max(0, int(tokens_left))} < 배치 예상 {int(est_tokens)}")
+            return False
+        time_left = self.time_left_for(FINAL_RESERVE_SHARE)
+        if est_seconds > time_left:
+            self.degrade("tag", "규칙 기반 태깅 전환", f"남은 시간 {max(0.0, time_left):.0f}초 < 배치 예상 {est_seconds:.0f}초")
+            return False
+        return True
+
+    def synthesis_mode(self, est_tokens: float) -> str:
+        """full | fewer_quotes | framework"""
+        tokens_left = self.remaining("llm_tokens")
+        if est_tokens > tokens_left or self.remaining("time_s") <= 0:
+            self.degrade("synthesize", "프레임워크 기반 합성", f"남은 토큰 {max(0, int(tokens_left))} / 시간 {max(0.0, self.remaining('time_s')):.0f}초")
+            return "framework"
+        if est_tokens * 2 > tokens_left:
+            self.degrade("synthesize", f"인용 {REDUCED_QUOTES}개로 축소", f"남은 토큰 {int(tokens_left)} < 예상 {int(est_tokens)}의 2배")
+            return "fewer_quotes"
+        return "full"
+
+
+def budget_for(config: Config) -> Optional[Budget]:
+    """설정의 예산으로 Budget 생성 (모든 한도가 0 이면 None)
+
+    config.deadline_s 가 있으면 시간 한도를 마감 시간으로 줄이고 마감 모드로 실행한다.
+    """
+    limits = dict(config.budget)
+    if config.deadline_s:
+        limits["time_s"] = min(limits.get("time_s") or math.inf, config.deadline_s)
+    if not any(limits.get(k) for k in KINDS):
+        return None
+    return Budget(limits, config.output_dir / BUDGET_FILE, deadline=bool(config.deadline_s))
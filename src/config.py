@@ -1,7 +1,6 @@
 """설정 로더 - 프리셋 기반 + 오버라이드"""
-import yaml
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 PRESETS = {
@@ -11,6 +10,7 @@ PRESETS = {
         "analysis_model": "claude-3.5-sonnet",
         "merge_agents": True,
         "batch_size": 30,
+        "budget": {"time_s": 120, "llm_tokens": 150000, "http_requests": 60},
     },
     "standard": {
         "reviews_per_game": 100,
@@ -18,6 +18,7 @@ PRESETS = {
         "analysis_model": "claude-3.5-sonnet",
         "merge_agents": True,  # C+D 병합
         "batch_size": 50,
+        "budget": {"time_s": 600, "llm_tokens": 1000000, "http_requests": 300},
     },
     "detailed": {
         "reviews_per_game": 300,
@@ -25,6 +26,7 @@ PRESETS = {
         "analysis_model": "gpt-4o",
         "merge_agents": False,
         "batch_size": 50,
+        "budget": {"time_s": 1800, "llm_tokens": 4000000, "http_requests": 1000},
     },
 }
 
@@ -52,37 +54,127 @@ class Config:
     tagged_reviews_file: str
     personas_file: str
     report_file: str
+    stats_file: str = "stats.json"  # 리뷰 통계 (render 명령이 재집계 없이 사용)
+    
+    # Steam API 엔드포인트 (로컬 스텁/미러 사용 시)
+    steam_base_url: str = ""
+    steam_page_delay: float = 1.0  # 페이지 요청 간 대기 (초, Steam rate limit)
+    
+    # 실행 단위 작업공간 (workspace.scoped_config 로 설정)
+    run_id: str = ""
+    shared_dir: Optional[Path] = None  # 실행 간 공유 영역 (코퍼스, 락)
+    offline_workers: int = 0  # LLM 없는 태깅/통계의 프로세스 수 (0, 1 = 직렬)
+    
+    # 코퍼스 저장 형식 (src/blockstore.py) - none 이면 JSONL, 그 외는 블록 압축 .vvb
+    storage_codec: str = "none"  # none | gzip | lzma | bz2
+    storage_block_records: int = 4096
+    corpus_ttl_days: int = 1  # 공유 코퍼스 재사용 기간 (일 단위 버킷, 0 = 만료 없음)
+    
+    # LLM 클라이언트 (src/llm.py)
+    llm_provider: str = "none"  # auto | openai | anthropic | gemini | stub | none
+    llm_base_url: str = ""
+    llm_limits: dict = field(default_factory=dict)  # 모델별 {rpm, tpm}
+    llm_max_retries: int = 4
+    llm_timeout: float = 60
+    llm_stub: dict = field(default_factory=dict)  # 스텁 옵션 {latency, jitter, fail_rate, tail_rate, tail_latency}
+    llm_hedge: dict = field(default_factory=dict)  # 태깅 헤지 요청 {enabled, quantile, max_rate, ...}
+    
+    # 실행 예산 (src/budget.py) - {time_s, llm_tokens, http_requests}, 0 = 무제한
+    budget: dict = field(default_factory=dict)
+    deadline_s: float = 0  # 마감 모드 (0 = 끔) - 이 시간 안에 부분 결과로라도 리포트 생성
+    
+    # config.yaml 오버라이드 원본 {overrides..., "budget": {...}} - 프리셋을 바꿔도 다시 적용
+    overrides: dict = field(default_factory=dict)
+    
+    def shared_root(self) -> Path:
+        """실행 간 공유 디렉터리 (run 스코프가 아니면 output_dir)"""
+        return self.shared_dir or self.output_dir
 
 
 def load_config(config_path: str = "config.yaml") -> Config:
     """config.yaml 로드 + 프리셋 적용 + 오버라이드"""
+    import yaml
+    from .blockstore import CODECS, block_name
+
     with open(config_path, "r", encoding="utf-8") as f:
         raw = yaml.safe_load(f)
     
     preset_name = raw.get("preset", "standard")
-    preset = PRESETS.get(preset_name, PRESETS["standard"])
+    if preset_name not in PRESETS:
+        preset_name = "standard"
     
-    # 오버라이드 적용
-    overrides = raw.get("overrides", {}) or {}
+    # 오버라이드 (프리셋 위에 적용, null 은 프리셋 값 유지)
+    overrides = {
+        **{k: v for k, v in (raw.get("overrides") or {}).items() if v is not None},
+        "budget": raw.get("budget") or {},
+    }
+    llm = raw.get("llm") or {}
+    storage = raw.get("storage") or {}
+    
+    # 블록 압축 codec 을 켜면 raw/tagged 코퍼스는 .vvb 로 저장
+    codec = str(storage.get("codec") or "none")
+    if codec not in ("none", *CODECS):
+        raise ValueError(f"storage.codec: {codec} (가능: none, {', '.join(CODECS)})")
+    corpus_file = block_name if codec != "none" else str
     
     return Config(
-        preset=preset_name,
-        reviews_per_game=overrides.get("reviews_per_game") or preset["reviews_per_game"],
-        tagging_model=overrides.get("tagging_model") or preset["tagging_model"],
-        analysis_model=overrides.get("analysis_model") or preset["analysis_model"],
-        merge_agents=overrides.get("merge_agents") if overrides.get("merge_agents") is not None else preset["merge_agents"],
-        batch_size=preset["batch_size"],
+        **preset_values(preset_name, overrides),
         language=raw.get("steam", {}).get("language", "korean"),
         sentiment_ratio=raw.get("steam", {}).get("sentiment_ratio", 0.5),
         recent_months=raw.get("steam", {}).get("recent_months", 6),
         output_dir=Path(raw.get("output", {}).get("dir", "./output")),
-        raw_reviews_file=raw.get("output", {}).get("raw_reviews", "raw_reviews.jsonl"),
-        tagged_reviews_file=raw.get("output", {}).get("tagged_reviews", "tagged_reviews.jsonl"),
+        raw_reviews_file=corpus_file(raw.get("output", {}).get("raw_reviews", "raw_reviews.jsonl")),
+        tagged_reviews_file=corpus_file(raw.get("output", {}).get("tagged_reviews", "tagged_reviews.jsonl")),
         personas_file=raw.get("output", {}).get("personas", "personas.json"),
         report_file=raw.get("output", {}).get("report", "report.md"),
+        stats_file=raw.get("output", {}).get("stats", "stats.json"),
+        steam_base_url=raw.get("steam", {}).get("base_url") or "",
+        steam_page_delay=float(raw.get("steam", {}).get("page_delay", 1.0)),
+        offline_workers=int((raw.get("performance") or {}).get("offline_workers") or 0),
+        storage_codec=codec,
+        storage_block_records=int(storage.get("block_records") or 4096),
+        corpus_ttl_days=int(storage.get("corpus_ttl_days", 1) or 0),
+        llm_provider=str(llm.get("provider") or "none"),
+        llm_base_url=llm.get("base_url") or "",
+        llm_limits=llm.get("limits") or {},
+        llm_max_retries=int(llm.get("max_retries", 4)),
+        llm_timeout=float(llm.get("timeout", 60)),
+        llm_stub=llm.get("stub") or {},
+        llm_hedge=llm.get("hedge") or {},
+        overrides=overrides,
     )
 
 
+def preset_values(preset_name: str, overrides: dict) -> dict:
+    """프리셋 기본값 + config.yaml 오버라이드 → Config 필드"""
+    preset = PRESETS[preset_name]
+    return {
+        "preset": preset_name,
+        "reviews_per_game": overrides.get("reviews_per_game") or preset["reviews_per_game"],
+        "tagging_model": overrides.get("tagging_model") or preset["tagging_model"],
+        "analysis_model": overrides.get("analysis_model") or preset["analysis_model"],
+        "merge_agents": overrides["merge_agents"] if overrides.get("merge_agents") is not None else preset["merge_agents"],
+        "batch_size": preset["batch_size"],
+        "budget": merge_budget(preset["budget"], overrides.get("budget")),
+    }
+
+
+def merge_budget(preset_budget: dict, overrides: Optional[dict]) -> dict:
+    """프리셋 예산 + config.yaml 오버라이드 (null 은 프리셋 값 유지)"""
+    budget = dict(preset_budget)
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            budget[key] = value
+    return budget
+
+
+def apply_preset(config: Config, preset_name: str) -> Config:
+    """프리셋 교체 (CLI --preset, 서비스 작업별 프리셋) - config.yaml 오버라이드는 그 위에 다시 적용"""
+    for name, value in preset_values(preset_name, config.overrides).items():
+        setattr(config, name, value)
+    return config
+
+
 def print_config(config: Config) -> None:
     """설정 출력 (디버깅용)"""
     print(f"━━━ Config [{config.preset.upper()}] ━━━")
@@ -0,0 +1,208 @@
+"""페르소나 프레임워크 번들 - 프로세스 단위 컴파일 + 장르 별칭 인덱스
+
+persona_frameworks.json 은 프로세스당 한 번만 파싱되어 불변 번들로 캐시된다.
+파일 mtime 이 바뀐 경우에만 다시 읽으며, 선택적으로 marshal 스냅샷을 만들어
+JSON 파싱 없이 로드할 수 있다.
+
+    python -m src.frameworks        # 스냅샷 생성
+"""
+import json
+import marshal
+import re
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+FRAMEWORK_PATH = Path(__file__).parent / "data" / "persona_frameworks.json"
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_VERSION = 1
+
+DEFAULT_GENRE_WEIGHTS = MappingProxyType({
+    "constructive_critic": 0.25,
+    "bandwagon_casual": 0.25,
+    "vibe_seeker": 0.20,
+    "tech_troubleshooter": 0.15,
+    "competitive_hardcore": 0.15,
+})
+
+_TOKEN_SPLIT = re.compile(r"[\W_]+")
+
+
+def _normalize(text: str) -> str:
+    """소문자 + 구분자(공백, -, _) 통일"""
+    return " ".join(_TOKEN_SPLIT.split(text.lower())).strip()
+
+
+def _freeze(obj):
+    """dict → MappingProxyType, list → tuple (재귀)"""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+@dataclass(frozen=True)
+class FrameworkBundle:
+    """컴파일된 프레임워크 (읽기 전용)"""
+    data: Mapping
+    genre_index: Mapping[str, str]  # 정규화된 장르/별칭 → 매핑 키
+    token_index: Mapping[str, str]  # 단일 토큰 → 매핑 키
+    fuzzy_aliases: tuple  # (별칭, 매핑 키) - 긴 별칭 우선
+    source_mtime_ns: int
+
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def lookup_genre(self, genre: str) -> Optional[str]:
+        """장르 문자열 → 매핑 키 (정확 일치 → 토큰 → 부분 문자열 순)"""
+        norm = _normalize(genre or "")
+        if not norm:
+            return None
+
+        key = self.genre_index.get(norm)
+        if key:
+            return key
+
+        # 토큰 단위: 정식 장르 키를 별칭보다 우선 ("tactical shooter" → shooter)
+        tokens = norm.split(" ")
+        for token in tokens:
+            key = self.token_index.get(token)
+            if key and key == token:
+                return key
+        for token in tokens:
+            key = self.token_index.get(token)
+            if key:
+                return key
+
+        for alias, key in self.fuzzy_aliases:
+            if alias in norm or (len(norm) >= 3 and norm in alias):
+                return key
+        return None
+
+    def genre_weights(self, genre: str) -> Mapping[str, float]:
+        """장르별 페르소나 가중치 (없으면 기본값)"""
+        key = self.lookup_genre(genre)
+        if key is None:
+            return DEFAULT_GENRE_WEIGHTS
+        return self.data["genre_persona_mapping"]["mappings"][key]
+
+
+def _build_indexes(raw: dict) -> tuple[dict, dict, list]:
+    """장르 별칭/토큰 인덱스 생성"""
+    mapping = raw.get("genre_persona_mapping", {})
+    mappings = mapping.get("mappings", {})
+    aliases = mapping.get("aliases", {})
+
+    genre_index = {}
+    for key in mappings:
+        genre_index[_normalize(key)] = key
+    for key, names in aliases.items():
+        if key not in mappings:
+            continue
+        for name in names:
+            genre_index.setdefault(_normalize(name), key)
+
+    # 공백 없는 별칭만 토큰 인덱스에 등록 ("battle royale" 은 정확 일치로만)
+    token_index = {alias: key for alias, key in genre_index.items() if " " not in alias}
+
+    fuzzy = sorted(genre_index.items(), key=lambda x: (-len(x[0]), x[0]))
+    return genre_index, token_index, fuzzy
+
+
+def compile_bundle(raw: dict, source_mtime_ns: int = -1) -> FrameworkBundle:
+    """원본 dict → 불변 번들"""
+    genre_index, token_index, fuzzy = _build_indexes(raw)
+    return FrameworkBundle(
+        data=_freeze(raw),
+        genre_index=MappingProxyType(genre_index),
+        token_index=MappingProxyType(token_index),
+        fuzzy_aliases=tuple(tuple(x) for x in fuzzy),
+        source_mtime_ns=source_mtime_ns,
+    )
+
+
+def _snapshot_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + SNAPSHOT_SUFFIX)
+
+
+def write_snapshot(path: Path = FRAMEWORK_PATH) -> Path:
+    """marshal 스냅샷 생성 (원본 mtime/크기 기록)"""
+    path = Path(path)
+    stat = path.stat()
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    snapshot_path = _snapshot_path(path)
+    tmp_path = snapshot_path.with_suffix(snapshot_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        marshal.dump({
+            "version": SNAPSHOT_VERSION,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "data": raw,
+        }, f)
+    tmp_path.replace(snapshot_path)
+    return snapshot_path
+
+
+def _read_snapshot(path: Path, stat) -> Optional[dict]:
+    """원본과 일치하는 스냅샷이면 원본 dict 반환"""
+    snapshot_path = _snapshot_path(path)
+    if not snapshot_path.exists():
+        return None
+    try:
+        with open(snapshot_path, "rb") as f:
+            payload = marshal.load(f)
+    except (EOFError, ValueError, TypeError, OSError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != SNAPSHOT_VERSION
+        or payload.get("source_mtime_ns") != stat.st_mtime_ns
+        or payload.get("source_size") != stat.st_size
+    ):
+        return None
+    return payload.get("data")
+
+
+_cache: dict[Path, FrameworkBundle] = {}
+_cache_lock = threading.Lock()
+
+
+def load_frameworks(path: Path = FRAMEWORK_PATH, use_snapshot: bool = True) -> FrameworkBundle:
+    """프로세스 캐시된 번들 반환 (mtime 변경 시에만 재로드)"""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return compile_bundle({})
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached.source_mtime_ns == stat.st_mtime_ns:
+            return cached
+
+        raw = _read_snapshot(path, stat) if use_snapshot else None
+        if raw is None:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+
+        bundle = compile_bundle(raw, stat.st_mtime_ns)
+        _cache[path] = bundle
+        return bundle
+
+
+def clear_cache() -> None:
+    """캐시 초기화 (테스트/핫 리로드용)"""
+    with _cache_lock:
+        _cache.clear()
+
+
+if __name__ == "__main__":
+    print(f"💾 스냅샷 생성: {write_snapshot()}")
@@ -0,0 +1,27 @@
+"""HTTP 커넥션 풀 - 스레드별 requests.Session 재사용
+
+프로세스가 오래 살아있는 서비스/배치 모드에서 Steam 호출마다 TCP/TLS 핸드셰이크를
+반복하지 않도록, 스레드마다 하나의 Session(keep-alive 풀)을 유지한다.
+"""
+import threading
+
+POOL_SIZE = 16
+USER_AGENT = "VibeValidator/1.0"
+
+_local = threading.local()
+
+
+def get_session():
+    """현재 스레드의 공유 requests.Session (requests 는 첫 호출 시 로드)"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        _local.session = session
+    return session
@@ -0,0 +1,80 @@
+"""병렬 실행기 - 여러 (아이디어, 경쟁작) 조합을 프로세스 풀로 실행
+
+    python main.py --parallel jobs.jsonl --workers 4
+
+jobs.jsonl 한 줄 = 한 실행:
+    {"idea": "...", "genre": "shooter", "competitors": "CS2:730,PUBG:578080", "preset": "free"}
+
+각 실행은 output/runs/<run_id>/ 에 산출물과 run.log 를 남기며, 같은 수집 조건은
+공유 코퍼스와 single-flight 로 한 번만 수집된다.
+"""
+import json
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+
+from .config import Config, apply_preset
+from .llm import build_client
+from .pipeline import build_stages, parse_competitors, StageRunner, MANIFEST_FILE
+from .workspace import new_run_id, scoped_config
+
+
+def load_jobs(path: Path) -> list[dict]:
+    """jobs.jsonl 로드 (빈 줄/주석 무시)"""
+    jobs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                jobs.append(json.loads(line))
+    return jobs
+
+
+def run_job(config: Config, job: dict, llm_client=None) -> dict:
+    """단일 실행 (run 스코프 디렉터리에서)
+
+    llm_client 가 없으면 프로세스마다 설정으로 생성한다 (RPM/TPM 한도는 프로세스 단위).
+    """
+    run_id = job.get("run_id") or new_run_id()
+    run_config = scoped_config(config, run_id)
+    if job.get("preset") and job["preset"] != run_config.preset:
+        apply_preset(run_config, job["preset"])
+
+    competitors = job.get("competitors") or []
+    if isinstance(competitors, str):
+        competitors = parse_competitors(competitors)
+
+    run_config.output_dir.mkdir(parents=True, exist_ok=True)
+    summary = {"run_id": run_id, "idea": job.get("idea", ""), "output_dir": str(run_config.output_dir)}
+
+    with open(run_config.output_dir / "run.log", "w", encoding="utf-8") as log, redirect_stdout(log):
+        if llm_client is None:
+            llm_client = build_client(run_config)
+        try:
+            stages = build_stages(
+                run_config, job["idea"], job.get("genre") or "unknown", competitors, llm_client
+            )
+            results = StageRunner(run_config.output_dir / MANIFEST_FILE).run(stages)
+            summary.update(status="done", report=str(results["report"]))
+        except Exception as e:
+            print(f"⚠️ 실패: {type(e).__name__}: {e}")
+            summary.update(status="failed", error=f"{type(e).__name__}: {e}")
+
+    return summary
+
+
+def run_parallel(config: Config, jobs: list[dict], workers: int = 4) -> list[dict]:
+    """프로세스 풀로 여러 실행 (완료 순서대로 진행 출력)"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, config, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                job = futures[future]
+                summary = {"run_id": "-", "idea": job.get("idea", ""), "status": "failed", "error": str(e)}
+            mark = "✓" if summary["status"] == "done" else "⚠️"
+            print(f"   {mark} [{summary['run_id']}] {summary['idea'][:40]}")
+            results.append(summary)
+    return results
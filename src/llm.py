@@ -0,0 +1,685 @@
+"""LLM 클라이언트 - 프로바이더 공통 인터페이스 + 모델별 RPM/TPM 스케줄러
+
+태깅/합성 Agent 가 하나의 클라이언트를 공유한다. 모든 요청은 모델별 1분 창
+(요청 수, 토큰 수) 한도 안에서 실행되며, 대기 중인 합성(interactive) 요청이 있으면
+대량 태깅(bulk) 요청은 뒤로 밀린다. 429/5xx/네트워크 오류는 지수 백오프로 재시도하고
+Retry-After 가 오면 같은 모델의 모든 요청을 그 시간만큼 멈춘다.
+
+    client = build_client(config)           # API 키가 없으면 None (규칙 기반)
+    resp = client.chat(model="gpt-4o-mini", messages=[...], lane="bulk")
+    resp["content"], resp["usage"]["total_tokens"]
+
+    llm:
+      provider: auto        # auto | openai | anthropic | gemini | stub | none
+      limits:
+        default: {rpm: 50, tpm: 100000}
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional
+
+from .budget import current_budget
+from .config import Config
+from .http_pool import get_session
+from .tracing import tracer, estimate_tokens
+
+# 설정 모델명 → (프로바이더, API 모델 ID)
+MODEL_ROUTES = {
+    "gpt-4o": ("openai", "gpt-4o"),
+    "gpt-4o-mini": ("openai", "gpt-4o-mini"),
+    "claude-3.5-sonnet": ("anthropic", "claude-3-5-sonnet-latest"),
+    "gemini-flash": ("gemini", "gemini-1.5-flash"),
+}
+
+API_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+}
+
+# 우선순위 레인 (앞쪽이 높음)
+LANES = ("interactive", "bulk")
+
+DEFAULT_LIMITS = {"rpm": 50, "tpm": 100000}
+WINDOW_SECONDS = 60.0
+DEFAULT_MAX_TOKENS = 4096
+
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+HEDGE_DEFAULTS = {
+    "enabled": False,
+    "quantile": 0.95,  # 이 분위 지연을 넘으면 중복 요청
+    "max_rate": 0.1,  # 헤지 요청 비율 상한 (비용 제한)
+    "min_samples": 20,  # 분위 추정 전 최소 표본 수
+    "secondary_model": None,  # 중복 요청 모델 (None = 같은 모델)
+    "concurrency": 4,  # 동시에 헤지 경쟁을 돌릴 호출 수 (넘으면 헤지 없이 chat)
+}
+
+
+class LLMError(RuntimeError):
+    """LLM 호출 실패 (retryable 이면 재시도 대상)"""
+
+    def __init__(self, message: str, status: int = 0, retryable: bool = False, retry_after: float = 0.0):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+# ── 프로바이더 ────────────────────────────────────────────────
+
+class Provider:
+    """프로바이더 공통: complete() 는 {"content", "usage"} 반환"""
+
+    name = ""
+
+    def __init__(self, api_key: str = "", base_url: str = "", timeout: float = 60):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def complete(self, model: str, messages: list[dict], temperature: float, max_tokens: int) -> dict:
+        raise NotImplementedError
+
+    def _post(self, url: str, headers: dict, body: dict) -> dict:
+        """풀링된 세션으로 POST (429/5xx/네트워크 오류는 retryable)"""
+        import requests  # get_session() 이 이미 로드 - 모듈 import 시점에는 불필요
+
+        try:
+            resp = get_session().post(url, headers=headers, json=body, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise LLMError(f"{self.name}: {type(e).__name__}: {e}", retryable=True)
+
+        tracer.count("http.requests")
+        tracer.count("http.bytes", len(resp.content))
+        if resp.status_code == 429 or resp.status_code >= 500:
+            retry_after = resp.headers.get("Retry-After", "")
+            raise LLMError(
+                f"{self.name}: HTTP {resp.status_code}",
+                status=resp.status_code,
+                retryable=True,
+                retry_after=float(retry_after) if retry_after.replace(".", "", 1).isdigit() else 0.0,
+            )
+        if not resp.ok:
+            raise LLMError(f"{self.name}: HTTP {resp.status_code} {resp.text[:200]}", status=resp.status_code)
+        return resp.json()
+
+
+class OpenAIProvider(Provider):
+    """OpenAI Chat Completions (OpenRouter 등 호환 엔드포인트 포함)"""
+
+    name = "openai"
+
+    def complete(self, model, messages, temperature, max_tokens):
+        data = self._post(
+            f"{self.base_url or 'https://api.openai.com/v1'}/chat/completions",
+            {"Authorization": f"Bearer {self.api_key}"},
+            {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+        )
+        usage = data.get("usage") or {}
+        return {
+            "content": data["choices"][0]["message"]["content"] or "",
+            "usage": {
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0),
+            },
+        }
+
+
+class AnthropicProvider(Provider):
+    """Anthropic Messages API"""
+
+    name = "anthropic"
+
+    def complete(self, model, messages, temperature, max_tokens):
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        data = self._post(
+            f"{self.base_url or 'https://api.anthropic.com/v1'}/messages",
+            {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"},
+            {
+                "model": model,
+                "system": system,
+                "messages": [m for m in messages if m["role"] != "system"],
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+        )
+        usage = data.get("usage") or {}
+        prompt, completion = usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+        return {
+            "content": "".join(b.get("text", "") for b in data.get("content", []) if b.get("type") == "text"),
+            "usage": {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": prompt + completion},
+        }
+
+
+class GeminiProvider(Provider):
+    """Google Gemini generateContent"""
+
+    name = "gemini"
+
+    def complete(self, model, messages, temperature, max_tokens):
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        body = {
+            "contents": [
+                {"role": "model" if m["role"] == "assistant" else "user", "parts": [{"text": m["content"]}]}
+                for m in messages if m["role"] != "system"
+            ],
+            "generationConfig": {"temperature": temperature, "maxOutputTokens": max_tokens},
+        }
+        if system:
+            body["systemInstruction"] = {"parts": [{"text": system}]}
+        base = self.base_url or "https://generativelanguage.googleapis.com/v1beta"
+        data = self._post(f"{base}/models/{model}:generateContent", {"x-goog-api-key": self.api_key}, body)
+
+        candidates = data.get("candidates") or [{}]
+        parts = (candidates[0].get("content") or {}).get("parts", [])
+        usage = data.get("usageMetadata") or {}
+        return {
+            "content": "".join(p.get("text", "") for p in parts),
+            "usage": {
+                "prompt_tokens": usage.get("promptTokenCount", 0),
+                "completion_tokens": usage.get("candidatesTokenCount", 0),
+                "total_tokens": usage.get("totalTokenCount", 0),
+            },
+        }
+
+
+class StubProvider(Provider):
+    """로컬 스텁 - 네트워크 없이 결정적 응답 (테스트/벤치마크용)
+
+    태깅 프롬프트([ID: ...] 포함)에는 리뷰별 태깅 JSON 배열을, 그 외에는
+    합성 결과 JSON 을 돌려준다. fail_rate 비율로 429 를, tail_rate 비율로
+    tail_latency 만큼 느린 응답(꼬리 지연)을 흉내 낸다. jitter 를 주면 기본 지연이
+    중앙값 latency, sigma=jitter 인 로그정규 분포를 따른다.
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fail_rate: float = 0.0,
+        tail_rate: float = 0.0,
+        tail_latency: float = 0.0,
+        seed: int = 0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def complete(self, model, messages, temperature, max_tokens):
+        with self._lock:
+            fail = self._random.random() < self.fail_rate
+            slow = self._random.random() < self.tail_rate
+            spread = self._random.lognormvariate(0, self.jitter) if self.jitter else 1.0
+        delay = self.tail_latency if slow else self.latency * spread
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise LLMError("stub: HTTP 429", status=429, retryable=True)
+
+        prompt = "\n".join(m["content"] for m in messages)
+        review_ids = re.findall(r"\[ID: ([^\]]+)\]", prompt)
+        if review_ids:
+            content = json.dumps([self._tag(rid) for rid in review_ids], ensure_ascii=False)
+        else:
+            content = json.dumps(self._synthesis(), ensure_ascii=False)
+
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(content)
+        return {
+            "content": content,
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @staticmethod
+    def _tag(review_id: str) -> dict:
+        rnd = random.Random(review_id)
+        return {
+            "review_id": review_id,
+            "player_type_guess": rnd.choice(["new", "mid", "hardcore"]),
+            "session_style": [rnd.choice(["short", "long"])],
+            "pain_points": [rnd.choice(["matchmaking", "performance", "monetization", "pacing"])],
+            "delights": [rnd.choice(["gunfeel", "movement", "depth", "social"])],
+            "quotes": [],
+            "notes": "(stub)",
+        }
+
+    @staticmethod
+    def _synthesis() -> dict:
+        return {
+            "personas": [{
+                "name": "Stub Persona",
+                "archetype": "constructive_critic",
+                "player_type": "mid",
+                "session_pattern": "short",
+                "motivations": ["mastery"],
+                "goals": ["stub"],
+                "pains": ["stub"],
+                "triggers": ["stub"],
+                "win_conditions": ["stub"],
+                "mobile_considerations": [],
+                "spending_segment": "minnow",
+            }],
+            "validations": [{
+                "persona_name": "Stub Persona",
+                "value_hypothesis": "stub",
+                "failure_hypothesis": "stub",
+                "evidence": [],
+                "fit_score": 3,
+                "confidence": "low",
+            }],
+            "risks": [],
+            "top_personas": ["Stub Persona"],
+            "top_risk": "",
+        }
+
+
+PROVIDERS = {
+    "openai": OpenAIProvider,
+    "anthropic": AnthropicProvider,
+    "gemini": GeminiProvider,
+    "stub": StubProvider,
+}
+
+
+# ── 지연 히스토그램 ───────────────────────────────────────────
+
+class LatencyHistogram:
+    """로그 간격 버킷 지연 히스토그램 (지수 감쇠로 최근 분포를 따라감)"""
+
+    BOUNDS = [0.05 * 1.25 ** i for i in range(40)]  # 50ms ~ 300초
+    DECAY = 0.99  # 기록마다 기존 가중치 감쇠 (약 100개 창)
+
+    def __init__(self):
+        self.weights = [0.0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        index = next((i for i, bound in enumerate(self.BOUNDS) if seconds <= bound), len(self.BOUNDS))
+        with self._lock:
+            self.weights = [w * self.DECAY for w in self.weights]
+            self.weights[index] += 1.0
+            self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """q 분위 지연 (버킷 상한, 기록이 없으면 0)"""
+        with self._lock:
+            total = sum(self.weights)
+            if not total:
+                return 0.0
+            cumulative = 0.0
+            for i, w in enumerate(self.weights):
+                cumulative += w
+                if cumulative >= q * total:
+                    return self.BOUNDS[min(i, len(self.BOUNDS) - 1)]
+        return self.BOUNDS[-1]
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+# ── 스케줄러 ─────────────────────────────────────────────────
+
+class RateScheduler:
+    """모델별 1분 슬라이딩 창 RPM/TPM 한도 + 우선순위 레인"""
+
+    def __init__(self, limits: Optional[dict] = None):
+        self.limits = limits or {}
+        self._cond = threading.Condition()
+        self._windows: dict[str, deque] = {}  # model → [timestamp, tokens]
+        self._waiting: dict[str, list[int]] = {}  # model → 레인별 대기 수
+        self._paused_until: dict[str, float] = {}
+
+    def limit_for(self, model: str) -> dict:
+        return {**DEFAULT_LIMITS, **(self.limits.get("default") or {}), **(self.limits.get(model) or {})}
+
+    def acquire(
+        self, model: str, tokens: int, lane: str = "bulk", cancel: Optional[threading.Event] = None,
+    ) -> tuple[list, float]:
+        """한도 안에 들어올 때까지 대기 후 슬롯 예약
+
+        cancel 이 설정되면 예약 없이 LLMError 로 대기를 끝낸다 (wake() 로 깨움).
+
+        Returns:
+            (예약 항목, 대기 시간 초) - 예약 항목은 settle() 로 실제 토큰 수를 반영
+        """
+        limit = self.limit_for(model)
+        tokens = min(tokens, limit["tpm"])  # 한도보다 큰 요청도 빈 창에서는 통과
+        rank = LANES.index(lane)
+        started = time.monotonic()
+
+        with self._cond:
+            waiting = self._waiting.setdefault(model, [0] * len(LANES))
+            window = self._windows.setdefault(model, deque())
+            waiting[rank] += 1
+            try:
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        raise LLMError(f"{model}: cancelled")
+                    now = time.monotonic()
+                    while window and window[0][0] <= now - WINDOW_SECONDS:
+                        window.popleft()
+
+                    paused = self._paused_until.get(model, 0) - now
+                    higher_waiting = any(waiting[:rank])
+                    used = sum(entry[1] for entry in window)
+
+                    if paused <= 0 and not higher_waiting and len(window) < limit["rpm"] and used + tokens <= limit["tpm"]:
+                        entry = [now, tokens]
+                        window.append(entry)
+                        return entry, now - started
+
+                    if paused > 0:
+                        timeout = paused
+                    elif higher_waiting or not window:
+                        timeout = None  # 상위 레인이 끝나면 notify
+                    else:
+                        timeout = window[0][0] + WINDOW_SECONDS - now
+                    self._cond.wait(timeout)
+            finally:
+                waiting[rank] -= 1
+                self._cond.notify_all()
+
+    def settle(self, entry: list, tokens: int) -> None:
+        """예약 토큰을 실제 사용량으로 교체"""
+        with self._cond:
+            entry[1] = tokens
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        """대기 중인 acquire() 가 취소 신호를 확인하도록 깨움"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def pause(self, model: str, seconds: float) -> None:
+        """Retry-After 동안 모델 전체 요청 중지"""
+        with self._cond:
+            until = time.monotonic() + seconds
+            self._paused_until[model] = max(self._paused_until.get(model, 0), until)
+            self._cond.notify_all()
+
+
+# ── 클라이언트 ───────────────────────────────────────────────
+
+class LLMClient:
+    """Agent 공용 LLM 클라이언트 (스레드 안전)"""
+
+    def __init__(
+        self,
+        provider: str = "auto",
+        base_url: str = "",
+        limits: Optional[dict] = None,
+        max_retries: int = 4,
+        timeout: float = 60,
+        stub_options: Optional[dict] = None,
+        hedge: Optional[dict] = None,
+    ):
+        self.provider = provider
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.stub_options = stub_options or {}
+        self.scheduler = RateScheduler(limits)
+        self._providers: dict[str, Provider] = {}
+        self._usage: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        # 헤지 요청 (opt-in): 관측 분위 지연을 넘으면 중복 요청
+        self.hedge = {**HEDGE_DEFAULTS, **(hedge or {})}
+        self.latency: dict[str, LatencyHistogram] = {}
+        self._hedge_calls = 0
+        self._hedges = 0
+        self._hedge_slots = 0  # 헤지 풀에 예약된 스레드 수 (진 요청이 끝날 때까지 유지)
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def name(self) -> str:
+        """파이프라인 지문용 식별자"""
+        return f"llm:{self.provider}"
+
+    def route(self, model: str) -> tuple[str, str]:
+        """설정 모델명 → (프로바이더, API 모델 ID)"""
+        native, model_id = MODEL_ROUTES.get(model, ("openai", model))
+        if self.provider == "auto":
+            return native, model_id
+        return self.provider, model_id if native == self.provider else model
+
+    def _get_provider(self, name: str) -> Provider:
+        with self._lock:
+            if name not in self._providers:
+                if name == "stub":
+                    self._providers[name] = StubProvider(timeout=self.timeout, **self.stub_options)
+                else:
+                    self._providers[name] = PROVIDERS[name](
+                        api_key=os.environ.get(API_KEY_ENV[name], ""),
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                    )
+            return self._providers[name]
+
+    def chat(
+        self,
+        model: str,
+        messages: list[dict],
+        lane: str = "bulk",
+        temperature: float = 0.3,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cancel: Optional[threading.Event] = None,
+    ) -> dict:
+        """채팅 완료 (한도 대기 + 재시도 포함)
+
+        cancel 이 설정되면 한도 대기/재시도 대기를 멈추고 중단한다 (헤지 경쟁에서 진 요청).
+        이미 예약한 슬롯은 0 토큰으로 돌려준다.
+
+        Returns:
+            {"content": str, "usage": {...}, "model": str}
+        """
+        provider_name, model_id = self.route(model)
+        provider = self._get_provider(provider_name)
+        estimate = estimate_tokens("".join(m["content"] for m in messages)) + max_tokens
+
+        for attempt in range(self.max_retries + 1):
+            entry, waited = self.scheduler.acquire(model, estimate, lane, cancel=cancel)
+            self._record(model, wait_s=waited)
+            tracer.count("llm.rate_wait_ms", waited * 1000)
+            if cancel is not None and cancel.is_set():
+                self.scheduler.settle(entry, 0)
+                raise LLMError(f"{model}: cancelled")
+
+            started = time.perf_counter()
+            try:
+                with tracer.span("llm.request", model=model, lane=lane, attempt=attempt):
+                    resp = provider.complete(model_id, messages, temperature, max_tokens)
+            except LLMError as e:
+                self.scheduler.settle(entry, 0)
+                self._record(model, errors=1)
+                if not e.retryable or attempt == self.max_retries:
+                    raise
+                delay = e.retry_after or min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+                if e.retry_after:
+                    self.scheduler.pause(model, e.retry_after)
+                self._record(model, retries=1)
+                tracer.count("llm.retries")
+                print(f"   ⚠️ {e} → {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                if cancel is not None:
+                    cancel.wait(delay)
+                else:
+                    time.sleep(delay)
+                continue
+
+            usage = resp["usage"]
+            if not usage.get("total_tokens"):
+                usage["total_tokens"] = estimate_tokens("".join(m["content"] for m in messages) + resp["content"])
+            latency = time.perf_counter() - started
+            self.scheduler.settle(entry, usage["total_tokens"])
+            self._histogram(model).record(latency)
+            self._record(
+                model,
+                calls=1,
+                prompt_tokens=usage.get("prompt_tokens", 0),
+                completion_tokens=usage.get("completion_tokens", 0),
+                total_tokens=usage["total_tokens"],
+                latency_s=latency,
+            )
+            return {"content": resp["content"], "usage": usage, "model": model}
+
+    def hedged_chat(self, model: str, messages: list[dict], lane: str = "bulk", **kwargs) -> dict:
+        """꼬리 지연 헤지: 관측 분위 지연을 넘기면 중복 요청을 보내고 먼저 온 응답 사용
+
+        헤지가 꺼져 있거나 표본이 부족하거나 헤지 비율 상한에 걸리면 chat() 과 같다.
+        동시 경쟁 수가 hedge.concurrency 에 차면 풀에서 줄 서지 않고 호출 스레드에서
+        바로 chat() 한다. 진 요청은 한도/재시도 대기를 멈추도록 취소 신호를 받고
+        예약 슬롯을 돌려준다. 이미 전송된 요청의 토큰은 사용량과 실행 예산에 반영된다.
+        """
+        histogram = self._histogram(model)
+        if not self.hedge["enabled"] or histogram.count < self.hedge["min_samples"]:
+            return self.chat(model, messages, lane=lane, **kwargs)
+
+        # 경쟁마다 원 요청 + 헤지 요청 두 스레드를 미리 잡아 풀 대기열에서 밀리지 않게 한다
+        size = 2 * max(1, int(self.hedge["concurrency"]))
+        with self._lock:
+            if self._hedge_slots + 2 > size:
+                return self.chat(model, messages, lane=lane, **kwargs)
+            self._hedge_slots += 2
+            self._hedge_calls += 1
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix="llm-hedge")
+        pool = self._hedge_pool
+        threshold = histogram.quantile(self.hedge["quantile"])
+        budget = current_budget()
+
+        cancels = [threading.Event(), threading.Event()]
+        primary = pool.submit(self.chat, model, messages, lane=lane, cancel=cancels[0], **kwargs)
+        primary.add_done_callback(lambda f: self._release_hedge_slots(1))
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            self._release_hedge_slots(1)
+            return primary.result()
+
+        with self._lock:
+            allowed = self._hedges + 1 <= self.hedge["max_rate"] * self._hedge_calls
+            if allowed:
+                self._hedges += 1
+        if not allowed:
+            self._release_hedge_slots(1)
+            return primary.result()
+
+        hedge_model = self.hedge["secondary_model"] or model
+        tracer.count("llm.hedges")
+        with tracer.span("llm.hedge", model=model, hedge_model=hedge_model, threshold_s=round(threshold, 3)):
+            secondary = pool.submit(self.chat, hedge_model, messages, lane=lane, cancel=cancels[1], **kwargs)
+            secondary.add_done_callback(lambda f: self._release_hedge_slots(1))
+            futures = [primary, secondary]
+            pending = set(futures)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is not None:
+                        error = future.exception()
+                        continue
+                    # 승자 확정 → 나머지 취소, 늦게 끝난 요청의 토큰은 예산에 반영
+                    winner = futures.index(future)
+                    cancels[1 - winner].set()
+                    self.scheduler.wake()
+                    for loser in pending:
+                        loser.add_done_callback(lambda f: self._charge_loser(f, budget))
+                    if winner == 1:
+                        tracer.count("llm.hedge_wins")
+                    return future.result()
+            raise error
+
+    def _release_hedge_slots(self, count: int) -> None:
+        with self._lock:
+            self._hedge_slots -= count
+
+    @staticmethod
+    def _charge_loser(future, budget) -> None:
+        if budget is not None and future.exception() is None:
+            budget.charge("llm_tokens", future.result()["usage"].get("total_tokens", 0))
+
+    def _histogram(self, model: str) -> LatencyHistogram:
+        with self._lock:
+            if model not in self.latency:
+                self.latency[model] = LatencyHistogram()
+            return self.latency[model]
+
+    def _record(self, model: str, **values) -> None:
+        with self._lock:
+            row = self._usage.setdefault(model, {
+                "calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0,
+                "retries": 0, "errors": 0, "wait_s": 0.0, "latency_s": 0.0,
+            })
+            for key, value in values.items():
+                row[key] += value
+
+    def usage(self) -> dict[str, dict]:
+        """모델별 사용량 스냅샷 (지연 분위 포함)"""
+        with self._lock:
+            usage = {model: dict(row) for model, row in self._usage.items()}
+            histograms = dict(self.latency)
+        for model, row in usage.items():
+            if model in histograms:
+                row["latency"] = histograms[model].snapshot()
+        return usage
+
+    def hedge_stats(self) -> dict:
+        with self._lock:
+            return {"calls": self._hedge_calls, "hedges": self._hedges}
+
+
+def build_client(config: Config, quiet: bool = False) -> Optional[LLMClient]:
+    """설정 + 환경변수(.env) 로 클라이언트 생성 (사용할 수 없으면 None → 규칙 기반)"""
+    provider = (config.llm_provider or "none").lower()
+    if provider == "none":
+        return None
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    client = LLMClient(
+        provider=provider,
+        base_url=config.llm_base_url,
+        limits=config.llm_limits,
+        max_retries=config.llm_max_retries,
+        timeout=config.llm_timeout,
+        stub_options=config.llm_stub,
+        hedge=config.llm_hedge,
+    )
+
+    needed = {client.route(m)[0] for m in (config.tagging_model, config.analysis_model)} - {"stub"}
+    missing = sorted(API_KEY_ENV[p] for p in needed if not os.environ.get(API_KEY_ENV[p]))
+    if missing:
+        if not quiet:
+            print(f"⚠️ API 키 없음 ({', '.join(missing)}) → 규칙 기반 태깅/합성")
+        return None
+    return client
@@ -0,0 +1,189 @@
+"""오프라인 병렬 처리 - LLM 없는 태깅/통계를 프로세스 풀로 분할 실행
+
+수백만 건 백필처럼 규칙 기반 태깅과 통계 집계가 한 프로세스에 묶이지 않도록
+JSONL 파일을 줄 경계에 맞춘 바이트 구간으로 나눠 워커 프로세스에서 처리한다.
+구간은 파일 순서대로 병합하므로 출력 파일과 통계는 직렬 실행과 동일하다.
+블록 압축 코퍼스(.vvb)는 바이트 대신 블록 번호 구간으로 나눈다.
+
+    performance:
+      offline_workers: 8
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+from .blockstore import BlockFile, corpus_writer, is_block_file, is_block_path, split_blocks
+from .config import Config
+from .tracing import tracer
+from .workspace import atomic_write
+
+# 병렬 처리를 시작할 최소 파일 크기 (작은 파일은 프로세스 풀 기동 비용이 더 큼)
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+# 워커당 구간 수 (구간 크기 편차를 흡수)
+CHUNKS_PER_WORKER = 4
+
+
+def split_ranges(path: Path, n: int) -> list[tuple[int, int]]:
+    """파일을 줄 경계에 맞춘 최대 n 개의 [start, end) 바이트 구간으로 분할 (.vvb 는 블록 구간)"""
+    if is_block_file(path):
+        return split_blocks(path, n)
+    size = Path(path).stat().st_size
+    if size == 0:
+        return []
+
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, n):
+            target = size * i // n
+            if target <= bounds[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()  # target-1 이 줄바꿈이면 target 이 곧 줄 시작
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _iter_lines(path: Path, start: int, end: int):
+    """바이트 구간(.vvb 는 블록 구간)의 비어 있지 않은 줄 순회"""
+    if is_block_file(path):
+        with BlockFile(path) as bf:
+            yield from bf.iter_lines(start, end)
+        return
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        for line in f:
+            if pos >= end:
+                break
+            pos += len(line)
+            if line.strip():
+                yield line
+
+
+def _iter_range(path: Path, start: int, end: int):
+    """바이트 구간의 JSON 레코드 순회"""
+    for line in _iter_lines(path, start, end):
+        yield json.loads(line)
+
+
+def _count_range(path: str, start: int, end: int) -> int:
+    """워커: 구간의 레코드 수 (raw_index 기준점 계산용)"""
+    return sum(1 for _ in _iter_lines(Path(path), start, end))
+
+
+def _tag_range(config: Config, path: str, start: int, end: int, part_path: str, base_index: int) -> dict:
+    """워커: 구간 태깅 → part 파일, 통계 부분 집계 반환
+
+    원본 리뷰는 직렬 태깅과 같은 CompactReview 로 읽어 빠진 필드의 기본값도 같다.
+    """
+    from .agents.tagger import ReviewTagger
+    from .agents.synthesizer import new_stats, accumulate_stats
+    from .records import Codebooks, CompactReview
+
+    tagger = ReviewTagger(config)
+    books = Codebooks()
+    partial = new_stats()
+    batch = []
+    next_index = base_index
+
+    with open(part_path, "w", encoding="utf-8") as out:
+        def flush():
+            nonlocal next_index
+            for t in tagger._fallback_tagging(batch):
+                t.raw_index = next_index
+                next_index += 1
+                row = t.to_row()
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                accumulate_stats(partial, row)
+            batch.clear()
+
+        for offset, row in enumerate(_iter_range(Path(path), start, end)):
+            batch.append(CompactReview(books, base_index + offset, row))
+            if len(batch) >= tagger.batch_size:
+                flush()
+        if batch:
+            flush()
+
+    return partial
+
+
+def _stats_range(path: str, start: int, end: int) -> dict:
+    """워커: 구간 통계 부분 집계"""
+    from .agents.synthesizer import new_stats, accumulate_stats
+
+    partial = new_stats()
+    for record in _iter_range(Path(path), start, end):
+        accumulate_stats(partial, record)
+    return partial
+
+
+def tag_offline_parallel(config: Config, raw_reviews_path: Path, output_path: Path, workers: int) -> dict:
+    """규칙 기반 태깅을 병렬 실행하고 결과 파일을 원자적으로 조립
+
+    Returns:
+        태깅 결과 통계 (synthesizer._compute_stats 와 동일한 형식)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from .agents.synthesizer import merge_stats, finalize_stats
+
+    ranges = split_ranges(raw_reviews_path, workers * CHUNKS_PER_WORKER)
+    output_path = Path(output_path)
+    part_dir = output_path.with_name(f".{output_path.name}.{os.getpid()}.parts")
+    part_dir.mkdir(parents=True, exist_ok=True)
+    part_paths = [part_dir / f"{i:05d}.jsonl" for i in range(len(ranges))]
+
+    try:
+        with tracer.span("parallel.tag", chunks=len(ranges), workers=workers):
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # 구간별 레코드 수 → raw_index 기준점 (직렬 태깅의 줄 번호와 동일)
+                counts = [
+                    future.result()
+                    for future in [pool.submit(_count_range, str(raw_reviews_path), start, end) for start, end in ranges]
+                ]
+                bases = [sum(counts[:i]) for i in range(len(counts))]
+                futures = [
+                    pool.submit(_tag_range, config, str(raw_reviews_path), start, end, str(part), base)
+                    for (start, end), part, base in zip(ranges, part_paths, bases)
+                ]
+                partials = [future.result() for future in futures]
+
+        with tracer.span("io.write_tagged_reviews"):
+            _assemble(config, part_paths, output_path)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+    return finalize_stats(merge_stats(partials))
+
+
+def _assemble(config: Config, part_paths: list[Path], output_path: Path) -> None:
+    """part 파일을 순서대로 이어 결과 파일 생성 (.vvb 면 블록 압축)"""
+    if not is_block_path(output_path):
+        with atomic_write(output_path, "wb") as f:
+            for part in part_paths:
+                with open(part, "rb") as src:
+                    shutil.copyfileobj(src, f)
+        return
+    with corpus_writer(output_path, config.storage_codec, config.storage_block_records) as f:
+        for part in part_paths:
+            with open(part, "rb") as src:
+                for line in src:
+                    f.write(line)
+
+
+def compute_stats_parallel(path: Path, workers: int) -> dict:
+    """태깅 파일 통계를 병렬 집계"""
+    from concurrent.futures import ProcessPoolExecutor
+    from .agents.synthesizer import merge_stats, finalize_stats
+
+    ranges = split_ranges(path, workers * CHUNKS_PER_WORKER)
+    with tracer.span("parallel.stats", chunks=len(ranges), workers=workers):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_stats_range, str(path), start, end) for start, end in ranges]
+            partials = [future.result() for future in futures]
+    return finalize_stats(merge_stats(partials))
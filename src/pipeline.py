@@ -0,0 +1,355 @@
+"""스테이지 DAG 실행기 - 입력 지문이 같으면 건너뛰기 (make 방식)
+
+각 스테이지는 입력(설정값, 경쟁작 목록, 프롬프트 버전)과 출력 파일을 선언한다.
+상위 스테이지 산출물의 해시도 입력 지문에 포함되므로, 아이디어만 바뀐 경우
+수집/태깅은 건너뛰고 합성/리포트만 다시 실행된다. 실패했거나 부분/빈 결과로
+끝난 스테이지는 매니페스트에 상태를 남기고 다음 실행에서 다시 실행한다.
+"""
+import hashlib
+import json
+from pathlib import Path
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+
+from .config import Config
+from .tracing import tracer
+
+MANIFEST_FILE = ".manifest.json"
+STAGE_ORDER = ["mine", "tag", "synthesize", "report"]
+
+
+def text_digest(*parts: str) -> str:
+    """문자열 묶음의 짧은 해시 (프롬프트 버전 등)"""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def file_digest(path: Path) -> Optional[str]:
+    """파일 내용 해시 (없으면 None)"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class Stage:
+    name: str
+    title: str
+    run: Callable[[dict], Any]  # 상위 결과 dict → 결과
+    outputs: list[Path]
+    params: dict = field(default_factory=dict)  # 지문 재료 (JSON 직렬화 가능해야 함)
+    deps: list[str] = field(default_factory=list)
+    load: Optional[Callable[[dict], Any]] = None  # 건너뛸 때 기존 결과 로드
+    status: Optional[Callable[[Any], str]] = None  # 결과 → "ok" | "partial" | "empty" (ok 가 아니면 다음 실행에서 재실행)
+
+
+class StageRunner:
+    """매니페스트 기반 스테이지 실행기"""
+
+    def __init__(
+        self,
+        manifest_path: Path,
+        force_stages: Optional[list[str]] = None,
+        from_stage: Optional[str] = None,
+        announce: Callable[[Stage], None] = None,
+    ):
+        self.manifest_path = Path(manifest_path)
+        self.force_stages = set(force_stages or [])
+        self.from_stage = from_stage
+        self.announce = announce or (lambda stage: print(f"\n━━━ {stage.title} ━━━"))
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.manifest_path)
+
+    def fingerprint(self, stage: Stage) -> str:
+        """스테이지 입력 지문 = 파라미터 + 상위 산출물 해시"""
+        upstream = {
+            dep: self.manifest.get(dep, {}).get("outputs", {})
+            for dep in stage.deps
+        }
+        payload = json.dumps(
+            {"params": stage.params, "upstream": upstream},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _is_forced(self, stage: Stage, order: list[str]) -> bool:
+        if stage.name in self.force_stages:
+            return True
+        if self.from_stage and self.from_stage in order:
+            return order.index(stage.name) >= order.index(self.from_stage)
+        return False
+
+    def _is_fresh(self, stage: Stage, fingerprint: str) -> bool:
+        entry = self.manifest.get(stage.name)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        # 실패/부분/빈 결과는 같은 입력이어도 다시 실행
+        if entry.get("status", "ok") != "ok":
+            return False
+        # 산출물이 사라졌거나 수동으로 수정된 경우 재실행
+        recorded = entry.get("outputs", {})
+        for path in stage.outputs:
+            if recorded.get(Path(path).name) != file_digest(path):
+                return False
+        return stage.load is not None
+
+    def run(self, stages: list[Stage]) -> dict[str, Any]:
+        """순서대로 실행 (최신 스테이지는 건너뜀)"""
+        order = [s.name for s in stages]
+        results: dict[str, Any] = {}
+
+        for stage in stages:
+            self.announce(stage)
+            fingerprint = self.fingerprint(stage)
+
+            if not self._is_forced(stage, order) and self._is_fresh(stage, fingerprint):
+                print(f"⏭️ 최신 상태 - 건너뜀 ({fingerprint[:12]})")
+                results[stage.name] = stage.load(results)
+                continue
+
+            try:
+                with tracer.span(f"stage.{stage.name}", fingerprint=fingerprint[:12]):
+                    results[stage.name] = stage.run(results)
+            except Exception as e:
+                self.manifest[stage.name] = {
+                    "fingerprint": fingerprint,
+                    "status": "error",
+                    "error": f"{type(e).__name__}: {e}",
+                    "finished_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                self._save_manifest()
+                raise
+
+            status = stage.status(results[stage.name]) if stage.status else "ok"
+            if status != "ok":
+                print(f"⚠️ {stage.name}: {status} - 다음 실행에서 다시 실행")
+            self.manifest[stage.name] = {
+                "fingerprint": fingerprint,
+                "status": status,
+                "outputs": {Path(p).name: file_digest(p) for p in stage.outputs},
+                "params": stage.params,
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._save_manifest()
+
+        return results
+
+
+def parse_competitors(comp_str: str) -> list[dict]:
+    """'Game1:appid1,Game2:appid2' 형식 파싱"""
+    competitors = []
+    for item in comp_str.split(","):
+        item = item.strip()
+        if ":" in item:
+            name, appid = item.rsplit(":", 1)
+            competitors.append({"name": name.strip(), "appid": appid.strip()})
+        else:
+            # appid만 있는 경우
+            competitors.append({"name": item, "appid": item})
+    return competitors
+
+
+def mine_params(config: Config, competitors: list[dict]) -> dict:
+    """수집 스테이지 입력 (지문/공유 코퍼스 키 재료)"""
+    return {
+        "competitors": [[c["name"], str(c["appid"])] for c in competitors],
+        "reviews_per_game": config.reviews_per_game,
+        "language": config.language,
+        "sentiment_ratio": config.sentiment_ratio,
+        "recent_months": config.recent_months,
+        "steam_base_url": config.steam_base_url,
+    }
+
+
+def corpus_key(config: Config, competitors: list[dict], today: Optional[date] = None) -> str:
+    """같은 수집 조건 + 엔드포인트 + 기간 버킷이면 같은 공유 코퍼스 키
+
+    recent_months 는 실행 시점 기준이므로 corpus_ttl_days 일 단위로 키를 바꿔
+    오래된 코퍼스를 재사용하지 않는다 (0 = 만료 없음).
+    """
+    params = mine_params(config, competitors)
+    if config.corpus_ttl_days:
+        params["bucket"] = (today or date.today()).toordinal() // config.corpus_ttl_days
+    return text_digest(json.dumps(params, ensure_ascii=False, sort_keys=True))
+
+
+def build_stages(
+    config: Config,
+    idea: str,
+    genre: str,
+    competitors: list[dict],
+    llm_client=None,
+    refresh_corpus: bool = False,
+) -> list[Stage]:
+    """Miner → Tagger → Synthesizer → Editor 스테이지 정의
+
+    refresh_corpus 가 False 면 같은 수집 조건의 공유 코퍼스가 있을 때
+    다시 수집하지 않고 실행 디렉터리로 링크한다.
+    """
+    from .agents import ReviewMiner, ReviewTagger, PersonaSynthesizer, ReportEditor
+    from .agents.tagger import TAGGING_SYSTEM_PROMPT, TAGGING_USER_TEMPLATE
+    from .agents.synthesizer import (
+        SYNTHESIS_SYSTEM_PROMPT,
+        SYNTHESIS_USER_TEMPLATE,
+        load_synthesis_result,
+        save_stats,
+    )
+    from .blockstore import data_size
+    from .budget import budget_for
+    from .frameworks import FRAMEWORK_PATH
+    from .workspace import corpus_path, link_or_copy, publish_to_corpus
+
+    # 실행 예산: 수집량은 수집 스테이지 시작 시 계획하고, 나머지는 스테이지 실행 중에 판단
+    budget = budget_for(config)
+
+    raw_path = config.output_dir / config.raw_reviews_file
+    tagged_path = config.output_dir / config.tagged_reviews_file
+    personas_path = config.output_dir / config.personas_file
+    report_path = config.output_dir / config.report_file
+    stats_path = config.output_dir / config.stats_file
+    # LLM 프로바이더가 바뀌면 태깅/합성 재실행
+    llm_id = getattr(llm_client, "name", True) if llm_client is not None else False
+
+    mined = {"status": "ok"}
+    tagged = {"status": "ok"}
+
+    def mine(results: dict) -> Path:
+        # 예산에 맞춘 수집량 (건너뛰는 실행에서는 계획/하향 경고 없음)
+        mine_config = budget.plan_mining(config, competitors) if budget else config
+        corpus_raw = corpus_path(mine_config, corpus_key(mine_config, competitors), config.raw_reviews_file)
+        if corpus_raw.exists() and not refresh_corpus:
+            print(f"🔗 공유 코퍼스 사용: {corpus_raw}")
+            link_or_copy(corpus_raw, raw_path)
+            complete = True
+        else:
+            miner = ReviewMiner(mine_config)
+            miner.collect(competitors)
+            complete = miner.complete
+            # 오류 없이 끝난 비어 있지 않은 수집만 다른 실행과 공유
+            if complete and data_size(raw_path):
+                publish_to_corpus(raw_path, corpus_raw)
+        # 오류/예산 중단으로 일부만 모았거나 리뷰가 0개면 다음 실행에서 다시 수집
+        if not complete:
+            mined["status"] = "partial"
+        elif data_size(raw_path) == 0:
+            mined["status"] = "empty"
+        else:
+            mined["status"] = "ok"
+        return raw_path
+
+    def tag(results: dict) -> Path:
+        tagger = ReviewTagger(config, llm_client)
+        path = tagger.tag_reviews(results["mine"])
+        # 마감 중단/규칙 기반 전환으로 끝난 태깅은 다음 실행에서 다시 태깅
+        tagged["status"] = "ok" if tagger.complete else "partial"
+        return path
+
+    def report(results: dict) -> Path:
+        stats = PersonaSynthesizer(config, llm_client)._compute_stats(results["tag"])
+        save_stats(stats_path, stats)
+        editor = ReportEditor(config)
+        return editor.generate(
+            results["synthesize"], idea, genre, competitors, stats,
+            budget=budget.snapshot() if budget else None,
+        )
+
+    stages = [
+        Stage(
+            name="mine",
+            title="Agent A: Review Miner",
+            run=mine,
+            load=lambda r: raw_path,
+            status=lambda path: mined["status"],
+            outputs=[raw_path],
+            # 예산/마감은 계획된 수집량을 바꾸므로 지문에만 포함 (공유 코퍼스 키는 실제 수집량 기준)
+            params={**mine_params(config, competitors), "budget": config.budget, "deadline": config.deadline_s},
+        ),
+        Stage(
+            name="tag",
+            title="Agent B: Review Tagger",
+            run=tag,
+            load=lambda r: tagged_path,
+            status=lambda path: tagged["status"],
+            outputs=[tagged_path],
+            deps=["mine"],
+            params={
+                "tagging_model": config.tagging_model,
+                "batch_size": config.batch_size,
+                "prompt": text_digest(TAGGING_SYSTEM_PROMPT, TAGGING_USER_TEMPLATE),
+                "llm": llm_id,
+                "budget": config.budget,
+                "deadline": config.deadline_s,
+            },
+        ),
+        Stage(
+            name="synthesize",
+            title="Agent C+D: Persona Synthesizer",
+            run=lambda r: PersonaSynthesizer(config, llm_client).synthesize(r["tag"], idea, genre),
+            load=lambda r: load_synthesis_result(personas_path),
+            outputs=[personas_path],
+            deps=["tag"],
+            params={
+                "idea": idea,
+                "genre": genre,
+                "analysis_model": config.analysis_model,
+                "prompt": text_digest(SYNTHESIS_SYSTEM_PROMPT, SYNTHESIS_USER_TEMPLATE),
+                "frameworks": file_digest(FRAMEWORK_PATH),
+                "llm": llm_id,
+                "budget": config.budget,
+            },
+        ),
+        Stage(
+            name="report",
+            title="Agent E: Report Editor",
+            run=report,
+            load=lambda r: report_path,
+            outputs=[report_path, stats_path],
+            deps=["tag", "synthesize"],
+            params={
+                "idea": idea,
+                "genre": genre,
+                "competitors": [c["name"] for c in competitors],
+                "preset": config.preset,
+            },
+        ),
+    ]
+
+    if budget:
+        for stage in stages:
+            stage.run = _with_budget(budget, stage.name, stage.run)
+    return stages
+
+
+def _with_budget(budget, name: str, run: Callable[[dict], Any]) -> Callable[[dict], Any]:
+    """스테이지 실행 중 current_budget() 이 실행 예산을 가리키도록"""
+    def wrapped(results: dict):
+        with budget.activate():
+            budget.begin_stage(name)
+            return run(results)
+    return wrapped
@@ -0,0 +1,176 @@
+"""메모리 절약형 리뷰 레코드 - 범주형 코드 + 문자열 intern
+
+수십만~수백만 건을 메모리에 들고 있어야 하는 경우(마감 모드 우선순위 태깅)를 위해
+리뷰/태깅 결과를 __slots__ 객체로 보관한다. 게임/언어/감성 같은 범주형 값은
+Codebook 의 작은 정수 코드로, 태그 목록은 조합 단위 코드로 저장하므로 레코드마다
+같은 문자열이 반복 생성되지 않는다.
+
+    books = Codebooks()
+    for review in iter_reviews(raw_path, books):
+        review["game"], review.get("playtime_hours", 0)   # dict 처럼 읽기 전용 접근
+
+태그 목록은 비트셋 대신 (순서를 보존하는) 조합 코드로 저장한다. 태그 순서가 통계의
+첫 등장 순서를 결정하므로 출력이 dict 기반 처리와 바이트 단위로 같아야 하기 때문이다.
+"""
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .blockstore import count_lines, iter_lines
+
+REVIEW_FIELDS = ("game", "appid", "review_id", "language", "sentiment", "text", "playtime_hours", "timestamp")
+
+
+def intern_value(value):
+    """문자열(및 문자열 튜플)을 intern - 같은 값은 한 객체를 공유"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (tuple, list)):
+        return tuple(intern_value(v) for v in value)
+    return value
+
+
+def as_list(value) -> list:
+    """태그 목록 필드 정규화 (LLM 이 문자열 하나나 null 을 돌려준 경우)"""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+class Codebook:
+    """범주형 값 ↔ 작은 정수 코드 (첫 등장 순서)"""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, values: Iterable = ()):
+        self.values: list = []
+        self._codes: dict = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value) -> int:
+        if isinstance(value, list):
+            value = tuple(value)
+        code = self._codes.get(value)
+        if code is None:
+            value = intern_value(value)
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __getitem__(self, code: int):
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class Codebooks:
+    """한 번의 처리에서 공유하는 코드표 묶음"""
+
+    __slots__ = ("games", "languages", "sentiments", "player_types", "tag_lists")
+
+    def __init__(self):
+        self.games = Codebook()  # (game, appid)
+        self.languages = Codebook()
+        self.sentiments = Codebook()
+        self.player_types = Codebook()
+        self.tag_lists = Codebook()  # session_style / pain_points / delights 조합
+
+
+class CompactReview:
+    """원본 리뷰 1건 (Review 와 같은 키로 읽기 전용 dict 접근 지원)"""
+
+    __slots__ = (
+        "books", "raw_index", "game_code", "language_code", "sentiment_code",
+        "review_id", "text", "playtime_hours", "timestamp",
+    )
+
+    def __init__(self, books: Codebooks, raw_index: int, row: dict):
+        self.books = books
+        self.raw_index = raw_index
+        self.game_code = books.games.code((row["game"], str(row["appid"])))
+        self.language_code = books.languages.code(row.get("language", "unknown"))
+        self.sentiment_code = books.sentiments.code(row["sentiment"])
+        self.review_id = row["review_id"]
+        self.text = row.get("text", "")
+        self.playtime_hours = row.get("playtime_hours", 0)
+        self.timestamp = row.get("timestamp", "")
+
+    def __getitem__(self, key: str):
+        if key == "game":
+            return self.books.games[self.game_code][0]
+        if key == "appid":
+            return self.books.games[self.game_code][1]
+        if key == "language":
+            return self.books.languages[self.language_code]
+        if key == "sentiment":
+            return self.books.sentiments[self.sentiment_code]
+        if key in ("review_id", "text", "playtime_hours", "timestamp"):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in REVIEW_FIELDS}
+
+
+class CompactTagged:
+    """태깅 결과 1건 (메타데이터는 원본 리뷰 레코드를 참조)"""
+
+    __slots__ = ("review", "player_type_code", "session_code", "pain_code", "delight_code", "quotes", "notes")
+
+    def __init__(self, review: CompactReview, tagged):
+        books = review.books
+        self.review = review
+        self.player_type_code = books.player_types.code(tagged.player_type_guess)
+        self.session_code = books.tag_lists.code(as_list(tagged.session_style))
+        self.pain_code = books.tag_lists.code(as_list(tagged.pain_points))
+        self.delight_code = books.tag_lists.code(as_list(tagged.delights))
+        self.quotes = tuple(as_list(tagged.quotes))
+        self.notes = sys.intern(tagged.notes or "")  # 규칙 기반 태깅은 모두 같은 문자열
+
+    @property
+    def raw_index(self) -> int:
+        return self.review.raw_index
+
+    @property
+    def game(self) -> str:
+        return self.review["game"]
+
+    def to_dict(self) -> dict:
+        """asdict(TaggedReview) 와 같은 키 순서"""
+        review, books = self.review, self.review.books
+        return {
+            "game": review["game"],
+            "appid": review["appid"],
+            "review_id": review.review_id,
+            "language": review["language"],
+            "sentiment": review["sentiment"],
+            "player_type_guess": books.player_types[self.player_type_code],
+            "session_style": list(books.tag_lists[self.session_code]),
+            "pain_points": list(books.tag_lists[self.pain_code]),
+            "delights": list(books.tag_lists[self.delight_code]),
+            "quotes": list(self.quotes),
+            "notes": self.notes,
+            "raw_index": review.raw_index,
+        }
+
+
+def iter_reviews(path: Path, books: Codebooks) -> Iterator[CompactReview]:
+    """raw_reviews.jsonl 스트리밍 로드 (raw_index = 비어 있지 않은 줄 번호 = 리뷰 저장소 레코드 번호)"""
+    for index, line in enumerate(iter_lines(path)):
+        yield CompactReview(books, index, json.loads(line))
+
+
+def count_records(path: Path) -> int:
+    """JSONL 레코드 수 (파싱 없이 줄 단위로 셈, .vvb 는 블록 인덱스)"""
+    return count_lines(path)
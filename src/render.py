@@ -0,0 +1,334 @@
+"""리포트 재렌더링 - 저장된 산출물로 Markdown/HTML/JSON 리포트 생성 (수집/태깅/LLM 없음)
+
+    python main.py render                                      # output/runs/* + output 전체
+    python main.py render output/runs/20250101-* --format md,html,json --workers 8
+
+실행 디렉터리의 personas.json, stats.json, budget.json 과 매니페스트(.manifest.json)의
+스테이지 입력(아이디어, 장르, 경쟁작, 프리셋)만 읽어 리포트를 다시 만든다.
+stats.json 이 없는 이전 실행은 tagged_reviews.jsonl 에서 통계를 다시 집계한다.
+
+결과는 report.rendered.{md,html,json} 으로 써서 파이프라인이 남긴 report.md 는 건드리지 않는다.
+
+여러 실행은 프로세스 풀로 나눠 렌더링하며, 워커는 템플릿/정규식을 한 번만 준비해
+여러 실행에 재사용한다. 끝나면 실행 간 인덱스(index.html, index.json)를 남긴다.
+"""
+import html
+import json
+import os
+import re
+from pathlib import Path
+from dataclasses import asdict, replace
+from datetime import datetime
+from string import Template
+from typing import Optional
+
+from .budget import BUDGET_FILE
+from .config import Config
+from .pipeline import MANIFEST_FILE
+from .workspace import RUNS_DIR, atomic_write
+
+FORMATS = ("md", "html", "json")
+INDEX_FILE = "index"
+RENDERED_SUFFIX = ".rendered"  # 파이프라인 원본 리포트와 구분
+
+_PAGE = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>
+body { font-family: -apple-system, "Apple SD Gothic Neo", "Malgun Gothic", sans-serif; max-width: 960px; margin: 2rem auto; padding: 0 1rem; line-height: 1.6; color: #222; }
+table { border-collapse: collapse; width: 100%; margin: 1rem 0; }
+th, td { border: 1px solid #ddd; padding: .4rem .6rem; text-align: left; vertical-align: top; }
+th { background: #f5f5f5; }
+blockquote { margin: 0; padding: .2rem 1rem; border-left: 4px solid #ddd; color: #555; }
+code { background: #f3f3f3; padding: 0 .25rem; border-radius: 3px; }
+.decision-Go { color: #1a7f37; } .decision-Iterate { color: #9a6700; } .decision-Kill { color: #cf222e; }
+</style>
+</head>
+<body>
+$body
+</body>
+</html>
+""")
+
+# Markdown → HTML (리포트 템플릿이 쓰는 문법만)
+_HEADING = re.compile(r"^(#{1,6}) (.*)$")
+_LIST_ITEM = re.compile(r"^(?:(\d+)\.|-) (.*)$")  # "1. ..." | "- ..." (들여쓰기 없음)
+_SUB_ITEM = re.compile(r"^\s+- (.*)$")
+_TABLE_SEP = re.compile(r"^\|[\s\-:|]+\|$")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_CODE = re.compile(r"`([^`]+)`")
+
+
+def _inline(text: str) -> str:
+    text = html.escape(text.rstrip(), quote=False)
+    return _CODE.sub(r"<code>\1</code>", _BOLD.sub(r"<strong>\1</strong>", text))
+
+
+def _cells(line: str) -> list[str]:
+    return [c.strip() for c in line.strip().strip("|").split("|")]
+
+
+def markdown_to_html(markdown: str) -> str:
+    """리포트 Markdown 을 HTML 본문으로 변환"""
+    out = []
+    lines = markdown.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped:
+            i += 1
+        elif stripped == "---":
+            out.append("<hr>")
+            i += 1
+        elif m := _HEADING.match(stripped):
+            level = len(m.group(1))
+            out.append(f"<h{level}>{_inline(m.group(2))}</h{level}>")
+            i += 1
+        elif stripped.startswith("|"):
+            rows = []
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                if not _TABLE_SEP.match(lines[i].strip()):
+                    rows.append(_cells(lines[i]))
+                i += 1
+            head, body = rows[0], rows[1:]
+            out.append("<table><thead><tr>" + "".join(f"<th>{_inline(c)}</th>" for c in head) + "</tr></thead><tbody>")
+            out.extend("<tr>" + "".join(f"<td>{_inline(c)}</td>" for c in row) + "</tr>" for row in body)
+            out.append("</tbody></table>")
+        elif stripped.startswith(">"):
+            quoted = []
+            while i < len(lines) and lines[i].strip().startswith(">"):
+                quoted.append(_inline(lines[i].strip().lstrip(">").strip()))
+                i += 1
+            out.append("<blockquote><p>" + "<br>".join(quoted) + "</p></blockquote>")
+        elif m := _LIST_ITEM.match(line):
+            tag = "ol" if m.group(1) else "ul"
+            start = f' start="{m.group(1)}"' if m.group(1) and m.group(1) != "1" else ""
+            items = []
+            while i < len(lines) and lines[i].strip():
+                if item := _LIST_ITEM.match(lines[i]):
+                    items.append([_inline(item.group(2))])
+                elif items and (sub := _SUB_ITEM.match(lines[i])):
+                    items[-1].append(f"<ul><li>{_inline(sub.group(1))}</li></ul>")
+                else:
+                    break
+                i += 1
+            out.append(f"<{tag}{start}>" + "".join(f"<li>{''.join(item)}</li>" for item in items) + f"</{tag}>")
+        else:
+            para = []
+            while i < len(lines) and lines[i].strip() and not _is_block_start(lines[i]):
+                para.append(_inline(lines[i].strip()))
+                i += 1
+            out.append("<p>" + "<br>".join(para) + "</p>")
+    return "\n".join(out)
+
+
+def _is_block_start(line: str) -> bool:
+    stripped = line.strip()
+    return (stripped == "---" or stripped.startswith(("|", ">"))
+            or bool(_HEADING.match(stripped)) or bool(_LIST_ITEM.match(line)))
+
+
+# ── 실행 산출물 로드 ─────────────────────────────────────────
+
+def find_runs(config: Config, paths: Optional[list[str]] = None) -> list[Path]:
+    """렌더링 대상 실행 디렉터리 (personas.json 이 있는 디렉터리)
+
+    경로가 실행 디렉터리면 그대로, 아니면 바로 아래 실행 디렉터리들을 모은다.
+    기본값은 runs 디렉터리 + 출력 디렉터리 (run ID 없이 실행한 결과).
+    """
+    roots = [Path(p) for p in paths] if paths else [config.shared_root() / RUNS_DIR, config.output_dir]
+    runs = []
+    for root in roots:
+        if (root / config.personas_file).exists():
+            candidates = [root]
+        elif root.is_dir():
+            candidates = sorted(p for p in root.iterdir() if (p / config.personas_file).exists())
+        else:
+            candidates = []
+        for run_dir in candidates:
+            if run_dir.resolve() not in {r.resolve() for r in runs}:
+                runs.append(run_dir)
+    return runs
+
+
+def _load_json(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def run_inputs(run_dir: Path) -> dict:
+    """매니페스트의 스테이지 입력 → {idea, genre, competitors, preset, finished_at}"""
+    manifest = _load_json(Path(run_dir) / MANIFEST_FILE) or {}
+    report = manifest.get("report", {}).get("params", {})
+    synthesize = manifest.get("synthesize", {}).get("params", {})
+    mined = manifest.get("mine", {}).get("params", {}).get("competitors")
+    if mined:
+        competitors = [{"name": name, "appid": appid} for name, appid in mined]
+    else:
+        competitors = [{"name": name} for name in report.get("competitors", [])]
+    return {
+        "idea": report.get("idea") or synthesize.get("idea") or "",
+        "genre": report.get("genre") or synthesize.get("genre") or "unknown",
+        "competitors": competitors,
+        "preset": report.get("preset"),
+        "finished_at": manifest.get("synthesize", {}).get("finished_at") or manifest.get("report", {}).get("finished_at"),
+    }
+
+
+def _run_stats(config: Config, run_dir: Path) -> Optional[dict]:
+    """stats.json (없으면 태깅 파일에서 재집계, 둘 다 없으면 None)"""
+    from .agents.synthesizer import PersonaSynthesizer, load_stats
+
+    stats_path = run_dir / config.stats_file
+    if stats_path.exists():
+        return load_stats(stats_path)
+    tagged_path = run_dir / config.tagged_reviews_file
+    if tagged_path.exists():
+        return PersonaSynthesizer(config)._compute_stats(tagged_path)
+    return None
+
+
+def _report_json(run_id: str, inputs: dict, result, context: dict, stats: Optional[dict], budget: Optional[dict]) -> dict:
+    return {
+        "run_id": run_id,
+        "idea": inputs["idea"],
+        "genre": inputs["genre"],
+        "competitors": inputs["competitors"],
+        "preset": context["preset"].lower(),
+        "decision": context["decision"],
+        "decision_notes": context["decision_notes"],
+        "top_personas": result.top_personas,
+        "top_risk": result.top_risk,
+        "personas": [asdict(p) for p in result.personas],
+        "validations": [asdict(v) for v in result.validations],
+        "risks": [asdict(r) for r in result.risks],
+        "stats": {k: stats[k] for k in ("summary", "pain_dist", "delight_dist")} if stats else None,
+        "budget": budget,
+    }
+
+
+def render_run(config: Config, run_dir: Path, formats: tuple[str, ...] = ("md",)) -> dict:
+    """실행 1개 렌더링 → 인덱스 항목"""
+    from .agents.editor import ReportEditor, render_markdown
+    from .agents.synthesizer import load_synthesis_result
+
+    run_dir = Path(run_dir)
+    inputs = run_inputs(run_dir)
+    run_config = replace(config, output_dir=run_dir, preset=inputs["preset"] or config.preset)
+    result = load_synthesis_result(run_dir / config.personas_file)
+    stats = _run_stats(run_config, run_dir)
+    budget = _load_json(run_dir / BUDGET_FILE)
+
+    context = ReportEditor(run_config).build_context(
+        result, inputs["idea"], inputs["genre"], inputs["competitors"], stats, budget,
+    )
+    markdown = render_markdown(context)
+
+    report_path = run_dir / config.report_file
+    outputs = {}
+    for fmt in formats:
+        if fmt == "md":
+            content = markdown
+        elif fmt == "html":
+            content = _PAGE.substitute(title=html.escape(f"Vibe Validation Report - {run_dir.name}"),
+                                       body=markdown_to_html(markdown))
+        else:
+            content = json.dumps(_report_json(run_dir.name, inputs, result, context, stats, budget),
+                                 ensure_ascii=False, indent=2)
+        path = report_path.with_suffix(f"{RENDERED_SUFFIX}.{fmt}")
+        with atomic_write(path) as f:
+            f.write(content)
+        outputs[fmt] = str(path)
+
+    return {
+        "run_id": run_dir.name,
+        "run_dir": str(run_dir),
+        "status": "done",
+        "idea": inputs["idea"],
+        "genre": inputs["genre"],
+        "finished_at": inputs["finished_at"],
+        "decision": context["decision"],
+        "top_personas": result.top_personas,
+        "personas": len(result.personas),
+        "reviews": context["total_reviews"],
+        "outputs": outputs,
+    }
+
+
+def _render_one(config: Config, run_dir: str, formats: tuple[str, ...]) -> dict:
+    """워커: 실패해도 다른 실행은 계속되도록 오류를 결과로 반환"""
+    try:
+        return render_run(config, Path(run_dir), formats)
+    except Exception as e:
+        return {"run_id": Path(run_dir).name, "run_dir": run_dir, "status": "error",
+                "error": f"{type(e).__name__}: {e}", "outputs": {}}
+
+
+def render_runs(config: Config, run_dirs: list[Path], formats: tuple[str, ...] = ("md",), workers: int = 4) -> list[dict]:
+    """여러 실행을 병렬 렌더링 (입력 순서대로 결과 반환)"""
+    run_dirs = [str(p) for p in run_dirs]
+    if workers <= 1 or len(run_dirs) <= 1:
+        return [_render_one(config, run_dir, formats) for run_dir in run_dirs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # 워커 안에서 통계 재집계가 또 프로세스 풀을 띄우지 않도록
+    config = replace(config, offline_workers=0)
+    workers = min(workers, len(run_dirs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            _render_one, [config] * len(run_dirs), run_dirs, [formats] * len(run_dirs),
+            chunksize=max(1, len(run_dirs) // (workers * 4)),
+        ))
+
+
+def write_index(index_dir: Path, entries: list[dict]) -> Path:
+    """실행 간 인덱스 (index.html + index.json, 최신 실행 먼저)"""
+    index_dir = Path(index_dir)
+    entries = sorted(entries, key=lambda e: e.get("finished_at") or e["run_id"], reverse=True)
+
+    with atomic_write(index_dir / f"{INDEX_FILE}.json") as f:
+        json.dump({"generated_at": datetime.now().isoformat(timespec="seconds"), "runs": entries},
+                  f, ensure_ascii=False, indent=2)
+
+    rows = []
+    for e in entries:
+        links = " ".join(
+            f'<a href="{html.escape(Path(os.path.relpath(path, index_dir)).as_posix())}">{fmt}</a>'
+            for fmt, path in e["outputs"].items()
+        )
+        if e["status"] != "done":
+            rows.append(f"<tr><td>{html.escape(e['run_id'])}</td><td colspan=\"7\">⚠️ {html.escape(e['error'])}</td></tr>")
+            continue
+        rows.append(
+            "<tr>"
+            f"<td>{html.escape(e['run_id'])}</td>"
+            f"<td>{html.escape((e['finished_at'] or '-').replace('T', ' '))}</td>"
+            f"<td>{html.escape(e['idea'][:80])}</td>"
+            f"<td>{html.escape(e['genre'])}</td>"
+            f"<td class=\"decision-{html.escape(e['decision'])}\"><strong>{html.escape(e['decision'])}</strong></td>"
+            f"<td>{html.escape(', '.join(e['top_personas']) or '-')} ({e['personas']}개)</td>"
+            f"<td>{html.escape(str(e['reviews']))}</td>"
+            f"<td>{links}</td>"
+            "</tr>"
+        )
+
+    body = (
+        f"<h1>Vibe Validation Reports</h1>\n<p>{len(entries)}개 실행 · "
+        f"생성 {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>\n"
+        "<table><thead><tr><th>Run</th><th>실행일</th><th>아이디어</th><th>장르</th><th>Decision</th>"
+        "<th>Top Personas</th><th>리뷰</th><th>리포트</th></tr></thead><tbody>\n"
+        + "\n".join(rows) + "\n</tbody></table>"
+    )
+    index_path = index_dir / f"{INDEX_FILE}.html"
+    with atomic_write(index_path) as f:
+        f.write(_PAGE.substitute(title="Vibe Validation Reports", body=body))
+    return index_path
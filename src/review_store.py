@@ -0,0 +1,299 @@
+"""리뷰 저장소 - mmap 텍스트 블롭 + review_id 오프셋 인덱스
+
+raw_reviews.jsonl 을 한 번 변환해 두면 리뷰 1건을 찾기 위해 JSONL 을 다시
+훑을 필요가 없다. 본문은 mmap 영역의 memoryview 로 복사 없이 돌려주고,
+review_id 는 파일에 들어 있는 해시 테이블로 O(1) 조회한다. 레코드 번호는
+JSONL 의 줄 번호와 같으므로 TaggedReview.raw_index 로 바로 조인할 수 있다.
+
+    build_store(raw_path, store_path)
+    with ReviewStore(store_path) as store:
+        store.text(store.index_of("1234567"))   # memoryview (zero-copy)
+        store.get("1234567")                    # Review 와 같은 필드의 dict
+
+파일 구성 (리틀 엔디언):
+    header   MAGIC, count, slot_count, 각 섹션 오프셋
+    strings  범주형 값 테이블 JSON (games=[name, appid], languages, sentiments)
+    records  count × RECORD (본문/키 위치, 범주 코드, 플레이타임)
+    slots    slot_count × SLOT (review_id 해시, 레코드 번호 + 1)
+    keys     review_id + timestamp 바이트
+    text     본문 UTF-8 바이트
+"""
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .blockstore import iter_lines
+from .workspace import atomic_write
+
+STORE_SUFFIX = ".vvs"
+MAGIC = b"VVSTORE1"
+
+HEADER = struct.Struct("<8sIIQQQQQQ")  # magic, count, slots, strings/records/slots/keys/text 오프셋, text 길이
+RECORD = struct.Struct("<QIQHBHBBf")  # text_off, text_len, key_off, id_len, ts_len, game, language, sentiment, playtime
+SLOT = struct.Struct("<QI")  # id hash, record + 1 (0 = 빈 칸)
+
+
+def _id_hash(review_id: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(review_id, digest_size=8).digest(), "little")
+
+
+def store_path_for(raw_path: Path) -> Path:
+    """raw_reviews.jsonl → raw_reviews.vvs"""
+    return Path(raw_path).with_suffix(STORE_SUFFIX)
+
+
+def build_store(raw_path: Path, store_path: Optional[Path] = None) -> Path:
+    """JSONL → 저장소 (스트리밍 변환, 레코드 순서 = 줄 순서)"""
+    raw_path = Path(raw_path)
+    store_path = Path(store_path) if store_path else store_path_for(raw_path)
+
+    categories = {"games": {}, "languages": {}, "sentiments": {}}
+
+    def code(kind: str, value) -> int:
+        table = categories[kind]
+        if value not in table:
+            table[value] = len(table)
+        return table[value]
+
+    hashes = array("Q")
+    with tempfile.TemporaryDirectory(dir=store_path.parent) as tmp:
+        records_path, keys_path, text_path = (Path(tmp) / name for name in ("records", "keys", "text"))
+        with open(records_path, "wb") as records, open(keys_path, "wb") as keys, open(text_path, "wb") as text:
+            for line in iter_lines(raw_path):
+                r = json.loads(line)
+                review_id = str(r["review_id"]).encode("utf-8")
+                timestamp = (r.get("timestamp") or "").encode("utf-8")
+                body = r.get("text", "").encode("utf-8")
+
+                records.write(RECORD.pack(
+                    text.tell(), len(body), keys.tell(), len(review_id), len(timestamp),
+                    code("games", (r["game"], str(r["appid"]))),
+                    code("languages", r.get("language", "unknown")),
+                    code("sentiments", r.get("sentiment", "")),
+                    float(r.get("playtime_hours", 0)),
+                ))
+                keys.write(review_id + timestamp)
+                text.write(body)
+                hashes.append(_id_hash(review_id))
+
+        # 오픈 어드레싱 해시 테이블 (적재율 50% 이하)
+        count = len(hashes)
+        slot_count = 1 << max(1, (count * 2 - 1).bit_length())
+        slots = bytearray(SLOT.size * slot_count)
+        mask = slot_count - 1
+        for index, h in enumerate(hashes):
+            i = h & mask
+            while SLOT.unpack_from(slots, i * SLOT.size)[1]:
+                i = (i + 1) & mask
+            SLOT.pack_into(slots, i * SLOT.size, h, index + 1)
+
+        strings = json.dumps(
+            {kind: [list(v) if isinstance(v, tuple) else v for v in table] for kind, table in categories.items()},
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        strings_off = HEADER.size
+        records_off = strings_off + len(strings)
+        slots_off = records_off + count * RECORD.size
+        keys_off = slots_off + len(slots)
+        text_off = keys_off + keys_path.stat().st_size
+        text_len = text_path.stat().st_size
+
+        with atomic_write(store_path, "wb") as out:
+            out.write(HEADER.pack(MAGIC, count, slot_count, strings_off, records_off, slots_off, keys_off, text_off, text_len))
+            out.write(strings)
+            for part in (records_path, None, keys_path, text_path):
+                if part is None:
+                    out.write(slots)
+                    continue
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out)
+
+    return store_path
+
+
+def ensure_store(raw_path: Path) -> Path:
+    """저장소가 없거나 JSONL 보다 오래됐으면 다시 만듦"""
+    raw_path = Path(raw_path)
+    store_path = store_path_for(raw_path)
+    if not store_path.exists() or store_path.stat().st_mtime_ns < raw_path.stat().st_mtime_ns:
+        build_store(raw_path, store_path)
+    return store_path
+
+
+class ReviewStore:
+    """읽기 전용 mmap 저장소 (여러 스레드에서 공유 가능)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        (magic, self.count, self.slot_count, strings_off, self._records_off,
+         self._slots_off, self._keys_off, self._text_off, text_len) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"리뷰 저장소 형식이 아닙니다: {path}")
+
+        strings = json.loads(bytes(self._view[strings_off:self._records_off]).decode("utf-8"))
+        self.games = [tuple(g) for g in strings["games"]]
+        self.languages = strings["languages"]
+        self.sentiments = strings["sentiments"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """mmap 해제 (text() 로 받은 memoryview 가 남아 있으면 GC 에 맡김)"""
+        try:
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+            if getattr(self, "_mm", None) is not None:
+                self._mm.close()
+        except BufferError:
+            pass
+        self._view = None
+        self._mm = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _record(self, index: int) -> tuple:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self._mm, self._records_off + index * RECORD.size)
+
+    def _key(self, record: tuple) -> tuple[bytes, bytes]:
+        start = self._keys_off + record[2]
+        id_end = start + record[3]
+        return self._mm[start:id_end], self._mm[id_end:id_end + record[4]]
+
+    def index_of(self, review_id: str) -> Optional[int]:
+        """review_id → 레코드 번호 (없으면 None)"""
+        key = str(review_id).encode("utf-8")
+        h = _id_hash(key)
+        mask = self.slot_count - 1
+        i = h & mask
+        while True:
+            slot_hash, ref = SLOT.unpack_from(self._mm, self._slots_off + i * SLOT.size)
+            if not ref:
+                return None
+            if slot_hash == h and self._key(self._record(ref - 1))[0] == key:
+                return ref - 1
+            i = (i + 1) & mask
+
+    def text(self, index: int) -> memoryview:
+        """본문 UTF-8 바이트 (mmap 위 memoryview, 복사 없음)"""
+        record = self._record(index)
+        start = self._text_off + record[0]
+        return self._view[start:start + record[1]]
+
+    def review(self, index: int) -> dict:
+        """레코드 번호 → Review 와 같은 필드의 dict"""
+        record = self._record(index)
+        review_id, timestamp = self._key(record)
+        game, appid = self.games[record[5]]
+        return {
+            "game": game,
+            "appid": appid,
+            "review_id": review_id.decode("utf-8"),
+            "language": self.languages[record[6]],
+            "sentiment": self.sentiments[record[7]],
+            "text": str(self.text(index), "utf-8"),
+            "playtime_hours": round(record[8], 1),
+            "timestamp": timestamp.decode("utf-8"),
+        }
+
+    def get(self, review_id: str) -> Optional[dict]:
+        index = self.index_of(review_id)
+        return None if index is None else self.review(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(self.count):
+            yield self.review(index)
+
+    def resolve(self, tagged: dict) -> Optional[int]:
+        """태깅 레코드 → 원본 레코드 번호 (raw_index 우선, 없으면 review_id 조회)"""
+        index = tagged.get("raw_index", -1)
+        if 0 <= index < self.count and self._key(self._record(index))[0] == str(tagged["review_id"]).encode("utf-8"):
+            return index
+        return self.index_of(tagged["review_id"])
+
+
+def verify_quotes(store: ReviewStore, tagged_path: Path) -> dict:
+    """태깅 인용문이 실제 원문에 있는지 확인 (원문 조인)"""
+    result = {"tagged": 0, "missing_raw": 0, "quotes": 0, "unverified": []}
+    for line in iter_lines(tagged_path):
+        t = json.loads(line)
+        result["tagged"] += 1
+        index = store.resolve(t)
+        if index is None:
+            result["missing_raw"] += 1
+            continue
+        if not t.get("quotes"):
+            continue
+        text = str(store.text(index), "utf-8").lower()
+        for quote in t["quotes"]:
+            result["quotes"] += 1
+            if quote.strip().lower() not in text:
+                result["unverified"].append({"review_id": t["review_id"], "quote": quote})
+    return result
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """python -m src.review_store build|get|verify ..."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="리뷰 저장소 (mmap + review_id 인덱스)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="JSONL → 저장소")
+    p_build.add_argument("raw")
+    p_build.add_argument("--out")
+    p_get = sub.add_parser("get", help="review_id 로 원문 조회")
+    p_get.add_argument("store", help=".vvs 또는 raw 코퍼스 (저장소가 없으면 생성)")
+    p_get.add_argument("review_id", nargs="+")
+    p_verify = sub.add_parser("verify", help="태깅 인용문을 원문과 대조")
+    p_verify.add_argument("store", help=".vvs 또는 raw 코퍼스 (저장소가 없으면 생성)")
+    p_verify.add_argument("tagged")
+    args = parser.parse_args(argv)
+
+    def store_arg(path: str) -> Path:
+        path = Path(path)
+        return path if path.suffix == STORE_SUFFIX else ensure_store(path)
+
+    if args.command == "build":
+        path = build_store(Path(args.raw), Path(args.out) if args.out else None)
+        with ReviewStore(path) as store:
+            print(f"💾 {path} ({len(store)}개 리뷰, {os.path.getsize(path):,} bytes)")
+    elif args.command == "get":
+        with ReviewStore(store_arg(args.store)) as store:
+            for review_id in args.review_id:
+                print(json.dumps(store.get(review_id), ensure_ascii=False))
+    else:
+        with ReviewStore(store_arg(args.store)) as store:
+            result = verify_quotes(store, Path(args.tagged))
+        print(
+            f"태깅 {result['tagged']}개 / 원문 없음 {result['missing_raw']}개 / "
+            f"인용 {result['quotes']}개 중 원문 불일치 {len(result['unverified'])}개"
+        )
+        for item in result["unverified"][:20]:
+            print(f"   ⚠️ [{item['review_id']}] {item['quote']}")
+        if result["missing_raw"] or result["unverified"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
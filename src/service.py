@@ -0,0 +1,391 @@
+"""로컬 검증 서비스 - 웜 캐시 + 작업 큐 + 워커 풀
+
+    python main.py serve --port 8765 --workers 2
+
+한 프로세스가 커넥션 풀, 프레임워크 번들, Steam 응답 캐시를 유지한 채로
+검증 작업을 큐로 받아 처리한다. Web UI 는 이 서비스가 제공하는 / 에서 열면
+공개 CORS 프록시 대신 이 서비스를 백엔드로 사용한다.
+
+다른 사이트가 브라우저를 통해 작업을 등록하거나 프록시를 쓰지 못하도록, 서비스 자신의
+origin (과 --allow-origin 으로 지정한 origin) 외의 Origin 헤더가 붙은 요청은 거부한다.
+
+API:
+    GET  /                              Web UI (ui/index.html)
+    GET  /api/health
+    POST /api/jobs                      {"idea", "genre", "competitors", "preset", "deadline"}
+    GET  /api/jobs
+    GET  /api/jobs/<id>
+    GET  /api/jobs/<id>/artifacts/<name>
+    GET  /api/jobs/<id>/reviews/<review_id>
+    GET  /api/steam?url=<steam-or-steamspy-url>
+"""
+import json
+import queue
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlparse, parse_qs, unquote
+
+from .config import Config, PRESETS, apply_preset
+from .frameworks import load_frameworks
+from .http_pool import get_session
+from .pipeline import build_stages, parse_competitors, StageRunner, MANIFEST_FILE
+from .review_store import ReviewStore, ensure_store
+from .tracing import tracer
+from .workspace import scoped_config
+
+# /api/steam 프록시 허용 호스트
+PROXY_HOSTS = {
+    "store.steampowered.com",
+    "api.steampowered.com",
+    "steamcommunity.com",
+    "steamspy.com",
+}
+PROXY_CACHE_TTL = 600  # 초
+PROXY_CACHE_SIZE = 512
+MAX_FINISHED_JOBS = 200  # 메모리에 남기는 완료/실패 작업 수 (산출물은 output/runs 에 유지)
+
+UI_PATH = Path(__file__).resolve().parent.parent / "ui" / "index.html"
+# 서비스가 제공한 UI 임을 표시 (UI 는 같은 origin 을 기본 백엔드로 사용)
+UI_BACKEND_META = '<meta name="vv-backend" content="same-origin">'
+
+CONTENT_TYPES = {
+    ".json": "application/json; charset=utf-8",
+    ".jsonl": "application/x-ndjson; charset=utf-8",
+    ".md": "text/markdown; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+}
+
+
+@dataclass
+class Job:
+    job_id: str
+    idea: str
+    genre: str
+    competitors: list[dict]
+    preset: str
+    output_dir: str
+    deadline_s: float = 0
+    status: str = "queued"  # queued | running | done | failed
+    stage: str = ""
+    error: str = ""
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    started_at: str = ""
+    finished_at: str = ""
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        output_dir = Path(self.output_dir)
+        data["artifacts"] = sorted(
+            p.name for p in output_dir.iterdir()
+            if p.is_file() and not p.name.startswith(".")
+        ) if output_dir.exists() else []
+        return data
+
+
+class ValidationService:
+    """작업 큐 + 워커 풀"""
+
+    def __init__(self, config: Config, workers: int = 2, llm_client=None):
+        self.config = config
+        self.workers = workers
+        self.llm_client = llm_client
+        self.jobs: dict[str, Job] = {}
+        self._jobs_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._threads: list[threading.Thread] = []
+
+        self._proxy_cache: OrderedDict[str, tuple[float, int, str, bytes]] = OrderedDict()
+        self._proxy_lock = threading.Lock()
+
+        # 웜업: 프레임워크 번들은 프로세스 캐시에 상주
+        load_frameworks()
+
+    # ── 작업 큐 ──────────────────────────────────────────────
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"vv-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self) -> None:
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join(timeout=5)
+        self._threads.clear()
+
+    def submit(self, payload: dict) -> Job:
+        """작업 등록"""
+        idea = (payload.get("idea") or "").strip()
+        competitors = payload.get("competitors") or []
+        if isinstance(competitors, str):
+            competitors = parse_competitors(competitors)
+        if not idea or not competitors:
+            raise ValueError("idea, competitors 는 필수입니다")
+
+        preset = payload.get("preset") or self.config.preset
+        if preset not in PRESETS:
+            raise ValueError(f"알 수 없는 프리셋: {preset}")
+
+        job_id = uuid.uuid4().hex[:12]
+        job = Job(
+            job_id=job_id,
+            idea=idea,
+            genre=payload.get("genre") or "unknown",
+            competitors=[{"name": c["name"], "appid": str(c["appid"])} for c in competitors],
+            preset=preset,
+            output_dir=str(scoped_config(self.config, job_id).output_dir),
+            deadline_s=float(payload.get("deadline") or 0),
+        )
+        with self._jobs_lock:
+            self.jobs[job_id] = job
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self) -> list[Job]:
+        with self._jobs_lock:
+            return sorted(self.jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = datetime.now().isoformat(timespec="seconds")
+
+        config = scoped_config(self.config, job.job_id)
+        if job.preset != config.preset:
+            apply_preset(config, job.preset)
+        if job.deadline_s:
+            config.deadline_s = job.deadline_s
+
+        def announce(stage):
+            job.stage = stage.name
+            print(f"[{job.job_id}] ━━━ {stage.title} ━━━")
+
+        try:
+            with tracer.span("service.job", job_id=job.job_id):
+                stages = build_stages(config, job.idea, job.genre, job.competitors, self.llm_client)
+                StageRunner(config.output_dir / MANIFEST_FILE, announce=announce).run(stages)
+            job.status = "done"
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+            print(f"[{job.job_id}] ⚠️ 실패: {job.error}")
+        finally:
+            job.finished_at = datetime.now().isoformat(timespec="seconds")
+            self._prune_jobs()
+
+    def _prune_jobs(self) -> None:
+        """오래된 완료/실패 작업을 목록에서 제거 (MAX_FINISHED_JOBS 초과분)"""
+        with self._jobs_lock:
+            finished = sorted(
+                (j for j in self.jobs.values() if j.status in ("done", "failed")),
+                key=lambda j: j.finished_at,
+            )
+            for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+                del self.jobs[job.job_id]
+
+    def artifact_path(self, job: Job, name: str) -> Optional[Path]:
+        """작업 산출물 경로 (목록에 있는 파일만)"""
+        if name not in job.to_dict()["artifacts"]:
+            return None
+        return Path(job.output_dir) / name
+
+    def review(self, job: Job, review_id: str) -> Optional[dict]:
+        """작업의 원본 리뷰 1건 (mmap 저장소 O(1) 조회, 인용 근거 확인용)"""
+        raw_path = Path(job.output_dir) / self.config.raw_reviews_file
+        if not raw_path.exists():
+            return None
+        with ReviewStore(ensure_store(raw_path)) as store:
+            return store.get(review_id)
+
+    # ── Steam 프록시 (UI 용) ─────────────────────────────────
+
+    def proxy(self, url: str) -> tuple[int, str, bytes]:
+        """허용된 Steam/SteamSpy URL 을 풀링된 세션 + TTL 캐시로 중계"""
+        host = urlparse(url).hostname or ""
+        if urlparse(url).scheme not in ("http", "https") or host not in PROXY_HOSTS:
+            return 403, "text/plain; charset=utf-8", f"허용되지 않은 호스트: {host}".encode("utf-8")
+
+        now = time.time()
+        with self._proxy_lock:
+            cached = self._proxy_cache.get(url)
+            if cached and cached[0] > now:
+                self._proxy_cache.move_to_end(url)
+                tracer.count("proxy.cache_hits")
+                return cached[1], cached[2], cached[3]
+
+        with tracer.span("service.proxy", host=host):
+            resp = get_session().get(url, timeout=15)
+        tracer.count("http.requests")
+        tracer.count("http.bytes", len(resp.content))
+
+        content_type = resp.headers.get("Content-Type", "application/octet-stream")
+        entry = (now + PROXY_CACHE_TTL, resp.status_code, content_type, resp.content)
+        if resp.ok:
+            with self._proxy_lock:
+                self._proxy_cache[url] = entry
+                while len(self._proxy_cache) > PROXY_CACHE_SIZE:
+                    self._proxy_cache.popitem(last=False)
+        return entry[1], entry[2], entry[3]
+
+
+def local_origins(host: str, port: int) -> set[str]:
+    """서비스 자신의 origin (UI 를 / 에서 연 경우)"""
+    hosts = {host, "127.0.0.1", "localhost"} if host in ("127.0.0.1", "localhost", "0.0.0.0") else {host}
+    return {f"http://{h}:{port}" for h in hosts}
+
+
+def make_handler(service: ValidationService, allowed_origins: set[str]):
+    """서비스에 바인딩된 요청 핸들러 클래스 (allowed_origins 외의 교차 출처 요청 거부)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "VibeValidator/1.0"
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _origin_allowed(self) -> bool:
+            """Origin 헤더가 없거나 (CLI, 같은 출처 GET) 허용 목록에 있는지"""
+            origin = self.headers.get("Origin")
+            return origin is None or origin in allowed_origins
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            origin = self.headers.get("Origin")
+            if origin in allowed_origins:
+                self.send_header("Access-Control-Allow-Origin", origin)
+                self.send_header("Vary", "Origin")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _json(self, status: int, data) -> None:
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self._send(status, body, "application/json; charset=utf-8")
+
+        def _forbidden_origin(self) -> None:
+            self._json(403, {"error": f"허용되지 않은 Origin: {self.headers.get('Origin')}"})
+
+        def do_OPTIONS(self):
+            origin = self.headers.get("Origin")
+            if origin not in allowed_origins:
+                return self._forbidden_origin()
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            self.send_header("Vary", "Origin")
+            self.end_headers()
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            path = parsed.path.rstrip("/")
+
+            if path in ("", "/index.html"):
+                html = UI_PATH.read_text(encoding="utf-8").replace("<head>", f"<head>\n    {UI_BACKEND_META}", 1)
+                return self._send(200, html.encode("utf-8"), CONTENT_TYPES[".html"])
+
+            if path == "/api/health":
+                return self._json(200, {"status": "ok", "jobs": len(service.jobs)})
+
+            if path == "/api/steam":
+                if not self._origin_allowed():
+                    return self._forbidden_origin()
+                url = parse_qs(parsed.query).get("url", [""])[0]
+                try:
+                    status, content_type, body = service.proxy(url)
+                except Exception as e:
+                    return self._json(502, {"error": str(e)})
+                return self._send(status, body, content_type)
+
+            if path == "/api/jobs":
+                return self._json(200, [j.to_dict() for j in service.list_jobs()])
+
+            m = re.fullmatch(r"/api/jobs/([0-9a-f]+)/reviews/([^/]+)", path)
+            if m:
+                job = service.get(m.group(1))
+                review = service.review(job, unquote(m.group(2))) if job else None
+                if review is None:
+                    return self._json(404, {"error": "review not found"})
+                return self._json(200, review)
+
+            m = re.fullmatch(r"/api/jobs/([0-9a-f]+)(?:/artifacts/([^/]+))?", path)
+            if m:
+                job = service.get(m.group(1))
+                if job is None:
+                    return self._json(404, {"error": "job not found"})
+                if not m.group(2):
+                    return self._json(200, job.to_dict())
+                artifact = service.artifact_path(job, m.group(2))
+                if artifact is None:
+                    return self._json(404, {"error": "artifact not found"})
+                content_type = CONTENT_TYPES.get(artifact.suffix, "application/octet-stream")
+                return self._send(200, artifact.read_bytes(), content_type)
+
+            self._json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if urlparse(self.path).path.rstrip("/") != "/api/jobs":
+                return self._json(404, {"error": "not found"})
+            if not self._origin_allowed():
+                return self._forbidden_origin()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                job = service.submit(payload)
+            except (ValueError, KeyError, TypeError) as e:
+                return self._json(400, {"error": str(e)})
+            self._json(202, job.to_dict())
+
+    return Handler
+
+
+def serve(
+    config: Config,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    workers: int = 2,
+    llm_client=None,
+    allow_origins: Optional[list[str]] = None,
+) -> None:
+    """서비스 실행 (Ctrl+C 로 종료)
+
+    allow_origins: 서비스 밖에서 연 UI 의 origin (예: "null" = file://, "http://localhost:5173")
+    """
+    service = ValidationService(config, workers=workers, llm_client=llm_client)
+    service.start()
+
+    httpd = ThreadingHTTPServer((host, port), None)
+    allowed = local_origins(host, httpd.server_address[1]) | {o.rstrip("/") for o in allow_origins or []}
+    httpd.RequestHandlerClass = make_handler(service, allowed)
+    print(f"🛰️ Vibe Validator 서비스: http://{host}:{httpd.server_address[1]} (workers={workers})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n종료 중...")
+    finally:
+        httpd.server_close()
+        service.stop()
@@ -0,0 +1,345 @@
+"""분산 수집 - SQLite 작업 큐 (lease + heartbeat) + appid 별 shard + 병합
+
+    # 코디네이터: 큐 생성 (공유 디렉터리)
+    python main.py shard init --shard-dir /mnt/shared/scan --competitors "A:730,B:578080,..."
+
+    # 워커: 여러 호스트/egress IP 에서 실행
+    python main.py shard worker --shard-dir /mnt/shared/scan
+
+    # 병합: Tagger 가 기대하는 raw_reviews.jsonl 생성 + 공유 코퍼스 게시
+    python main.py shard merge --shard-dir /mnt/shared/scan
+
+워커는 작업을 lease 로 점유하고 heartbeat 로 갱신한다. 워커가 죽으면 lease 가
+만료되어 다른 워커가 다시 가져가며, max_attempts 를 넘기면 failed 로 남는다.
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from .blockstore import corpus_writer
+from .config import Config
+from .pipeline import corpus_key
+from .workspace import corpus_path, publish_to_corpus
+
+QUEUE_FILE = "queue.sqlite"
+SHARDS_DIR = "shards"
+DEFAULT_LEASE_SECONDS = 120
+DEFAULT_MAX_ATTEMPTS = 3
+
+# 코디네이터 설정을 워커에 강제 (호스트마다 config.yaml 이 달라도 같은 코퍼스)
+MINING_FIELDS = ["reviews_per_game", "language", "sentiment_ratio", "recent_months"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    appid TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',  -- queued | leased | done | failed
+    worker TEXT,
+    lease_expires REAL,
+    heartbeat_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    review_count INTEGER,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class WorkItem:
+    appid: str
+    name: str
+    attempts: int
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkQueue:
+    """SQLite 기반 작업 큐 (공유 디렉터리에 위치)"""
+
+    def __init__(self, shard_dir: Path):
+        self.shard_dir = Path(shard_dir)
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        (self.shard_dir / SHARDS_DIR).mkdir(exist_ok=True)
+        self.db_path = self.shard_dir / QUEUE_FILE
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (claim 경쟁 방지)"""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def shard_path(self, appid: str) -> Path:
+        return self.shard_dir / SHARDS_DIR / f"{appid}.jsonl"
+
+    # ── 코디네이터 ───────────────────────────────────────────
+
+    def init(self, competitors: list[dict], mining: dict) -> int:
+        """작업 등록 (이미 있는 appid 는 유지) + 수집 설정 기록"""
+        with self._transaction() as conn:
+            for comp in competitors:
+                conn.execute(
+                    "INSERT OR IGNORE INTO items (appid, name) VALUES (?, ?)",
+                    (str(comp["appid"]), comp["name"]),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('mining', ?)",
+                (json.dumps(mining, ensure_ascii=False),),
+            )
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def mining_settings(self) -> dict:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'mining'").fetchone()
+        return json.loads(row["value"]) if row else {}
+
+    def competitors(self) -> list[dict]:
+        """등록 순서대로 경쟁작 목록"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT appid, name FROM items ORDER BY seq").fetchall()
+        return [{"name": r["name"], "appid": r["appid"]} for r in rows]
+
+    def status(self) -> dict:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM items GROUP BY status").fetchall()
+        counts = {"queued": 0, "leased": 0, "done": 0, "failed": 0}
+        counts.update({r["status"]: r["n"] for r in rows})
+        return counts
+
+    def items(self) -> list[dict]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM items ORDER BY seq").fetchall()
+        return [dict(r) for r in rows]
+
+    def is_finished(self) -> bool:
+        counts = self.status()
+        return counts["queued"] == 0 and counts["leased"] == 0
+
+    def retry_failed(self) -> int:
+        """failed 작업을 다시 큐에 넣기"""
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE items SET status = 'queued', attempts = 0, error = NULL WHERE status = 'failed'"
+            )
+            return cur.rowcount
+
+    # ── 워커 ─────────────────────────────────────────────────
+
+    def claim(self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[WorkItem]:
+        """대기 중이거나 lease 가 만료된 작업 1개 점유"""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                """
+                SELECT appid, name, attempts FROM items
+                WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY attempts, seq LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                """
+                UPDATE items SET status = 'leased', worker = ?, lease_expires = ?,
+                    heartbeat_at = ?, attempts = attempts + 1
+                WHERE appid = ?
+                """,
+                (worker_id, now + lease_seconds, now, row["appid"]),
+            )
+            return WorkItem(appid=row["appid"], name=row["name"], attempts=row["attempts"] + 1)
+
+    def heartbeat(self, appid: str, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """lease 연장 (다른 워커에게 넘어갔으면 False)"""
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                """
+                UPDATE items SET lease_expires = ?, heartbeat_at = ?
+                WHERE appid = ? AND worker = ? AND status = 'leased'
+                """,
+                (now + lease_seconds, now, appid, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, appid: str, worker_id: str, review_count: int) -> bool:
+        with self._transaction() as conn:
+            cur = conn.execute(
+                """
+                UPDATE items SET status = 'done', review_count = ?, lease_expires = NULL, error = NULL
+                WHERE appid = ? AND worker = ? AND status = 'leased'
+                """,
+                (review_count, appid, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def fail(self, appid: str, worker_id: str, error: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> None:
+        """실패 기록 (재시도 여유가 있으면 다시 queued)"""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                UPDATE items SET
+                    status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,
+                    lease_expires = NULL, error = ?
+                WHERE appid = ? AND worker = ? AND status = 'leased'
+                """,
+                (max_attempts, error, appid, worker_id),
+            )
+
+
+class _Heartbeat:
+    """작업 처리 중 lease 를 주기적으로 연장하는 백그라운드 스레드"""
+
+    def __init__(self, queue: WorkQueue, appid: str, worker_id: str, lease_seconds: float):
+        self.queue = queue
+        self.appid = appid
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        interval = max(self.lease_seconds / 3, 0.5)
+        while not self._stop.wait(interval):
+            if not self.queue.heartbeat(self.appid, self.worker_id, self.lease_seconds):
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+
+def init_queue(config: Config, shard_dir: Path, competitors: list[dict]) -> WorkQueue:
+    """코디네이터: 큐 생성"""
+    queue = WorkQueue(shard_dir)
+    mining = {name: getattr(config, name) for name in MINING_FIELDS}
+    total = queue.init(competitors, mining)
+    print(f"🗂️ 작업 큐: {queue.db_path} ({total}개 appid)")
+    return queue
+
+
+def run_worker(
+    config: Config,
+    shard_dir: Path,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    poll_interval: float = 2.0,
+) -> int:
+    """워커: 큐가 빌 때까지 작업 점유 → 수집 → shard 기록. 처리한 작업 수 반환"""
+    from .agents import ReviewMiner
+
+    queue = WorkQueue(shard_dir)
+    worker_id = worker_id or default_worker_id()
+    config = replace(config, **queue.mining_settings())
+    miner = ReviewMiner(config)
+
+    processed = 0
+    while True:
+        item = queue.claim(worker_id, lease_seconds)
+        if item is None:
+            if queue.is_finished():
+                break
+            time.sleep(poll_interval)  # 다른 워커의 lease 만료 대기
+            continue
+
+        print(f"[{worker_id}] ▶ {item.name} ({item.appid}) 시도 {item.attempts}")
+        try:
+            with _Heartbeat(queue, item.appid, worker_id, lease_seconds):
+                count = miner.collect_one(
+                    {"name": item.name, "appid": item.appid},
+                    queue.shard_path(item.appid),
+                )
+            if not queue.complete(item.appid, worker_id, count):
+                print(f"[{worker_id}] ⚠️ lease 상실: {item.appid} (다른 워커 결과 사용)")
+            processed += 1
+        except Exception as e:
+            queue.fail(item.appid, worker_id, f"{type(e).__name__}: {e}", max_attempts)
+            print(f"[{worker_id}] ⚠️ 실패: {item.appid} - {e}")
+
+    print(f"[{worker_id}] 종료: {processed}개 처리")
+    return processed
+
+
+def merge_shards(config: Config, shard_dir: Path, output_path: Optional[Path] = None) -> Path:
+    """shard 병합 → raw_reviews.jsonl (큐 등록 순서) + 공유 코퍼스 게시"""
+    queue = WorkQueue(shard_dir)
+    pending = [i for i in queue.items() if i["status"] != "done"]
+    if pending:
+        listing = ", ".join(f"{i['appid']}({i['status']})" for i in pending[:10])
+        raise RuntimeError(f"완료되지 않은 작업 {len(pending)}개: {listing}")
+
+    config = replace(config, **queue.mining_settings())
+    competitors = queue.competitors()
+    output_path = output_path or config.output_dir / config.raw_reviews_file
+
+    total = 0
+    with corpus_writer(output_path, config.storage_codec, config.storage_block_records) as out:
+        for comp in competitors:
+            with open(queue.shard_path(comp["appid"]), "rb") as f:
+                for line in f:
+                    out.write(line.decode("utf-8"))
+                    total += 1
+
+    # 같은 경쟁작/설정의 run_pipeline 은 재수집 없이 이 코퍼스를 링크 (빈 결과는 게시하지 않음)
+    if total:
+        publish_to_corpus(
+            output_path,
+            corpus_path(config, corpus_key(config, competitors), config.raw_reviews_file),
+        )
+    print(f"💾 병합: {output_path} ({len(competitors)}개 게임, {total}개 리뷰)")
+    return output_path
+
+
+def run_local(config: Config, shard_dir: Path, competitors: list[dict], workers: int = 4) -> Path:
+    """한 머신에서 워커 N개 프로세스로 수집 후 병합 (로컬 검증/단일 호스트용)"""
+    import multiprocessing
+
+    init_queue(config, shard_dir, competitors)
+    procs = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(config, shard_dir),
+            kwargs={"worker_id": f"{default_worker_id()}-w{i}"},
+        )
+        for i in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    return merge_shards(config, shard_dir)
@@ -0,0 +1,205 @@
+"""Single-flight - 동일한 작업이 동시에 들어오면 한 번만 실행하고 결과 공유
+
+작업 결과는 선행 실행자가 lock 디렉터리에 쓴 파일(artifact)이고, do() 는 그 경로를
+반환한다. 같은 프로세스 안에서는 스레드 간에 경로를 공유하고, 프로세스 간에는
+작업 지문별 lock 파일로 직렬화한 뒤 선행 실행자가 남긴 파일을 그대로 읽는다.
+결과 파일은 "대기를 시작한 이후에 쓰인 것"만 공유하므로 캐시가 아니라
+진행 중인 작업의 중복 제거로만 동작하며, RESULT_TTL_S 가 지난 lock/결과 파일은
+다음 실행 때 정리한다.
+
+    flight = get_singleflight(config.output_dir / ".singleflight")
+    path = flight.do(("mine", base_url, appid, "positive", "korean", 50, 6), write_rows)  # write_rows(f)
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Callable, IO, Optional
+
+from .tracing import tracer
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+RESULT_TTL_S = 600  # 대기자가 결과를 읽고 난 뒤 lock/결과 파일 보존 시간
+SWEEP_INTERVAL_S = 60
+
+
+def work_key(*parts) -> str:
+    """작업 지문 (JSON 직렬화 가능한 값들의 해시)"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _lock_fd(f, blocking: bool = True) -> bool:
+    """파일 배타 잠금 (blocking=False 면 즉시 실패)"""
+    if sys.platform == "win32":
+        while True:
+            try:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.05)
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        return True
+    except BlockingIOError:
+        return False
+
+
+def _unlock_fd(f) -> None:
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _same_file(f, path: Path) -> bool:
+    """잡은 lock 이 아직 path 의 파일인지 (정리로 삭제/교체되지 않았는지)"""
+    try:
+        return os.fstat(f.fileno()).st_ino == os.stat(path).st_ino
+    except OSError:
+        return False
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """프로세스 간 배타 잠금 (블로킹)"""
+    while True:
+        f = open(path, "a+b")
+        _lock_fd(f)
+        if _same_file(f, path):
+            break
+        # 기다리는 동안 정리되어 삭제된 lock 파일 - 새 파일로 다시 시도
+        _unlock_fd(f)
+        f.close()
+    try:
+        yield
+    finally:
+        _unlock_fd(f)
+        f.close()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Path] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """작업 지문 단위 중복 실행 제거"""
+
+    def __init__(self, lock_dir: Path):
+        self.lock_dir = Path(lock_dir)
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+
+    def do(self, key, write: Callable[[IO[str]], None]) -> Path:
+        """key 가 같은 진행 중 작업이 있으면 그 결과 파일을, 없으면 write(f) 로 쓴 파일 경로를 반환
+
+        write 는 텍스트 파일에 결과를 기록한다 (예: JSONL). 반환된 파일은 읽기 전용으로
+        다루고 바로 읽어야 한다 (RESULT_TTL_S 이후 정리됨).
+        """
+        digest = key if isinstance(key, str) else work_key(*key)
+
+        with self._lock:
+            call = self._calls.get(digest)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[digest] = call
+
+        if not leader:
+            call.done.wait()
+            tracer.count("singleflight.shared")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._do_shared(digest, write)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[digest]
+            call.done.set()
+
+    def _do_shared(self, digest: str, write: Callable[[IO[str]], None]) -> Path:
+        """다른 프로세스와 lock 파일로 조율"""
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self._sweep()
+        lock_path = self.lock_dir / f"{digest}.lock"
+        result_path = self.lock_dir / f"{digest}.out"
+        waiting_since = time.time()
+
+        with _file_lock(lock_path):
+            # 기다리는 동안 다른 프로세스가 같은 작업을 끝냈으면 그 결과 파일 공유
+            try:
+                if result_path.stat().st_mtime >= waiting_since:
+                    tracer.count("singleflight.shared")
+                    return result_path
+            except OSError:
+                pass
+
+            tracer.count("singleflight.executed")
+            tmp_path = result_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    write(f)
+                tmp_path.replace(result_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            return result_path
+
+    def _sweep(self) -> None:
+        """RESULT_TTL_S 가 지난 lock/결과/임시 파일 정리 (프로세스당 SWEEP_INTERVAL_S 마다)"""
+        now = time.time()
+        if now - self._last_sweep < SWEEP_INTERVAL_S:
+            return
+        self._last_sweep = now
+        for path in self.lock_dir.iterdir():
+            try:
+                if now - path.stat().st_mtime < RESULT_TTL_S:
+                    continue
+                if path.suffix != ".lock":
+                    path.unlink()
+                    continue
+                # 진행 중인 작업의 lock 은 잡히지 않으므로 건너뜀
+                with open(path, "a+b") as f:
+                    if _lock_fd(f, blocking=False):
+                        try:
+                            if _same_file(f, path):
+                                path.unlink()
+                        finally:
+                            _unlock_fd(f)
+            except OSError:
+                continue
+
+
+_groups: dict[Path, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_singleflight(lock_dir: Path) -> SingleFlight:
+    """lock 디렉터리별 프로세스 공유 SingleFlight"""
+    key = Path(lock_dir).resolve()
+    with _groups_lock:
+        if key not in _groups:
+            _groups[key] = SingleFlight(key)
+        return _groups[key]
@@ -0,0 +1 @@
+# 로컬 스텁 서버 (Steam/LLM 대역) - 네트워크 없이 분산 수집/벤치마크 검증용
@@ -0,0 +1,147 @@
+"""Steam appreviews 스텁 서버 - 커서 페이징 + 결정적 합성 리뷰
+
+    python -m src.stubs.steam_server --port 8801 --latency 0.05 --fail-rate 0.05
+
+config.yaml 의 steam.base_url 을 "http://127.0.0.1:8801/appreviews/{appid}" 로
+지정하면 ReviewMiner 가 실제 Steam 대신 이 서버를 호출한다. jitter 로 지연 분산을,
+fail_rate 로 429 (Retry-After 포함) 응답을 흉내 낼 수 있다 (seed 로 재현 가능).
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+REVIEWS_PER_TYPE = 2000  # appid/긍부정별 최대 리뷰 수
+
+_WORDS = {
+    "korean": ["타격감", "매칭", "렉", "버그", "과금", "밸런스", "재밌다", "친구랑", "조작", "이동", "공정", "깊이", "ㅋㅋ", "ㅠㅠ"],
+    "english": ["lag", "matchmaking", "gunplay", "fair", "depth", "p2w", "balance", "movement", "fun", "friends", "controls", "shooting"],
+}
+
+
+def synth_review(appid: str, review_type: str, index: int, language: str) -> dict:
+    """(appid, 긍부정, index) 로 결정되는 합성 리뷰"""
+    rnd = random.Random(f"{appid}:{review_type}:{index}")
+    lang = language if language in _WORDS else rnd.choice(list(_WORDS))
+    length = max(3, int(rnd.lognormvariate(2.5, 0.8)))
+    return {
+        "recommendationid": f"{appid}{'1' if review_type == 'positive' else '0'}{index:07d}",
+        "language": lang,
+        "voted_up": review_type == "positive",
+        "review": " ".join(rnd.choices(_WORDS[lang], k=length)),
+        "author": {"playtime_forever": int(rnd.lognormvariate(6.5, 1.5))},
+        "timestamp_created": int(time.time()) - rnd.randint(0, 60 * 86400),
+    }
+
+
+def make_handler(
+    latency: float = 0.0,
+    per_type: int = REVIEWS_PER_TYPE,
+    jitter: float = 0.0,
+    fail_rate: float = 0.0,
+    retry_after: float = 1,
+    seed: int = 0,
+):
+    rnd = random.Random(seed)
+    lock = threading.Lock()
+    stats = {"requests": 0, "throttled": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        counters = stats  # 요청/429 횟수 (벤치마크 집계용)
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            parts = parsed.path.strip("/").split("/")
+            if len(parts) != 2 or parts[0] != "appreviews":
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            with lock:
+                stats["requests"] += 1
+                throttled = rnd.random() < fail_rate
+                spread = rnd.lognormvariate(0, jitter) if jitter else 1.0
+                if throttled:
+                    stats["throttled"] += 1
+            if latency:
+                time.sleep(latency * spread)
+            if throttled:
+                self.send_response(429)
+                self.send_header("Retry-After", f"{retry_after:g}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            q = parse_qs(parsed.query)
+            appid = parts[1]
+            review_type = q.get("review_type", ["all"])[0]
+            language = q.get("language", ["all"])[0]
+            num = min(100, int(q.get("num_per_page", ["20"])[0]))
+            cursor = q.get("cursor", ["*"])[0]
+            offset = 0 if cursor == "*" else int(cursor.lstrip("o") or 0)
+
+            end = min(offset + num, per_type)
+            reviews = [synth_review(appid, review_type, i, language) for i in range(offset, end)]
+            body = json.dumps({
+                "success": 1,
+                "query_summary": {"num_reviews": len(reviews)},
+                "reviews": reviews,
+                "cursor": f"o{end}",
+            }, ensure_ascii=False).encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, **options) -> ThreadingHTTPServer:
+    """백그라운드 스레드로 시작 (port=0 이면 임의 포트)"""
+    server = ThreadingHTTPServer((host, port), make_handler(**options))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    """ReviewMiner 용 steam_base_url"""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/appreviews/{{appid}}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam appreviews 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8801)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연 (초)")
+    parser.add_argument("--per-type", type=int, default=REVIEWS_PER_TYPE, help="appid/긍부정별 리뷰 수")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 분산 (로그정규 sigma)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--retry-after", type=float, default=1, help="429 의 Retry-After (초, 로컬 테스트용 소수 허용)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        (args.host, args.port),
+        make_handler(
+            latency=args.latency, per_type=args.per_type, jitter=args.jitter,
+            fail_rate=args.fail_rate, retry_after=args.retry_after, seed=args.seed,
+        ),
+    )
+    print(f"🧪 Steam 스텁: {base_url(server)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
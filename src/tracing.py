@@ -0,0 +1,235 @@
+"""구조화 트레이싱 - 스테이지별 스팬/카운터 + Chrome trace 내보내기
+
+    from src.tracing import tracer, traced
+
+    @traced("miner.collect")
+    def collect(...): ...
+
+    with tracer.span("steam.request", appid=appid):
+        ...
+    tracer.count("http.requests")
+
+`tracer.export_chrome(path)` 결과는 chrome://tracing 또는 Perfetto 에서 열 수 있다.
+
+트레이서는 기본적으로 꺼져 있고 --trace/--profile (또는 벤치마크) 에서만 켠다.
+켜져 있어도 스팬/카운터 이벤트는 최근 MAX_EVENTS 개만 보관한다 (장시간 실행되는
+서비스에서 메모리가 늘지 않도록).
+"""
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from typing import Optional
+
+MAX_EVENTS = 100_000  # 스팬/카운터 이벤트 링 버퍼 크기
+
+
+@dataclass
+class SpanRecord:
+    name: str
+    start_us: float
+    duration_us: float
+    thread_id: int
+    args: dict = field(default_factory=dict)
+
+
+class Tracer:
+    """스팬/카운터 수집기 (스레드 안전)"""
+
+    def __init__(self, max_events: int = MAX_EVENTS):
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self.spans: deque[SpanRecord] = deque(maxlen=max_events)
+        self.counters: dict[str, float] = defaultdict(float)
+        self._counter_events: deque[tuple[float, str, float]] = deque(maxlen=max_events)
+        self.enabled = False
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def reset(self) -> None:
+        with self._lock:
+            self._origin = time.perf_counter()
+            self.spans.clear()
+            self.counters.clear()
+            self._counter_events.clear()
+
+    def record(self, name: str, start_us: float, duration_us: float, **args) -> None:
+        """측정이 끝난 구간 기록"""
+        record = SpanRecord(
+            name=name,
+            start_us=start_us,
+            duration_us=duration_us,
+            thread_id=threading.get_ident(),
+            args=args,
+        )
+        with self._lock:
+            self.spans.append(record)
+
+    @contextmanager
+    def span(self, name: str, **args):
+        """구간 측정"""
+        if not self.enabled:
+            yield
+            return
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            self.record(name, start, self._now_us() - start, **args)
+
+    def count(self, name: str, value: float = 1) -> None:
+        """카운터 증가 (HTTP 요청, 바이트, 토큰, 재시도 등)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] += value
+            self._counter_events.append((self._now_us(), name, self.counters[name]))
+
+    def summary(self) -> list[dict]:
+        """스팬 이름별 집계 (총 시간 내림차순)"""
+        grouped: dict[str, list[float]] = defaultdict(list)
+        with self._lock:
+            for s in self.spans:
+                grouped[s.name].append(s.duration_us)
+
+        rows = []
+        for name, durations in grouped.items():
+            total = sum(durations)
+            rows.append({
+                "name": name,
+                "count": len(durations),
+                "total_ms": round(total / 1000, 2),
+                "mean_ms": round(total / len(durations) / 1000, 2),
+                "max_ms": round(max(durations) / 1000, 2),
+            })
+        return sorted(rows, key=lambda r: -r["total_ms"])
+
+    def export_chrome(self, path: Path) -> Path:
+        """Chrome trace-event JSON 저장"""
+        pid = os.getpid()
+        events = []
+        with self._lock:
+            for s in self.spans:
+                events.append({
+                    "name": s.name,
+                    "cat": s.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round(s.start_us, 3),
+                    "dur": round(s.duration_us, 3),
+                    "pid": pid,
+                    "tid": s.thread_id,
+                    "args": {k: str(v) for k, v in s.args.items()},
+                })
+            for ts, name, value in self._counter_events:
+                events.append({
+                    "name": name,
+                    "ph": "C",
+                    "ts": round(ts, 3),
+                    "pid": pid,
+                    "args": {"value": value},
+                })
+            counters = dict(self.counters)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+                "otherData": {"counters": counters},
+            }, f, ensure_ascii=False)
+        return path
+
+
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None):
+    """함수/메서드를 스팬으로 감싸는 데코레이터 (제너레이터 지원)"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return (yield from func(*args, **kwargs))
+                # 소비자가 값을 처리하는 시간은 빼고 next() 안에서 보낸 시간만 합산
+                gen = func(*args, **kwargs)
+                start, busy, steps, sent = None, 0.0, 0, None
+                try:
+                    while True:
+                        resumed = tracer._now_us()
+                        start = resumed if start is None else start
+                        try:
+                            item = gen.send(sent)
+                        except StopIteration as stop:
+                            return stop.value
+                        finally:
+                            busy += tracer._now_us() - resumed
+                            steps += 1
+                        sent = yield item
+                finally:
+                    gen.close()
+                    if start is not None:
+                        tracer.record(span_name, start, busy, steps=steps)
+            return gen_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 대략 추정 (usage 정보가 없을 때)"""
+    return max(1, len(text) // 3)
+
+
+@contextmanager
+def profile_run(output_dir: Path):
+    """cProfile + tracemalloc 로 실행 구간 프로파일링
+
+    output_dir 에 profile.pstats (snakeviz 등으로 열람) 와 profile.txt 를 남긴다.
+    """
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        profiler.dump_stats(output_dir / "profile.pstats")
+
+        buf = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buf)
+        stats.sort_stats("cumulative").print_stats(30)
+        buf.write(f"\n# tracemalloc: current={current / 1e6:.1f}MB peak={peak / 1e6:.1f}MB\n")
+        for stat in snapshot.statistics("lineno")[:15]:
+            buf.write(f"{stat}\n")
+
+        with open(output_dir / "profile.txt", "w", encoding="utf-8") as f:
+            f.write(buf.getvalue())
+        print(f"📊 프로파일: {output_dir / 'profile.pstats'} (peak {peak / 1e6:.1f}MB)")
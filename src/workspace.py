@@ -0,0 +1,94 @@
+"""실행 단위 작업공간 - run ID 별 출력 디렉터리 + 공유 코퍼스 + 원자적 쓰기
+
+    output/
+    ├── runs/<run_id>/      # 실행별 산출물 (raw/tagged/personas/report, manifest)
+    ├── corpus/<key>/       # 수집 결과 공유 영역 (읽기 전용, 실행 디렉터리에서 링크)
+    └── .singleflight/      # 실행 간 중복 작업 조율
+
+같은 output 디렉터리를 쓰는 여러 실행이 서로의 산출물을 덮어쓰지 않도록
+실행마다 run ID 디렉터리를 만들고, 모든 산출물은 임시 파일에 쓴 뒤 rename 한다.
+"""
+import os
+import shutil
+import stat
+import uuid
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime
+
+from .config import Config
+
+RUNS_DIR = "runs"
+CORPUS_DIR = "corpus"
+
+
+def new_run_id() -> str:
+    """시간순 정렬 가능한 run ID"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def scoped_config(config: Config, run_id: str) -> Config:
+    """run ID 전용 출력 디렉터리를 쓰는 Config 복사본"""
+    shared = config.shared_root()
+    return replace(
+        config,
+        output_dir=shared / RUNS_DIR / run_id,
+        run_id=run_id,
+        shared_dir=shared,
+    )
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "w", encoding: str = "utf-8"):
+    """임시 파일에 쓴 뒤 rename (중간 상태 파일이 보이지 않음)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:6]}.tmp")
+    kwargs = {} if "b" in mode else {"encoding": encoding}
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """하드링크 → 심볼릭 링크 → 복사 순으로 시도 (dst 는 원자적으로 교체)"""
+    src, dst = Path(src), Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_name(f".{dst.name}.{os.getpid()}.{uuid.uuid4().hex[:6]}.link")
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        try:
+            os.symlink(src.resolve(), tmp_path)
+        except OSError:
+            shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def corpus_path(config: Config, key: str, filename: str) -> Path:
+    """공유 코퍼스 파일 경로"""
+    return config.shared_root() / CORPUS_DIR / key / filename
+
+
+def publish_to_corpus(path: Path, corpus_file: Path) -> None:
+    """실행 산출물을 공유 코퍼스로 게시 (읽기 전용 복사본)
+
+    하드링크하면 같은 inode 를 chmod 하게 되어 실행 디렉터리의 파일까지 읽기 전용이
+    되므로, 코퍼스 쪽 임시 파일에 복사하고 권한을 바꾼 뒤 rename 한다.
+    """
+    corpus_file = Path(corpus_file)
+    corpus_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = corpus_file.with_name(f".{corpus_file.name}.{os.getpid()}.{uuid.uuid4().hex[:6]}.tmp")
+    try:
+        shutil.copyfile(path, tmp_path)
+        mode = tmp_path.stat().st_mode
+        tmp_path.chmod(mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+        os.replace(tmp_path, corpus_file)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()